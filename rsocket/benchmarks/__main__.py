@@ -0,0 +1,121 @@
+"""
+Benchmarks all interaction models over the bundled transports on localhost.
+
+Example::
+
+    python -m rsocket.benchmarks --transports tcp buffered_tcp --payload-sizes 64 16384 --output results.json
+    python -m rsocket.benchmarks --compare results.json --max-regression 0.1
+
+Results are written as JSON. With --compare, the exit code is 1 if any scenario's throughput dropped by more than
+--max-regression compared to the given results file.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import sys
+from typing import List, Optional
+
+from rsocket.benchmarks.results import results_document, load_results, find_regressions
+from rsocket.benchmarks.scenarios import Scenario, run_scenario, interactions, fragmentable_interactions
+from rsocket.benchmarks.transports import pipe_factory_by_transport
+
+
+def parse_arguments(arguments: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m rsocket.benchmarks',
+                                     description='RSocket throughput, latency and memory benchmarks')
+    parser.add_argument('--transports', nargs='+', default=list(pipe_factory_by_transport),
+                        choices=list(pipe_factory_by_transport))
+    parser.add_argument('--interactions', nargs='+', default=list(interactions), choices=list(interactions))
+    parser.add_argument('--payload-sizes', nargs='+', type=int, default=[64, 1024, 65536])
+    parser.add_argument('--fragment-sizes', nargs='+', type=int, default=[0],
+                        help='0 disables fragmentation. Applies to request_stream and request_channel')
+    parser.add_argument('--concurrency', nargs='+', type=int, default=[1, 16])
+    parser.add_argument('--operations', type=int, default=1000)
+    parser.add_argument('--stream-length', type=int, default=100)
+    parser.add_argument('--warmup-operations', type=int, default=10)
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='Report the peak traced python memory (slows down the benchmark)')
+    parser.add_argument('--output', help='Results file (default: stdout)')
+    parser.add_argument('--compare', help='Baseline results file to check for throughput regressions')
+    parser.add_argument('--max-regression', type=float, default=0.1)
+    return parser.parse_args(arguments)
+
+
+def build_scenarios(options: argparse.Namespace) -> List[Scenario]:
+    scenarios = []
+
+    for transport, interaction, payload_size, concurrency in itertools.product(options.transports,
+                                                                              options.interactions,
+                                                                              options.payload_sizes,
+                                                                              options.concurrency):
+        if interaction in fragmentable_interactions:
+            fragment_sizes = sorted(set(options.fragment_sizes))
+        else:
+            fragment_sizes = [0]
+
+        for fragment_size in fragment_sizes:
+            scenarios.append(Scenario(transport=transport,
+                                      interaction=interaction,
+                                      payload_size=payload_size,
+                                      fragment_size=fragment_size or None,
+                                      concurrency=concurrency,
+                                      operations=options.operations,
+                                      stream_length=options.stream_length,
+                                      warmup_operations=options.warmup_operations))
+
+    return scenarios
+
+
+async def run_benchmarks(options: argparse.Namespace):
+    results = []
+    unavailable_transports = set()
+
+    for scenario in build_scenarios(options):
+        if scenario.transport in unavailable_transports:
+            continue
+
+        try:
+            result = await run_scenario(scenario, options.trace_memory)
+        except ImportError as exception:
+            print('Skipping transport {}: {}'.format(scenario.transport, exception), file=sys.stderr)
+            unavailable_transports.add(scenario.transport)
+            continue
+
+        print('{transport} {interaction} payload={payload_size} fragment={fragment_size} '
+              'concurrency={concurrency}: {messages_per_second:.0f} msg/s, {megabytes_per_second:.2f} MB/s, '
+              'p50={latency_p50_ms:.3f}ms p99={latency_p99_ms:.3f}ms'.format(**result.to_dict()),
+              file=sys.stderr)
+        results.append(result)
+
+    return results_document(results)
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    options = parse_arguments(arguments)
+    logging.basicConfig(level=logging.WARNING)
+
+    document = asyncio.run(run_benchmarks(options))
+
+    if options.output is None:
+        json.dump(document, sys.stdout, indent=2)
+        print()
+    else:
+        with open(options.output, 'w') as fd:
+            json.dump(document, fd, indent=2)
+
+    if options.compare is not None:
+        regressions = find_regressions(load_results(options.compare), document, options.max_regression)
+
+        for regression in regressions:
+            print('Regression: {}'.format(json.dumps(regression)), file=sys.stderr)
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+Microbenchmarks of parsing and serializing every frame type.
+
+Example::
+
+    python -m rsocket.benchmarks.codec --payload-sizes 0 1024 --output codec.json
+    python -m rsocket.benchmarks.codec --compare codec.json
+"""
+import argparse
+import json
+import sys
+import timeit
+from dataclasses import dataclass, asdict
+from datetime import timedelta
+from typing import List, Dict, Any, Optional, Callable
+
+from rsocket.benchmarks.results import results_document, load_results, find_regressions
+from rsocket.error_codes import ErrorCode
+from rsocket.frame import (Frame, SetupFrame, LeaseFrame, KeepAliveFrame, RequestResponseFrame,
+                           RequestFireAndForgetFrame, RequestStreamFrame, RequestChannelFrame, RequestNFrame,
+                           CancelFrame, PayloadFrame, ErrorFrame, MetadataPushFrame, ResumeFrame, ResumeOKFrame,
+                           parse_or_ignore)
+from rsocket.frame_builders import (to_setup_frame, to_keepalive_frame, to_request_response_frame,
+                                    to_fire_and_forget_frame, to_request_stream_frame, to_request_channel_frame,
+                                    to_request_n_frame, to_cancel_frame, to_payload_frame, to_metadata_push_frame)
+from rsocket.payload import Payload
+
+__all__ = ['CodecResult', 'frame_samples', 'run_codec_benchmarks']
+
+_codec_scenario_keys = ('frame_type', 'operation', 'payload_size')
+
+
+@dataclass
+class CodecResult:
+    frame_type: str
+    operation: str
+    payload_size: int
+    frame_size: int
+    operations_per_second: float
+    nanoseconds_per_operation: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _lease_frame() -> LeaseFrame:
+    frame = LeaseFrame()
+    frame.time_to_live = 1000
+    frame.number_of_requests = 100
+    return frame
+
+
+def _error_frame(data: bytes) -> ErrorFrame:
+    frame = ErrorFrame()
+    frame.stream_id = 1
+    frame.error_code = ErrorCode.APPLICATION_ERROR
+    frame.data = data
+    return frame
+
+
+def _resume_frame() -> ResumeFrame:
+    frame = ResumeFrame()
+    frame.resume_identification_token = b'resume-token'
+    frame.token_length = len(frame.resume_identification_token)
+    frame.last_server_position = 1000
+    frame.first_client_position = 100
+    return frame
+
+
+def _resume_ok_frame() -> ResumeOKFrame:
+    frame = ResumeOKFrame()
+    frame.last_received_client_position = 1000
+    return frame
+
+
+def frame_samples(payload_size: int) -> Dict[str, Frame]:
+    """One frame of each type, carrying data (and metadata where supported) of payload_size bytes."""
+
+    data = b'd' * payload_size
+    metadata = b'm' * payload_size
+    payload = Payload(data, metadata)
+
+    return {
+        SetupFrame.__name__: to_setup_frame(payload, b'application/json', b'application/json',
+                                            timedelta(seconds=1), timedelta(minutes=1)),
+        LeaseFrame.__name__: _lease_frame(),
+        KeepAliveFrame.__name__: to_keepalive_frame(data),
+        RequestResponseFrame.__name__: to_request_response_frame(1, payload),
+        RequestFireAndForgetFrame.__name__: to_fire_and_forget_frame(1, payload),
+        RequestStreamFrame.__name__: to_request_stream_frame(1, payload, 100),
+        RequestChannelFrame.__name__: to_request_channel_frame(1, payload, 100),
+        RequestNFrame.__name__: to_request_n_frame(1, 100),
+        CancelFrame.__name__: to_cancel_frame(1),
+        PayloadFrame.__name__: to_payload_frame(1, payload),
+        ErrorFrame.__name__: _error_frame(data),
+        MetadataPushFrame.__name__: to_metadata_push_frame(metadata),
+        ResumeFrame.__name__: _resume_frame(),
+        ResumeOKFrame.__name__: _resume_ok_frame()
+    }
+
+
+def _measure(operation: Callable[[], Any], minimum_seconds: float) -> float:
+    """Returns the average duration of operation in seconds."""
+
+    timer = timeit.Timer(operation)
+    number, duration = timer.autorange()
+
+    while duration < minimum_seconds:
+        number *= 2
+        duration = timer.timeit(number)
+
+    return duration / number
+
+
+def run_codec_benchmarks(payload_sizes: List[int],
+                         frame_types: Optional[List[str]] = None,
+                         minimum_seconds: float = 0.2) -> List[CodecResult]:
+    results = []
+
+    for payload_size in payload_sizes:
+        for frame_type, frame in frame_samples(payload_size).items():
+            if frame_types is not None and frame_type not in frame_types:
+                continue
+
+            serialized = frame.serialize()
+
+            for operation_name, operation in (('serialize', frame.serialize),
+                                              ('parse', lambda: parse_or_ignore(serialized))):
+                duration = _measure(operation, minimum_seconds)
+                results.append(CodecResult(frame_type=frame_type,
+                                           operation=operation_name,
+                                           payload_size=payload_size,
+                                           frame_size=len(serialized),
+                                           operations_per_second=1 / duration,
+                                           nanoseconds_per_operation=duration * 1e9))
+
+    return results
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m rsocket.benchmarks.codec',
+                                     description='RSocket frame parse and serialize microbenchmarks')
+    parser.add_argument('--payload-sizes', nargs='+', type=int, default=[0, 128, 16384])
+    parser.add_argument('--frame-types', nargs='+', help='Frame class names (default: all)')
+    parser.add_argument('--minimum-seconds', type=float, default=0.2,
+                        help='Minimum measured time per frame type and operation')
+    parser.add_argument('--output', help='Results file (default: stdout)')
+    parser.add_argument('--compare', help='Baseline results file to check for regressions')
+    parser.add_argument('--max-regression', type=float, default=0.1)
+    options = parser.parse_args(arguments)
+
+    results = run_codec_benchmarks(options.payload_sizes, options.frame_types, options.minimum_seconds)
+
+    for result in results:
+        print('{frame_type} {operation} payload={payload_size}: {nanoseconds_per_operation:.0f} ns'.format(
+            **result.to_dict()), file=sys.stderr)
+
+    document = results_document(results)
+
+    if options.output is None:
+        json.dump(document, sys.stdout, indent=2)
+        print()
+    else:
+        with open(options.output, 'w') as fd:
+            json.dump(document, fd, indent=2)
+
+    if options.compare is not None:
+        regressions = find_regressions(load_results(options.compare), document, options.max_regression,
+                                       _codec_scenario_keys, 'operations_per_second')
+
+        for regression in regressions:
+            print('Regression: {}'.format(json.dumps(regression)), file=sys.stderr)
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+import json
+import platform
+import sys
+from datetime import datetime
+from typing import List, Dict, Any, Tuple, Optional, Sequence
+
+__all__ = ['results_document', 'load_results', 'find_regressions']
+
+_scenario_keys = ('transport', 'interaction', 'payload_size', 'fragment_size', 'concurrency')
+
+
+def _rsocket_version() -> Optional[str]:
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        return None
+
+    try:
+        return version('rsocket')
+    except PackageNotFoundError:
+        return None
+
+
+def results_document(results: List[Any]) -> Dict[str, Any]:
+    return {
+        'rsocket_version': _rsocket_version(),
+        'python_version': sys.version.split()[0],
+        'platform': platform.platform(),
+        'timestamp': datetime.utcnow().isoformat(),
+        'results': [result.to_dict() for result in results]
+    }
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path) as fd:
+        return json.load(fd)
+
+
+def _scenario_key(result: Dict[str, Any], scenario_keys: Sequence[str]) -> Tuple:
+    return tuple(result[key] for key in scenario_keys)
+
+
+def find_regressions(baseline: Dict[str, Any],
+                     current: Dict[str, Any],
+                     max_regression: float,
+                     scenario_keys: Sequence[str] = _scenario_keys,
+                     metric: str = 'messages_per_second') -> List[Dict[str, Any]]:
+    """
+    Compare the throughput (metric) of scenarios present in both documents. A scenario regressed if its throughput
+    dropped by more than max_regression (a fraction) relative to the baseline.
+    """
+
+    baseline_by_scenario = {_scenario_key(result, scenario_keys): result for result in baseline['results']}
+    regressions = []
+
+    for result in current['results']:
+        baseline_result = baseline_by_scenario.get(_scenario_key(result, scenario_keys))
+
+        if baseline_result is None or baseline_result[metric] == 0:
+            continue
+
+        change = result[metric] / baseline_result[metric] - 1
+
+        if change < -max_regression:
+            regression = {key: result[key] for key in scenario_keys}
+            regression['baseline_' + metric] = baseline_result[metric]
+            regression[metric] = result[metric]
+            regression['change'] = change
+            regressions.append(regression)
+
+    return regressions
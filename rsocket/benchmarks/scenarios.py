@@ -0,0 +1,241 @@
+import asyncio
+import functools
+import math
+import sys
+import tracemalloc
+from dataclasses import dataclass, asdict
+from time import perf_counter
+from typing import Optional, List, Callable, Tuple, Dict, Any
+
+from reactivestreams.publisher import Publisher
+from reactivestreams.subscriber import DefaultSubscriber, Subscriber
+from reactivestreams.subscription import Subscription
+from rsocket.benchmarks.transports import pipe_factory_by_transport, unused_port
+from rsocket.frame import MAX_REQUEST_N
+from rsocket.helpers import create_future
+from rsocket.local_typing import Awaitable
+from rsocket.payload import Payload
+from rsocket.request_handler import BaseRequestHandler
+from rsocket.streams.stream_from_generator import StreamFromGenerator
+
+__all__ = ['Scenario', 'BenchmarkResult', 'run_scenario', 'interactions', 'fragmentable_interactions']
+
+interactions = ('request_response', 'fire_and_forget', 'request_stream', 'request_channel')
+
+fragmentable_interactions = ('request_stream', 'request_channel')
+
+
+@dataclass(frozen=True)
+class Scenario:
+    transport: str
+    interaction: str
+    payload_size: int
+    fragment_size: Optional[int] = None
+    concurrency: int = 1
+    operations: int = 1000
+    stream_length: int = 100
+    warmup_operations: int = 10
+
+
+@dataclass
+class BenchmarkResult:
+    transport: str
+    interaction: str
+    payload_size: int
+    fragment_size: Optional[int]
+    concurrency: int
+    operations: int
+    messages: int
+    duration_seconds: float
+    messages_per_second: float
+    megabytes_per_second: float
+    latency_p50_ms: float
+    latency_p99_ms: float
+    max_rss_kb: Optional[int]
+    traced_memory_peak_kb: Optional[int]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def max_rss_kb() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    if sys.platform == 'darwin':
+        return max_rss // 1024
+
+    return max_rss
+
+
+class _CountingSubscriber(DefaultSubscriber):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+        self.done = create_future()
+
+    def on_next(self, value, is_complete=False):
+        self.count += 1
+
+        if is_complete:
+            self.on_complete()
+
+    def on_complete(self):
+        if not self.done.done():
+            self.done.set_result(self.count)
+
+    def on_error(self, exception: Exception):
+        if not self.done.done():
+            self.done.set_exception(exception)
+
+
+class _DiscardingSubscriber(DefaultSubscriber):
+    def on_subscribe(self, subscription: Subscription):
+        super().on_subscribe(subscription)
+        subscription.request(MAX_REQUEST_N)
+
+
+def _payload_stream(scenario: Scenario, payload: Payload) -> StreamFromGenerator:
+    def generator():
+        for i in range(scenario.stream_length):
+            yield payload, i == scenario.stream_length - 1
+
+    return StreamFromGenerator(generator, fragment_size=scenario.fragment_size)
+
+
+class BenchmarkHandler(BaseRequestHandler):
+    def __init__(self, socket, scenario: Scenario, payload: Payload, on_fire_and_forget: Callable[[], None]):
+        super().__init__(socket)
+        self._scenario = scenario
+        self._payload = payload
+        self._on_fire_and_forget = on_fire_and_forget
+
+    async def request_response(self, payload: Payload) -> Awaitable[Payload]:
+        return create_future(payload)
+
+    async def request_fire_and_forget(self, payload: Payload):
+        self._on_fire_and_forget()
+
+    async def request_stream(self, payload: Payload) -> Publisher:
+        return _payload_stream(self._scenario, self._payload)
+
+    async def request_channel(self, payload: Payload) -> Tuple[Optional[Publisher], Optional[Subscriber]]:
+        return _payload_stream(self._scenario, self._payload), _DiscardingSubscriber()
+
+
+async def _run_operations(operation: Callable[[], Awaitable], operations: int, concurrency: int) -> List[float]:
+    latencies = []
+    remaining = operations
+
+    async def worker():
+        nonlocal remaining
+
+        while remaining > 0:
+            remaining -= 1
+            start = perf_counter()
+            await operation()
+            latencies.append(perf_counter() - start)
+
+    await asyncio.gather(*[worker() for _ in range(max(1, concurrency))])
+    return latencies
+
+
+def _operation_factory(scenario: Scenario, client, payload: Payload) -> Tuple[Callable[[], Awaitable], int]:
+    """Returns the operation to measure, and the number of messages it transfers."""
+
+    interaction = scenario.interaction
+
+    if interaction == 'request_response':
+        return functools.partial(client.request_response, payload), 2
+
+    if interaction == 'fire_and_forget':
+        return functools.partial(client.fire_and_forget, payload), 1
+
+    if interaction == 'request_stream':
+        async def request_stream():
+            subscriber = _CountingSubscriber()
+            client.request_stream(payload).subscribe(subscriber)
+            await subscriber.done
+
+        return request_stream, scenario.stream_length
+
+    if interaction == 'request_channel':
+        async def request_channel():
+            subscriber = _CountingSubscriber()
+            client.request_channel(payload, _payload_stream(scenario, payload)).subscribe(subscriber)
+            await subscriber.done
+
+        return request_channel, scenario.stream_length * 2
+
+    raise ValueError('Unknown interaction: {}'.format(interaction))
+
+
+async def run_scenario(scenario: Scenario, trace_memory: bool = False) -> BenchmarkResult:
+    payload = Payload(b'x' * scenario.payload_size)
+    expected_fire_and_forget = scenario.warmup_operations + scenario.operations
+    fire_and_forget_received = 0
+    all_fire_and_forget_received = asyncio.Event()
+
+    def on_fire_and_forget():
+        nonlocal fire_and_forget_received
+        fire_and_forget_received += 1
+
+        if fire_and_forget_received >= expected_fire_and_forget:
+            all_fire_and_forget_received.set()
+
+    handler_factory = functools.partial(BenchmarkHandler,
+                                        scenario=scenario,
+                                        payload=payload,
+                                        on_fire_and_forget=on_fire_and_forget)
+    pipe_factory = pipe_factory_by_transport[scenario.transport]
+
+    async with pipe_factory(unused_port(), {'handler_factory': handler_factory}, {}) as (server, client):
+        operation, messages_per_operation = _operation_factory(scenario, client, payload)
+
+        await _run_operations(operation, scenario.warmup_operations, scenario.concurrency)
+
+        if trace_memory:
+            tracemalloc.start()
+
+        try:
+            start = perf_counter()
+            latencies = await _run_operations(operation, scenario.operations, scenario.concurrency)
+
+            if scenario.interaction == 'fire_and_forget':
+                await all_fire_and_forget_received.wait()
+
+            duration = perf_counter() - start
+            traced_memory_peak_kb = tracemalloc.get_traced_memory()[1] // 1024 if trace_memory else None
+        finally:
+            if trace_memory:
+                tracemalloc.stop()
+
+    latencies.sort()
+    messages = scenario.operations * messages_per_operation
+
+    return BenchmarkResult(transport=scenario.transport,
+                           interaction=scenario.interaction,
+                           payload_size=scenario.payload_size,
+                           fragment_size=scenario.fragment_size,
+                           concurrency=scenario.concurrency,
+                           operations=scenario.operations,
+                           messages=messages,
+                           duration_seconds=duration,
+                           messages_per_second=messages / duration,
+                           megabytes_per_second=messages * scenario.payload_size / duration / (1024 * 1024),
+                           latency_p50_ms=percentile(latencies, 0.5) * 1000,
+                           latency_p99_ms=percentile(latencies, 0.99) * 1000,
+                           max_rss_kb=max_rss_kb(),
+                           traced_memory_peak_kb=traced_memory_peak_kb)
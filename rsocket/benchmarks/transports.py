@@ -0,0 +1,187 @@
+import asyncio
+import datetime
+import socket
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Callable, AsyncContextManager, Tuple
+
+from rsocket.helpers import single_transport_provider
+from rsocket.rsocket_base import RSocketBase
+from rsocket.rsocket_client import RSocketClient
+from rsocket.rsocket_server import RSocketServer
+
+__all__ = ['pipe_factory_by_transport', 'unused_port']
+
+PipeFactory = Callable[..., AsyncContextManager[Tuple[RSocketBase, RSocketClient]]]
+
+HOST = 'localhost'
+
+
+def unused_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+class _ServerHolder:
+    def __init__(self):
+        self.server: Optional[RSocketBase] = None
+        self.created = asyncio.Event()
+
+    def __call__(self, server: RSocketBase):
+        self.server = server
+        self.created.set()
+
+    async def wait(self) -> RSocketBase:
+        await self.created.wait()
+        return self.server
+
+
+@asynccontextmanager
+async def pipe_tcp(port: int, server_arguments: Dict, client_arguments: Dict):
+    from rsocket.transports.tcp import TransportTCP
+
+    holder = _ServerHolder()
+
+    def session(*connection):
+        holder(RSocketServer(TransportTCP(*connection), **server_arguments))
+
+    service = await asyncio.start_server(session, HOST, port)
+    connection = await asyncio.open_connection(HOST, port)
+
+    try:
+        async with RSocketClient(single_transport_provider(TransportTCP(*connection)),
+                                 **client_arguments) as client:
+            yield await holder.wait(), client
+    finally:
+        if holder.server is not None:
+            await holder.server.close()
+        service.close()
+
+
+@asynccontextmanager
+async def pipe_buffered_tcp(port: int, server_arguments: Dict, client_arguments: Dict):
+    from rsocket.transports.buffered_tcp import start_buffered_tcp_server, open_buffered_tcp_connection
+
+    holder = _ServerHolder()
+
+    service = await start_buffered_tcp_server(
+        lambda transport: holder(RSocketServer(transport, **server_arguments)), HOST, port)
+    transport = await open_buffered_tcp_connection(HOST, port)
+
+    try:
+        async with RSocketClient(single_transport_provider(transport), **client_arguments) as client:
+            yield await holder.wait(), client
+    finally:
+        if holder.server is not None:
+            await holder.server.close()
+        service.close()
+
+
+@asynccontextmanager
+async def pipe_aiohttp(port: int, server_arguments: Dict, client_arguments: Dict):
+    from aiohttp import web
+    from rsocket.transports.aiohttp_websocket import websocket_client, websocket_handler_factory
+
+    holder = _ServerHolder()
+
+    app = web.Application()
+    app.add_routes([web.get('/', websocket_handler_factory(on_server_create=holder, **server_arguments))])
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, HOST, port).start()
+
+    try:
+        async with websocket_client('http://{}:{}'.format(HOST, port), **client_arguments) as client:
+            yield await holder.wait(), client
+    finally:
+        if holder.server is not None:
+            await holder.server.close()
+        await runner.cleanup()
+
+
+@asynccontextmanager
+async def pipe_quart(port: int, server_arguments: Dict, client_arguments: Dict):
+    from quart import Quart
+    from rsocket.transports.aiohttp_websocket import websocket_client
+    from rsocket.transports.quart_websocket import websocket_handler
+
+    holder = _ServerHolder()
+    app = Quart(__name__)
+
+    @app.websocket('/')
+    async def ws():
+        await websocket_handler(on_server_create=holder, **server_arguments)
+
+    server_task = asyncio.create_task(app.run_task(host=HOST, port=port))
+    await asyncio.sleep(0.5)
+
+    try:
+        async with websocket_client('http://{}:{}'.format(HOST, port), **client_arguments) as client:
+            yield await holder.wait(), client
+    finally:
+        if holder.server is not None:
+            await holder.server.close()
+
+        server_task.cancel()
+
+        try:
+            await server_task
+        except asyncio.CancelledError:
+            pass
+
+
+def _generate_certificate():
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    key = ec.generate_private_key(curve=ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(x509.NameOID.COMMON_NAME, HOST)])
+    now = datetime.datetime.utcnow()
+    certificate = (x509.CertificateBuilder()
+                   .subject_name(name)
+                   .issuer_name(name)
+                   .public_key(key.public_key())
+                   .serial_number(x509.random_serial_number())
+                   .not_valid_before(now)
+                   .not_valid_after(now + datetime.timedelta(days=1))
+                   .add_extension(x509.SubjectAlternativeName([x509.DNSName(HOST)]), critical=False)
+                   .sign(key, hashes.SHA256()))
+    return certificate, key
+
+
+@asynccontextmanager
+async def pipe_quic(port: int, server_arguments: Dict, client_arguments: Dict):
+    from aioquic.quic.configuration import QuicConfiguration
+    from cryptography.hazmat.primitives import serialization
+    from rsocket.transports.aioquic_transport import rsocket_connect, rsocket_serve
+
+    certificate, private_key = _generate_certificate()
+    server_configuration = QuicConfiguration(certificate=certificate, private_key=private_key, is_client=False)
+    client_configuration = QuicConfiguration(is_client=True)
+    client_configuration.load_verify_locations(cadata=certificate.public_bytes(serialization.Encoding.PEM))
+
+    holder = _ServerHolder()
+    quic_server = await rsocket_serve(host=HOST,
+                                      port=port,
+                                      configuration=server_configuration,
+                                      on_server_create=holder,
+                                      **server_arguments)
+
+    try:
+        async with rsocket_connect(HOST, port, configuration=client_configuration) as transport:
+            async with RSocketClient(single_transport_provider(transport), **client_arguments) as client:
+                yield await holder.wait(), client
+    finally:
+        if holder.server is not None:
+            await holder.server.close()
+        quic_server.close()
+
+
+pipe_factory_by_transport: Dict[str, PipeFactory] = {
+    'tcp': pipe_tcp,
+    'buffered_tcp': pipe_buffered_tcp,
+    'aiohttp': pipe_aiohttp,
+    'quart': pipe_quart,
+    'quic': pipe_quic
+}
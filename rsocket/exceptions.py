@@ -58,6 +58,12 @@ class RSocketFrameFragmentDifferentType(RSocketError):
     pass
 
 
+class RSocketFrameFragmentLimitExceeded(RSocketProtocolError):
+
+    def __init__(self, data: Optional[str] = None):
+        super().__init__(ErrorCode.REJECTED, data)
+
+
 class RSocketTransportError(RSocketError):
     pass
 
@@ -39,8 +39,8 @@ class AuthenticationSimple(Authentication):
 
     def parse(self, buffer: bytes):
         username_length = struct.unpack('>I', b'\x00\x00' + buffer[:2])[0]
-        self.username = buffer[2:2 + username_length]
-        self.password = buffer[2 + username_length:]
+        self.username = bytes(buffer[2:2 + username_length])
+        self.password = bytes(buffer[2 + username_length:])
 
     @property
     def type(self) -> bytes:
@@ -57,7 +57,7 @@ class AuthenticationBearer(Authentication):
         return self.token
 
     def parse(self, buffer: bytes):
-        self.token = buffer
+        self.token = bytes(buffer)
 
     @property
     def type(self) -> bytes:
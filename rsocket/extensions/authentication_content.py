@@ -15,13 +15,9 @@ class AuthenticationContent(CompositeMetadataItem):
         self.authentication = authentication
 
     def serialize(self) -> bytes:
-        serialized = b''
-
-        serialized += serialize_well_known_encoding(self.authentication.type, WellKnownAuthenticationTypes.get_by_name)
-
-        serialized += self.authentication.serialize()
-
-        return serialized
+        return b''.join((serialize_well_known_encoding(self.authentication.type,
+                                                       WellKnownAuthenticationTypes.get_by_name),
+                         self.authentication.serialize()))
 
     def parse(self, buffer: bytes):
         authentication_type, offset = parse_well_known_encoding(buffer, WellKnownAuthenticationTypes.require_by_id)
@@ -1,7 +1,7 @@
 from enum import unique, Enum
-from typing import Optional
+from typing import Optional, Union
 
-from rsocket.helpers import WellKnownType
+from rsocket.helpers import WellKnownType, WellKnownTypeTable
 
 
 class WellKnownAuthenticationType(WellKnownType):
@@ -15,16 +15,17 @@ class WellKnownAuthenticationTypes(Enum):
 
     @classmethod
     def require_by_id(cls, metadata_numeric_id: int) -> WellKnownAuthenticationType:
-        for value in cls:
-            if value.value.id == metadata_numeric_id:
-                return value.value
+        authentication_type = well_known_authentication_types.get_by_id(metadata_numeric_id)
 
-        raise Exception('Unknown authentication type id')
+        if authentication_type is None:
+            raise Exception('Unknown authentication type id')
+
+        return authentication_type
 
     @classmethod
-    def get_by_name(cls, metadata_name: str) -> Optional[WellKnownAuthenticationType]:
-        for value in cls:
-            if value.value.name == metadata_name:
-                return value.value
+    def get_by_name(cls, metadata_name: Union[bytes, str]) -> Optional[WellKnownAuthenticationType]:
+        return well_known_authentication_types.get_by_name(metadata_name)
+
 
-        return None
+well_known_authentication_types = WellKnownTypeTable(
+    authentication_type.value for authentication_type in WellKnownAuthenticationTypes)
@@ -1,4 +1,5 @@
-from typing import List, Type
+from functools import lru_cache
+from typing import List, Type, Optional, Tuple, Union
 
 from rsocket.extensions.authentication_content import AuthenticationContent
 from rsocket.extensions.composite_metadata_item import CompositeMetadataItem
@@ -6,11 +7,16 @@ from rsocket.extensions.mimetypes import WellKnownMimeTypes
 from rsocket.extensions.routing import RoutingMetadata
 from rsocket.extensions.stream_data_mimetype import StreamDataMimetype
 from rsocket.extensions.stream_data_mimetype import StreamDataMimetypes
-from rsocket.frame_helpers import (pack_24bit_length, unpack_24bit)
+from rsocket.frame_helpers import pack_24bit_length, unpack_24bit, ensure_bytes
 from rsocket.helpers import parse_well_known_encoding, serialize_well_known_encoding
 
 _default = object()
 
+COMPOSITE_METADATA_CACHE_SIZE = 256
+MAX_CACHED_COMPOSITE_METADATA_SIZE = 1024
+
+_routing_encoding = WellKnownMimeTypes.MESSAGE_RSOCKET_ROUTING.value.name
+
 
 def default_or_value(value, default=None):
     if value is _default:
@@ -18,23 +24,120 @@ def default_or_value(value, default=None):
     return value
 
 
+_metadata_item_factory_by_type = {
+    WellKnownMimeTypes.MESSAGE_RSOCKET_ROUTING.value.name: RoutingMetadata,
+    WellKnownMimeTypes.MESSAGE_RSOCKET_MIMETYPE.value.name: StreamDataMimetype,
+    WellKnownMimeTypes.MESSAGE_RSOCKET_ACCEPT_MIMETYPES.value.name: StreamDataMimetypes,
+    WellKnownMimeTypes.MESSAGE_RSOCKET_AUTHENTICATION.value.name: AuthenticationContent
+}
+
+
 def metadata_item_factory(metadata_encoding: bytes) -> Type[CompositeMetadataItem]:
-    metadata_item_factory_by_type = {
-        WellKnownMimeTypes.MESSAGE_RSOCKET_ROUTING.value.name: RoutingMetadata,
-        WellKnownMimeTypes.MESSAGE_RSOCKET_MIMETYPE.value.name: StreamDataMimetype,
-        WellKnownMimeTypes.MESSAGE_RSOCKET_ACCEPT_MIMETYPES.value.name: StreamDataMimetypes,
-        WellKnownMimeTypes.MESSAGE_RSOCKET_AUTHENTICATION.value.name: AuthenticationContent
-    }
+    return _metadata_item_factory_by_type.get(metadata_encoding, CompositeMetadataItem)
+
+
+class CompositeMetadataIndex:
+    """
+    The encoding and position of each item of serialized composite metadata, found in a single pass, and the first
+    routing tag (decoded). Immutable, so it can be shared by the CompositeMetadata instances parsed from equal
+    metadata.
+    """
+
+    __slots__ = (
+        'metadata',
+        'entries',
+        'route'
+    )
+
+    def __init__(self, metadata: Union[bytes, memoryview]):
+        self.metadata = metadata
+        self.route: Optional[str] = None
+        entries = []
+        composite_length = len(metadata)
+        offset = 0
+
+        while offset < composite_length:
+            metadata_encoding, encoding_length = parse_well_known_encoding(metadata,
+                                                                           WellKnownMimeTypes.require_by_id,
+                                                                           offset)
+            offset += encoding_length
+
+            length = unpack_24bit(metadata, offset)
+            offset += 3
+
+            end = min(offset + length, composite_length)
+            entries.append((metadata_encoding, offset, end))
+
+            if self.route is None and metadata_encoding == _routing_encoding and end > offset:
+                tag_length = metadata[offset]
+                self.route = bytes(metadata[offset + 1:offset + 1 + tag_length]).decode()
+
+            offset = end
+
+        self.entries: Tuple[Tuple[bytes, int, int], ...] = tuple(entries)
+
+    def decode_item(self, index: int) -> CompositeMetadataItem:
+        metadata_encoding, start, end = self.entries[index]
+        item = metadata_item_factory(metadata_encoding)()
+        item.encoding = metadata_encoding
+        item.parse(self.metadata[start:end])
+        return item
+
+
+@lru_cache(maxsize=COMPOSITE_METADATA_CACHE_SIZE)
+def _cached_composite_metadata_index(metadata: bytes) -> CompositeMetadataIndex:
+    return CompositeMetadataIndex(metadata)
+
+
+def composite_metadata_index(metadata: Union[bytes, memoryview]) -> CompositeMetadataIndex:
+    """Index of the metadata. Small metadata is cached (LRU), since requests usually repeat the same metadata."""
+
+    if len(metadata) <= MAX_CACHED_COMPOSITE_METADATA_SIZE:
+        return _cached_composite_metadata_index(bytes(metadata))
 
-    return metadata_item_factory_by_type.get(metadata_encoding, CompositeMetadataItem)
+    return CompositeMetadataIndex(metadata)
 
 
 class CompositeMetadata:
-    __slots__ = 'items'
+    """
+    Composite metadata items. Parsed metadata is only indexed: items are decoded when first accessed, and
+    route() and find_item() decode at most the item they look for.
+    """
+
+    __slots__ = (
+        '_items',
+        '_index',
+        '_decoded_items'
+    )
 
     def __init__(self, items: List[CompositeMetadataItem] = _default):
+        self._items: List[CompositeMetadataItem] = default_or_value(items, [])
+        self._index: Optional[CompositeMetadataIndex] = None
+        self._decoded_items: Optional[List[Optional[CompositeMetadataItem]]] = None
+
+    @property
+    def items(self) -> List[CompositeMetadataItem]:
+        if self._index is not None:
+            self._items = [self._decoded_item(index) for index in range(len(self._index.entries))]
+            self._index = None
+            self._decoded_items = None
+
+        return self._items
+
+    @items.setter
+    def items(self, items: List[CompositeMetadataItem]):
+        self._items = items
+        self._index = None
+        self._decoded_items = None
+
+    def _decoded_item(self, index: int) -> CompositeMetadataItem:
+        item = self._decoded_items[index]
+
+        if item is None:
+            item = self._index.decode_item(index)
+            self._decoded_items[index] = item
 
-        self.items: List[CompositeMetadataItem] = default_or_value(items, [])
+        return item
 
     def append(self, item: CompositeMetadataItem) -> 'CompositeMetadata':
         self.items.append(item)
@@ -45,39 +148,71 @@ class CompositeMetadata:
         return self
 
     def parse(self, metadata: bytes):
-        composite_length = len(metadata)
-        offset = 0
+        self.set_index(CompositeMetadataIndex(metadata))
 
-        while offset < composite_length:
-            metadata_encoding, relative_offset = parse_well_known_encoding(metadata[offset:],
-                                                                           WellKnownMimeTypes.require_by_id)
-            offset += relative_offset
+    def set_index(self, index: CompositeMetadataIndex):
+        if self._index is None and not self._items:
+            self._index = index
+            self._decoded_items = [None] * len(index.entries)
+        else:
+            self.items.extend(index.decode_item(item_index) for item_index in range(len(index.entries)))
 
-            length = unpack_24bit(metadata, offset)
-            offset += 3
+    def route(self) -> Optional[str]:
+        """The first tag of the first routing item, if any."""
 
-            item = metadata_item_factory(metadata_encoding)()
-            item.encoding = metadata_encoding
+        if self._index is not None:
+            return self._index.route
 
-            item_metadata = metadata[offset:offset + length]
-            metadata_length = len(item_metadata)
-            item.parse(item_metadata)
+        for item in self._items:
+            if isinstance(item, RoutingMetadata) and item.tags:
+                return ensure_bytes(item.tags[0]).decode()
 
-            self.append(item)
-            offset += metadata_length
+        return None
+
+    def find_item(self, encoding: bytes) -> Optional[CompositeMetadataItem]:
+        """The first item of the given encoding, if any."""
+
+        if self._index is not None:
+            for index, (metadata_encoding, _, _) in enumerate(self._index.entries):
+                if metadata_encoding == encoding:
+                    return self._decoded_item(index)
+
+            return None
+
+        for item in self._items:
+            if item.encoding == encoding:
+                return item
+
+        return None
 
     def serialize(self) -> bytes:
-        serialized = b''
+        serialized = []
 
         for item in self.items:
-            metadata_header = serialize_well_known_encoding(item.encoding, WellKnownMimeTypes.get_by_name)
+            serialized.append(serialize_well_known_encoding(item.encoding, WellKnownMimeTypes.get_by_name))
             item_metadata = item.serialize()
+            serialized.append(pack_24bit_length(item_metadata))
+            serialized.append(item_metadata)
+
+        return b''.join(serialized)
+
+
+class CompositeMetadataTemplate:
+    """
+    Composite metadata serialized once, for requests which repeat the same items (e.g. route and mime type).
+    Items which change per request are serialized with extend(), and appended to the template.
+    """
+
+    __slots__ = ('metadata',)
+
+    def __init__(self, *items: CompositeMetadataItem):
+        self.metadata = CompositeMetadata(list(items)).serialize()
 
-            item_serialized = b''
-            item_serialized += metadata_header
-            item_serialized += pack_24bit_length(item_metadata)
-            item_serialized += item_metadata
+    def extend(self, *items: CompositeMetadataItem) -> bytes:
+        if not items:
+            return self.metadata
 
-            serialized += item_serialized
+        return self.metadata + CompositeMetadata(list(items)).serialize()
 
-        return serialized
+    def __bytes__(self) -> bytes:
+        return self.metadata
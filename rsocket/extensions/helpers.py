@@ -2,7 +2,7 @@ from typing import Union
 
 from rsocket.extensions.authentication import AuthenticationBearer, AuthenticationSimple
 from rsocket.extensions.authentication_content import AuthenticationContent
-from rsocket.extensions.composite_metadata import CompositeMetadata, CompositeMetadataItem
+from rsocket.extensions.composite_metadata import CompositeMetadata, CompositeMetadataItem, CompositeMetadataTemplate
 from rsocket.extensions.mimetypes import WellKnownMimeType, WellKnownMimeTypes
 from rsocket.extensions.routing import RoutingMetadata
 from rsocket.extensions.stream_data_mimetype import StreamDataMimetype, StreamDataMimetypes
@@ -14,6 +14,11 @@ def composite(*items) -> bytes:
     return metadata.serialize()
 
 
+def composite_template(*items) -> CompositeMetadataTemplate:
+    """Serialize the items once. Use template.metadata, or template.extend(*items) for items differing per call."""
+    return CompositeMetadataTemplate(*items)
+
+
 def metadata_item(data: bytes, encoding: Union[bytes, WellKnownMimeTypes]) -> CompositeMetadataItem:
     return CompositeMetadataItem(encoding, data)
 
@@ -39,8 +44,9 @@ def data_mime_types(*metadata_mime_types: Union[bytes, WellKnownMimeType]) -> Co
 
 
 def require_route(composite_metadata: CompositeMetadata) -> str:
-    for item in composite_metadata.items:
-        if isinstance(item, RoutingMetadata):
-            return item.tags[0].decode()
+    route_path = composite_metadata.route()
+
+    if route_path is None:
+        raise Exception('No route found in request')
 
-    raise Exception('No route found in request')
+    return route_path
@@ -1,9 +1,9 @@
 from enum import Enum, unique
-from typing import Optional
+from typing import Optional, Union
 
 from rsocket.exceptions import RSocketUnknownMimetype
 from rsocket.frame_helpers import ensure_bytes
-from rsocket.helpers import WellKnownType
+from rsocket.helpers import WellKnownType, WellKnownTypeTable
 
 
 class WellKnownMimeType(WellKnownType):
@@ -73,19 +73,19 @@ class WellKnownMimeTypes(Enum):
 
     @classmethod
     def require_by_id(cls, metadata_numeric_id: int) -> WellKnownMimeType:
-        for value in cls:
-            if value.value.id == metadata_numeric_id:
-                return value.value
+        mime_type = well_known_mime_types.get_by_id(metadata_numeric_id)
 
-        raise RSocketUnknownMimetype(metadata_numeric_id)
+        if mime_type is None:
+            raise RSocketUnknownMimetype(metadata_numeric_id)
+
+        return mime_type
 
     @classmethod
-    def get_by_name(cls, metadata_name: str) -> Optional[WellKnownMimeType]:
-        for value in cls:
-            if value.value.name == metadata_name:
-                return value.value
+    def get_by_name(cls, metadata_name: Union[bytes, str]) -> Optional[WellKnownMimeType]:
+        return well_known_mime_types.get_by_name(metadata_name)
+
 
-        return None
+well_known_mime_types = WellKnownTypeTable(mime_type.value for mime_type in WellKnownMimeTypes)
 
 
 def ensure_encoding_name(encoding) -> bytes:
@@ -48,14 +48,10 @@ class StreamDataMimetypes(CompositeMetadataItem):
         offset = 0
 
         while offset < len(buffer):
-            data_encoding, offset_diff = parse_well_known_encoding(buffer[offset:], WellKnownMimeTypes.require_by_id)
+            data_encoding, offset_diff = parse_well_known_encoding(buffer, WellKnownMimeTypes.require_by_id, offset)
             offset += offset_diff
             self.data_encodings.append(data_encoding)
 
     def serialize(self) -> bytes:
-        serialized = b''
-
-        for data_encoding in self.data_encodings:
-            serialized += serialize_well_known_encoding(data_encoding, WellKnownMimeTypes.get_by_name)
-
-        return serialized
+        return b''.join(serialize_well_known_encoding(data_encoding, WellKnownMimeTypes.get_by_name)
+                        for data_encoding in self.data_encodings)
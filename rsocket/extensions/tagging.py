@@ -5,6 +5,8 @@ from rsocket.exceptions import RSocketError
 from rsocket.extensions.composite_metadata_item import CompositeMetadataItem
 from rsocket.frame_helpers import ensure_bytes
 
+_tag_length = struct.Struct('>b')
+
 
 class TaggingMetadata(CompositeMetadataItem):
     __slots__ = (
@@ -22,16 +24,16 @@ class TaggingMetadata(CompositeMetadataItem):
         return super().serialize()
 
     def _serialize_tags(self) -> bytes:
-        serialized = b''
+        serialized = []
 
-        for tag in list(map(ensure_bytes, self.tags)):
+        for tag in map(ensure_bytes, self.tags):
             if len(tag) > 256:
                 raise RSocketError('Tag length longer than 256 characters: "%s"' % tag)
 
-            serialized += struct.pack('>b', len(tag))
-            serialized += tag
+            serialized.append(_tag_length.pack(len(tag)))
+            serialized.append(tag)
 
-        return serialized
+        return b''.join(serialized)
 
     def parse(self, buffer: bytes):
         self.tags = []
@@ -40,5 +42,5 @@ class TaggingMetadata(CompositeMetadataItem):
         while offset < len(buffer):
             tag_length = struct.unpack('>b', buffer[offset:offset + 1])[0]
             offset += 1
-            self.tags.append(buffer[offset:offset + tag_length])
+            self.tags.append(bytes(buffer[offset:offset + tag_length]))
             offset += tag_length
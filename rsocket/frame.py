@@ -3,7 +3,7 @@ import struct
 from abc import ABCMeta
 from asyncio import Future
 from enum import IntEnum, unique
-from typing import Tuple, Optional
+from typing import Tuple, Optional, List
 
 from rsocket.error_codes import ErrorCode
 from rsocket.exceptions import RSocketProtocolError, ParseError, RSocketUnknownFrameType
@@ -49,6 +49,20 @@ class FrameType(IntEnum):
 
 HEADER_LENGTH = 6  # A full header is 4 (stream) + 2 (type, flags) bytes.
 
+_header_struct = struct.Struct('>IBB')
+_uint16_struct = struct.Struct('>H')
+_uint32_struct = struct.Struct('>I')
+_uint32_pair_struct = struct.Struct('>II')
+_version_struct = struct.Struct('>HH')
+_setup_struct = struct.Struct('>HHII')
+
+_MAX_FRAME_TYPE_ID = 0x3F  # 6 bits
+
+_frame_type_by_id: List[Optional[FrameType]] = [
+    FrameType(type_id) if type_id in FrameType.__members__.values() else None
+    for type_id in range(_MAX_FRAME_TYPE_ID + 1)
+]
+
 
 class Header:
     __slots__ = (
@@ -62,17 +76,16 @@ class Header:
 
 def parse_header(frame: Header, buffer: bytes, offset: int) -> int:
     frame.length = len(buffer)
-    frame.stream_id, frame.frame_type, flags = struct.unpack_from('>IBB', buffer, offset)
-    flags |= (frame.frame_type & 3) << 8
-    frame_type_id = frame.frame_type >> 2
+    frame.stream_id, frame_type_and_flags, flags = _header_struct.unpack_from(buffer, offset)
+    flags |= (frame_type_and_flags & 3) << 8
+    frame_type = _frame_type_by_id[frame_type_and_flags >> 2]
 
-    try:
-        frame.frame_type = FrameType(frame_type_id)
-    except ValueError as exception:
-        raise RSocketUnknownFrameType(frame_type_id) from exception
+    if frame_type is None:
+        raise RSocketUnknownFrameType(frame_type_and_flags >> 2)
 
-    frame.flags_ignore = is_flag_set(flags, _FLAG_IGNORE_BIT)
-    frame.flags_metadata = is_flag_set(flags, _FLAG_METADATA_BIT)
+    frame.frame_type = frame_type
+    frame.flags_ignore = (flags & _FLAG_IGNORE_BIT) != 0
+    frame.flags_metadata = (flags & _FLAG_METADATA_BIT) != 0
     return flags
 
 
@@ -136,6 +149,14 @@ class Frame(Header, metaclass=ABCMeta):
         ...
 
     def serialize(self, middle=b'', flags: int = 0) -> bytes:
+        return b''.join(self.serialize_segments(middle, flags))
+
+    def serialize_segments(self, middle=b'', flags: int = 0) -> List[bytes]:
+        """
+        Serialize the frame as a list of buffers (header and fixed fields, metadata, data) without copying
+        the metadata and data into a single buffer. Suitable for vectored writes (e.g. writelines).
+        """
+
         flags &= ~(_FLAG_IGNORE_BIT | _FLAG_METADATA_BIT)
         if self.flags_ignore:
             flags |= _FLAG_IGNORE_BIT
@@ -145,33 +166,18 @@ class Frame(Header, metaclass=ABCMeta):
 
         self.length = self._compute_frame_length(middle)
 
-        offset = 0
-        buffer = bytearray(self.length)
-
-        struct.pack_into('>I', buffer, offset, self.stream_id)
-        offset += 4
-
-        buffer[offset] = (self.frame_type << 2) | (flags >> 8)
-        offset += 1
-        buffer[offset] = flags & 0xff
-        offset += 1
-
-        buffer[offset:offset + len(middle)] = middle[:]
-        offset += len(middle)
+        header = _header_struct.pack(self.stream_id, (self.frame_type << 2) | (flags >> 8), flags & 0xff) + middle
+        segments = [header]
 
         if self.flags_metadata and self.metadata:
-            length = len(self.metadata)
             if not self.metadata_only:
-                buffer[offset:offset + 3] = pack_24bit(length)
-                offset += 3
-            buffer[offset:offset + length] = self.metadata[:]
-            offset += length
+                segments[0] = header + pack_24bit(len(self.metadata))
+            segments.append(self.metadata)
 
         if not self.metadata_only and self.data:
-            buffer[offset:offset + len(self.data)] = self.data[:]
-            offset += len(self.data)
+            segments.append(self.data)
 
-        return bytes(buffer)
+        return segments
 
     def _compute_frame_length(self, middle: bytes) -> int:
         header_length = HEADER_LENGTH
@@ -218,14 +224,14 @@ class SetupFrame(Frame):
 
         (self.major_version, self.minor_version,
          self.keep_alive_milliseconds, self.max_lifetime_milliseconds) = (
-            struct.unpack_from('>HHII', buffer, offset))
+            _setup_struct.unpack_from(buffer, offset))
 
         offset += 12
 
         if self.flags_resume:
-            self.token_length = struct.unpack_from('>H', buffer, offset)[0]
+            self.token_length = _uint16_struct.unpack_from(buffer, offset)[0]
             offset += 2
-            self.resume_identification_token = (
+            self.resume_identification_token = bytes(
                 buffer[offset:offset + self.token_length])
             offset += self.token_length
 
@@ -237,23 +243,23 @@ class SetupFrame(Frame):
         offset += self.parse_metadata(buffer, offset)
         offset += self.parse_data(buffer, offset)
 
-    def serialize(self, middle=b'', flags=0) -> bytes:
+    def serialize_segments(self, middle=b'', flags: int = 0) -> List[bytes]:
         flags &= ~(_FLAG_LEASE_BIT | _FLAG_RESUME_BIT)
         if self.flags_lease:
             flags |= _FLAG_LEASE_BIT
         if self.flags_resume:
             flags |= _FLAG_RESUME_BIT
-        middle = struct.pack(
-            '>HHII', self.major_version, self.minor_version,
+        middle = _setup_struct.pack(
+            self.major_version, self.minor_version,
             self.keep_alive_milliseconds, self.max_lifetime_milliseconds)
         if self.flags_resume:
-            middle += struct.pack('>H', self.token_length)
+            middle += _uint16_struct.pack(self.token_length)
             # assert len(self.resume_identification_token) == self.token_length
             # assert isinstance(self.resume_identification_token, bytes)
             middle += self.resume_identification_token
         middle += pack_string(self.metadata_encoding)
         middle += pack_string(self.data_encoding)
-        return Frame.serialize(self, middle, flags)
+        return Frame.serialize_segments(self, middle, flags)
 
 
 class InvalidFrame:
@@ -274,9 +280,9 @@ class ErrorFrame(Frame):
         offset += 4
         offset += self.parse_data(buffer, offset)
 
-    def serialize(self, middle=b'', flags=0) -> bytes:
-        middle = struct.pack('>I', self.error_code)
-        return Frame.serialize(self, middle, flags)
+    def serialize_segments(self, middle=b'', flags: int = 0) -> List[bytes]:
+        middle = _uint32_struct.pack(self.error_code)
+        return Frame.serialize_segments(self, middle, flags)
 
 
 class LeaseFrame(Frame):
@@ -294,16 +300,15 @@ class LeaseFrame(Frame):
     def parse(self, buffer: bytes, offset: int):
         parse_header(self, buffer, offset)
         offset += HEADER_LENGTH
-        time_to_live, number_of_requests = struct.unpack_from('>II', buffer, offset)
+        time_to_live, number_of_requests = _uint32_pair_struct.unpack_from(buffer, offset)
         self.time_to_live = time_to_live & MASK_31_BITS
         self.number_of_requests = number_of_requests & MASK_31_BITS
         offset += self.parse_metadata(buffer, offset + 8)
 
-    def serialize(self, middle=b'', flags=0):
-        middle = struct.pack('>II',
-                             self.time_to_live & MASK_31_BITS,
-                             self.number_of_requests & MASK_31_BITS)
-        return Frame.serialize(self, middle, flags)
+    def serialize_segments(self, middle=b'', flags: int = 0) -> List[bytes]:
+        middle = _uint32_pair_struct.pack(self.time_to_live & MASK_31_BITS,
+                                          self.number_of_requests & MASK_31_BITS)
+        return Frame.serialize_segments(self, middle, flags)
 
 
 class KeepAliveFrame(Frame):
@@ -321,16 +326,16 @@ class KeepAliveFrame(Frame):
         flags = parse_header(self, buffer, offset)
         offset += HEADER_LENGTH
         self.flags_respond = is_flag_set(flags, _FLAG_RESPOND_BIT)
-        self.last_received_position = unpack_position(buffer[offset:offset + 8])
+        self.last_received_position = unpack_position(buffer, offset)
         offset += 8
         offset += self.parse_data(buffer, offset)
 
-    def serialize(self, middle=b'', flags: int = 0) -> bytes:
+    def serialize_segments(self, middle=b'', flags: int = 0) -> List[bytes]:
         flags &= ~_FLAG_RESPOND_BIT
         if self.flags_respond:
             flags |= _FLAG_RESPOND_BIT
         middle += pack_position(self.last_received_position)
-        return Frame.serialize(self, middle, flags)
+        return Frame.serialize_segments(self, middle, flags)
 
 
 class RequestFrame(Frame):
@@ -347,13 +352,13 @@ class RequestFrame(Frame):
         self.flags_follows = is_flag_set(flags, _FLAG_FOLLOWS_BIT)
         return HEADER_LENGTH, flags
 
-    def serialize(self, middle=b'', flags: int = 0) -> bytes:
+    def serialize_segments(self, middle=b'', flags: int = 0) -> List[bytes]:
         flags &= ~_FLAG_FOLLOWS_BIT
 
         if self.flags_follows:
             flags |= _FLAG_FOLLOWS_BIT
 
-        return Frame.serialize(self, middle, flags)
+        return Frame.serialize_segments(self, middle, flags)
 
     def _parse_payload(self, buffer: bytes, offset: int):
         offset += self.parse_metadata(buffer, offset)
@@ -399,9 +404,9 @@ class RequestStreamFrame(RequestFrame):
         offset += 4
         self._parse_payload(buffer, offset)
 
-    def serialize(self, middle=b'', flags=0):
-        middle = struct.pack('>I', self.initial_request_n)
-        return RequestFrame.serialize(self, middle)
+    def serialize_segments(self, middle=b'', flags: int = 0) -> List[bytes]:
+        middle = _uint32_struct.pack(self.initial_request_n)
+        return RequestFrame.serialize_segments(self, middle)
 
 
 class RequestChannelFrame(RequestFrame):
@@ -426,14 +431,14 @@ class RequestChannelFrame(RequestFrame):
         offset += 4
         self._parse_payload(buffer, offset)
 
-    def serialize(self, middle=b'', flags=0):
-        middle = struct.pack('>I', self.initial_request_n)
+    def serialize_segments(self, middle=b'', flags: int = 0) -> List[bytes]:
+        middle = _uint32_struct.pack(self.initial_request_n)
 
         flags &= ~_FLAG_COMPLETE_BIT
         if self.flags_complete:
             flags |= _FLAG_COMPLETE_BIT
 
-        return RequestFrame.serialize(self, middle, flags)
+        return RequestFrame.serialize_segments(self, middle, flags)
 
 
 class RequestNFrame(RequestFrame):
@@ -448,9 +453,9 @@ class RequestNFrame(RequestFrame):
         offset += HEADER_LENGTH
         self.request_n = unpack_32bit(buffer, offset)
 
-    def serialize(self, middle=b'', flags=0):
-        middle = struct.pack('>I', self.request_n)
-        return Frame.serialize(self, middle, flags)
+    def serialize_segments(self, middle=b'', flags: int = 0) -> List[bytes]:
+        middle = _uint32_struct.pack(self.request_n)
+        return Frame.serialize_segments(self, middle, flags)
 
 
 class CancelFrame(Frame):
@@ -484,7 +489,7 @@ class PayloadFrame(Frame):
         offset += self.parse_metadata(buffer, offset)
         offset += self.parse_data(buffer, offset)
 
-    def serialize(self, middle=b'', flags=0):
+    def serialize_segments(self, middle=b'', flags: int = 0) -> List[bytes]:
         flags &= ~(_FLAG_FOLLOWS_BIT | _FLAG_COMPLETE_BIT |
                    _FLAG_NEXT_BIT)
         if self.flags_follows:
@@ -493,7 +498,7 @@ class PayloadFrame(Frame):
             flags |= _FLAG_COMPLETE_BIT
         if self.flags_next:
             flags |= _FLAG_NEXT_BIT
-        return Frame.serialize(self, flags=flags)
+        return Frame.serialize_segments(self, flags=flags)
 
 
 class MetadataPushFrame(Frame):
@@ -532,25 +537,25 @@ class ResumeFrame(Frame):
         offset += HEADER_LENGTH
 
         (self.major_version, self.minor_version) = (
-            struct.unpack_from('>HH', buffer, offset))
+            _version_struct.unpack_from(buffer, offset))
 
         offset += 4
 
-        self.token_length = struct.unpack_from('>H', buffer, offset)[0]
+        self.token_length = _uint16_struct.unpack_from(buffer, offset)[0]
         offset += 2
-        self.resume_identification_token = (
+        self.resume_identification_token = bytes(
             buffer[offset:offset + self.token_length])
         offset += self.token_length
 
-        self.last_server_position = unpack_position(buffer[offset:offset + 8])
+        self.last_server_position = unpack_position(buffer, offset)
         offset += 8
-        self.first_client_position = unpack_position(buffer[offset:])
+        self.first_client_position = unpack_position(buffer, offset)
 
-    def serialize(self, middle=b'', flags=0) -> bytes:
+    def serialize_segments(self, middle=b'', flags: int = 0) -> List[bytes]:
         flags &= ~(_FLAG_LEASE_BIT | _FLAG_RESUME_BIT)
 
-        middle = struct.pack('>HH', self.major_version, self.minor_version)
-        middle += struct.pack('>H', len(self.resume_identification_token))
+        middle = _version_struct.pack(self.major_version, self.minor_version)
+        middle += _uint16_struct.pack(len(self.resume_identification_token))
         # assert len(self.resume_identification_token) == self.token_length
         # assert isinstance(self.resume_identification_token, bytes)
         middle += self.resume_identification_token
@@ -558,7 +563,7 @@ class ResumeFrame(Frame):
         middle += pack_position(self.last_server_position)
         middle += pack_position(self.first_client_position)
 
-        return Frame.serialize(self, middle)
+        return Frame.serialize_segments(self, middle)
 
 
 class ResumeOKFrame(Frame):
@@ -573,11 +578,11 @@ class ResumeOKFrame(Frame):
     def parse(self, buffer: bytes, offset: int):
         parse_header(self, buffer, offset)
         offset += HEADER_LENGTH
-        self.last_received_client_position = unpack_position(buffer[offset:offset + 8])
+        self.last_received_client_position = unpack_position(buffer, offset)
 
-    def serialize(self, middle=b'', flags: int = 0) -> bytes:
+    def serialize_segments(self, middle=b'', flags: int = 0) -> List[bytes]:
         serialized = pack_position(self.last_received_client_position)
-        return super().serialize(serialized)
+        return super().serialize_segments(serialized)
 
 
 class ExtendedFrame(Frame, metaclass=abc.ABCMeta):
@@ -589,7 +594,7 @@ class ExtendedFrame(Frame, metaclass=abc.ABCMeta):
         super().__init__(FrameType.EXT)
 
     @abc.abstractmethod
-    def serialize(self, middle=b'', flags: int = 0) -> bytes:
+    def serialize_segments(self, middle=b'', flags: int = 0) -> List[bytes]:
         ...
 
 
@@ -610,15 +615,22 @@ _frame_class_by_id = {
     FrameType.RESUME_OK: ResumeOKFrame,
 }
 
+_frame_class_by_type_id: List[Optional[type]] = [
+    _frame_class_by_id.get(frame_type) for frame_type in _frame_type_by_id
+]
+
 
 def parse_or_ignore(buffer: bytes) -> Optional[Frame]:
     if len(buffer) < HEADER_LENGTH:
         raise ParseError('Frame too short: {} bytes'.format(len(buffer)))
 
-    header = Header()
-    parse_header(header, buffer, 0)
+    frame_type_and_flags = buffer[4]
+    frame_class = _frame_class_by_type_id[frame_type_and_flags >> 2]
+
+    if frame_class is None:
+        raise RSocketUnknownFrameType(frame_type_and_flags >> 2)
 
-    frame = _frame_class_by_id[header.frame_type]()
+    frame = frame_class()
 
     try:
         frame.parse(buffer, 0)
@@ -627,7 +639,7 @@ def parse_or_ignore(buffer: bytes) -> Optional[Frame]:
             return frame
 
     except Exception as exception:
-        if not header.flags_ignore:
+        if not frame_type_and_flags & (_FLAG_IGNORE_BIT >> 8):
             raise RSocketProtocolError(ErrorCode.CONNECTION_ERROR, str(exception)) from exception
 
 
@@ -665,16 +677,40 @@ def exception_to_error_frame(stream_id: int, exception: Exception) -> ErrorFrame
 
 def error_frame_to_exception(frame: ErrorFrame) -> Exception:
     if frame.error_code != ErrorCode.APPLICATION_ERROR:
-        return RSocketProtocolError(frame.error_code, data=frame.data.decode())
+        return RSocketProtocolError(frame.error_code, data=bytes(frame.data).decode())
+
+    return RuntimeError(bytes(frame.data).decode('utf-8'))
+
+
+def frame_payload_length(frame: Frame) -> int:
+    length = HEADER_LENGTH
+
+    if frame.data:
+        length += len(frame.data)
+
+    if frame.metadata:
+        length += len(frame.metadata)
 
-    return RuntimeError(frame.data.decode('utf-8'))
+    return length
 
 
 def serialize_with_frame_size_header(frame: Frame) -> bytes:
-    serialized_frame = frame.serialize()
-    header = struct.pack('>I', len(serialized_frame))[1:]
-    full_frame = header + serialized_frame
-    return full_frame
+    return b''.join(serialize_segments_with_frame_size_header(frame))
+
+
+def serialize_segments_with_frame_size_header(frame: Frame) -> List[bytes]:
+    segments = frame.serialize_segments()
+    segments[0] = pack_24bit(sum(map(len, segments))) + segments[0]
+    return segments
+
+
+def serialize_frames_segments(frames: List[Frame]) -> List[bytes]:
+    segments = []
+
+    for frame in frames:
+        segments.extend(serialize_segments_with_frame_size_header(frame))
+
+    return segments
 
 
 initiate_request_frame_types = (RequestResponseFrame,
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from rsocket.datetime_helpers import to_milliseconds
 from rsocket.fragment import Fragment
 from rsocket.frame import (PayloadFrame, RequestNFrame,
@@ -5,7 +7,7 @@ from rsocket.frame import (PayloadFrame, RequestNFrame,
                            RequestStreamFrame, RequestResponseFrame,
                            RequestFireAndForgetFrame, SetupFrame,
                            MetadataPushFrame, KeepAliveFrame,
-                           MAX_REQUEST_N)
+                           ResumeFrame, ResumeOKFrame, MAX_REQUEST_N)
 from rsocket.helpers import create_future
 from rsocket.payload import Payload
 
@@ -85,9 +87,16 @@ def to_setup_frame(payload,
                    metadata_encoding,
                    keep_alive_period,
                    max_lifetime_period,
-                   honor_lease=False):
+                   honor_lease=False,
+                   resume_token: Optional[bytes] = None):
     setup = SetupFrame()
     setup.flags_lease = honor_lease
+
+    if resume_token is not None:
+        setup.flags_resume = True
+        setup.token_length = len(resume_token)
+        setup.resume_identification_token = resume_token
+
     setup.keep_alive_milliseconds = to_milliseconds(keep_alive_period)
     setup.max_lifetime_milliseconds = to_milliseconds(max_lifetime_period)
     setup.data_encoding = data_encoding
@@ -106,8 +115,24 @@ def to_metadata_push_frame(metadata: bytes) -> MetadataPushFrame:
     return frame
 
 
-def to_keepalive_frame(data: bytes):
+def to_keepalive_frame(data: bytes, last_received_position: int = 0):
     frame = KeepAliveFrame()
     frame.flags_respond = True
     frame.data = data
+    frame.last_received_position = last_received_position
+    return frame
+
+
+def to_resume_frame(resume_token: bytes, last_server_position: int, first_client_position: int) -> ResumeFrame:
+    frame = ResumeFrame()
+    frame.token_length = len(resume_token)
+    frame.resume_identification_token = resume_token
+    frame.last_server_position = last_server_position
+    frame.first_client_position = first_client_position
+    return frame
+
+
+def to_resume_ok_frame(last_received_client_position: int) -> ResumeOKFrame:
+    frame = ResumeOKFrame()
+    frame.last_received_client_position = last_received_client_position
     return frame
@@ -1,52 +1,134 @@
-from typing import Optional
+from typing import Optional, List, Dict, Set
 
-from rsocket.exceptions import RSocketFrameFragmentDifferentType
-from rsocket.frame import FragmentableFrame
+from rsocket.exceptions import RSocketFrameFragmentDifferentType, RSocketFrameFragmentLimitExceeded
+from rsocket.frame import FragmentableFrame, PayloadFrame, initiate_request_frame_types
+
+
+class _FragmentedFrame:
+    __slots__ = (
+        'frame',
+        'data',
+        'metadata',
+        'size'
+    )
+
+    def __init__(self, frame: FragmentableFrame):
+        self.frame = frame
+        self.data: List[bytes] = []
+        self.metadata: List[bytes] = []
+        self.size = 0
 
 
 class FrameFragmentCache:
-    __slots__ = 'frame_by_stream_id'
+    """
+    Reassembles fragmented frames. The fragments' content is collected per stream and joined once, when the last
+    fragment is received. Fragments following the first fragment of a request are PAYLOAD frames.
+
+    The remaining fragments of a frame rejected for exceeding a limit are dropped, up to its last fragment.
 
-    def __init__(self):
-        self.frame_by_stream_id = {}
+    :param max_stream_bytes: maximum size of the content of a single frame being reassembled
+    :param max_total_bytes: maximum size of the content of all frames being reassembled
+    """
+
+    __slots__ = (
+        'frame_by_stream_id',
+        '_rejected_stream_ids',
+        '_max_stream_bytes',
+        '_max_total_bytes',
+        '_total_bytes'
+    )
+
+    def __init__(self, max_stream_bytes: Optional[int] = None, max_total_bytes: Optional[int] = None):
+        self.frame_by_stream_id: Dict[int, _FragmentedFrame] = {}
+        self._rejected_stream_ids: Set[int] = set()
+        self._max_stream_bytes = max_stream_bytes
+        self._max_total_bytes = max_total_bytes
+        self._total_bytes = 0
 
     def append(self, frame: FragmentableFrame) -> Optional[FragmentableFrame]:
-        if frame.flags_follows:
-            self.frame_by_stream_id[frame.stream_id] = self.frame_fragment_builder(frame)
+        stream_id = frame.stream_id
+
+        if stream_id in self._rejected_stream_ids:
+            if not frame.flags_follows:
+                self._rejected_stream_ids.discard(stream_id)
+
             return None
+
+        fragmented_frame = self.frame_by_stream_id.get(stream_id)
+
+        if fragmented_frame is None:
+            if not frame.flags_follows:
+                return frame
+
+            fragmented_frame = _FragmentedFrame(frame)
+            self.frame_by_stream_id[stream_id] = fragmented_frame
         else:
-            if frame.stream_id in self.frame_by_stream_id:
-                frame = self.frame_fragment_builder(frame)
-                self.frame_by_stream_id.pop(frame.stream_id)
-            return frame
+            first_frame = fragmented_frame.frame
 
-    def frame_fragment_builder(self, next_frame: FragmentableFrame) -> FragmentableFrame:
-        current_frame_from_fragments = self.frame_by_stream_id.get(next_frame.stream_id, next_frame)
+            if type(first_frame) == type(frame):
+                first_frame.flags_complete = frame.flags_complete
 
-        if type(current_frame_from_fragments) != type(next_frame):
-            raise RSocketFrameFragmentDifferentType()
+                if isinstance(frame, PayloadFrame):
+                    first_frame.flags_next = frame.flags_next
+            elif not (isinstance(frame, PayloadFrame) and isinstance(first_frame, initiate_request_frame_types)):
+                self.discard(stream_id)
+                raise RSocketFrameFragmentDifferentType()
 
-        current_frame_from_fragments.flags_complete = next_frame.flags_complete
-        current_frame_from_fragments.flags_next = next_frame.flags_next
+        self._append_content(stream_id, fragmented_frame, frame)
 
-        if next_frame.flags_follows:
-            if current_frame_from_fragments is not next_frame:
-                self.merge_frame_content_inplace(current_frame_from_fragments, next_frame)
-        else:
-            self.merge_frame_content_inplace(current_frame_from_fragments, next_frame)
-            next_frame = current_frame_from_fragments
-            next_frame.flags_follows = False
+        if frame.flags_follows:
+            return None
 
-        return current_frame_from_fragments
+        self.discard(stream_id)
+        return self._join(fragmented_frame)
+
+    def _append_content(self, stream_id: int, fragmented_frame: _FragmentedFrame, frame: FragmentableFrame):
+        size = 0
+
+        if frame.data:
+            size += len(frame.data)
+
+        if frame.metadata:
+            size += len(frame.metadata)
+
+        if self._max_stream_bytes is not None and fragmented_frame.size + size > self._max_stream_bytes:
+            self._reject(stream_id, frame)
+            raise RSocketFrameFragmentLimitExceeded('Fragmented frame exceeds {} bytes'.format(
+                self._max_stream_bytes))
+
+        if self._max_total_bytes is not None and self._total_bytes + size > self._max_total_bytes:
+            self._reject(stream_id, frame)
+            raise RSocketFrameFragmentLimitExceeded('Fragmented frames exceed {} bytes'.format(
+                self._max_total_bytes))
+
+        if frame.data:
+            fragmented_frame.data.append(frame.data)
+
+        if frame.metadata:
+            fragmented_frame.metadata.append(frame.metadata)
+
+        fragmented_frame.size += size
+        self._total_bytes += size
 
     # noinspection PyMethodMayBeStatic
-    def merge_frame_content_inplace(self,
-                                    current_frame_from_fragments: FragmentableFrame,
-                                    next_frame: FragmentableFrame):
-        if next_frame.data is not None:
-            if current_frame_from_fragments.data is None:
-                current_frame_from_fragments.data = b''
-            current_frame_from_fragments.data += next_frame.data
-
-        if next_frame.metadata is not None:
-            current_frame_from_fragments.metadata += next_frame.metadata
+    def _join(self, fragmented_frame: _FragmentedFrame) -> FragmentableFrame:
+        frame = fragmented_frame.frame
+        frame.flags_follows = False
+        frame.data = b''.join(fragmented_frame.data)
+        frame.metadata = b''.join(fragmented_frame.metadata)
+        return frame
+
+    def _reject(self, stream_id: int, frame: FragmentableFrame):
+        self.discard(stream_id)
+
+        if frame.flags_follows:
+            self._rejected_stream_ids.add(stream_id)
+
+    def discard(self, stream_id: int):
+        fragmented_frame = self.frame_by_stream_id.pop(stream_id, None)
+
+        if fragmented_frame is not None:
+            self._total_bytes -= fragmented_frame.size
+
+    def total_bytes(self) -> int:
+        return self._total_bytes
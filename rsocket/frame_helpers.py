@@ -1,70 +1,75 @@
 import struct
-from io import BytesIO
-from typing import Union, AsyncGenerator, Tuple
+from typing import Union, Generator, Tuple, Optional
 
 from rsocket.exceptions import RSocketMimetypeTooLong
 from rsocket.fragment import Fragment
 
 MASK_63_BITS = 0x7FFFFFFFFFFFFFFF
 
+_int8 = struct.Struct('b')
+_uint32 = struct.Struct('>I')
+_uint64 = struct.Struct('>Q')
+
 
 def is_flag_set(flags: int, bit: int) -> bool:
     return (flags & bit) != 0
 
 
 def pack_string(buffer: bytes) -> bytes:
-    return struct.pack('b', len(buffer)) + buffer
+    return _int8.pack(len(buffer)) + buffer
 
 
 def unpack_string(buffer: bytes, offset: int) -> Tuple[int, bytes]:
-    length = struct.unpack_from('b', buffer, offset)[0]
-    result = buffer[offset + 1:offset + length + 1]
+    length = _int8.unpack_from(buffer, offset)[0]
+    result = bytes(buffer[offset + 1:offset + length + 1])
     return length, result
 
 
 def pack_position(position: int) -> bytes:
-    return struct.pack('>Q', position & MASK_63_BITS)
+    return _uint64.pack(position & MASK_63_BITS)
 
 
-def unpack_position(chunk: bytes) -> int:
-    return struct.unpack('>Q', chunk)[0] & MASK_63_BITS
+def unpack_position(chunk: bytes, offset: int = 0) -> int:
+    return _uint64.unpack_from(chunk, offset)[0] & MASK_63_BITS
 
 
 def pack_24bit_length(item_metadata: bytes) -> bytes:
     return pack_24bit(len(item_metadata))
 
 
-def pack_24bit(length) -> bytes:
-    return struct.pack('>I', length)[1:]
+def pack_24bit(length: int) -> bytes:
+    return length.to_bytes(3, 'big')
 
 
-def unpack_24bit(metadata: bytes, offset: int) -> int:
-    return struct.unpack('>I', b'\x00' + metadata[offset:offset + 3])[0]
+def unpack_24bit(buffer: bytes, offset: int) -> int:
+    return (buffer[offset] << 16) | (buffer[offset + 1] << 8) | buffer[offset + 2]
 
 
 def unpack_32bit(buffer: bytes, offset: int) -> int:
-    return struct.unpack_from('>I', buffer, offset)[0]
+    return _uint32.unpack_from(buffer, offset)[0]
 
 
-async def payload_to_n_size_fragments(data_reader: BytesIO,
-                                      metadata_reader: BytesIO,
-                                      fragment_size: int
-                                      ) -> AsyncGenerator[Fragment, None]:
-    while True:
-        metadata_fragment = metadata_reader.read(fragment_size)
+def payload_to_n_size_fragments(data: Optional[bytes],
+                                metadata: Optional[bytes],
+                                fragment_size: int
+                                ) -> Generator[Fragment, None, None]:
+    """
+    Split the payload into fragments of at most fragment_size bytes, metadata first. The fragments' data and
+    metadata are memoryview slices of the given payload, nothing is copied.
+    """
 
-        if len(metadata_fragment) == 0:
-            last_metadata_fragment = b''
-            break
+    data = memoryview(data or b'')
+    metadata = memoryview(metadata or b'')
+    metadata_position = 0
 
-        if len(metadata_fragment) < fragment_size:
-            last_metadata_fragment = metadata_fragment
-            break
-        else:
-            yield Fragment(None, metadata_fragment, is_last=False)
+    while len(metadata) - metadata_position >= fragment_size:
+        yield Fragment(None, metadata[metadata_position:metadata_position + fragment_size], is_last=False)
+        metadata_position += fragment_size
 
+    last_metadata_fragment = metadata[metadata_position:]
     expected_data_fragment_length = fragment_size - len(last_metadata_fragment)
-    data_fragment = data_reader.read(expected_data_fragment_length)
+    data_fragment = data[:expected_data_fragment_length]
+    data_position = len(data_fragment)
 
     if len(last_metadata_fragment) > 0 or len(data_fragment) > 0:
         last_fragment_sent = len(data_fragment) < expected_data_fragment_length
@@ -78,7 +83,8 @@ async def payload_to_n_size_fragments(data_reader: BytesIO,
         return
 
     while True:
-        data_fragment = data_reader.read(fragment_size)
+        data_fragment = data[data_position:data_position + fragment_size]
+        data_position += len(data_fragment)
 
         is_last_fragment = len(data_fragment) < fragment_size
         yield Fragment(data_fragment, None, is_last=is_last_fragment)
@@ -107,8 +113,8 @@ def serialize_128max_value(encoding: bytes) -> bytes:
     return serialized
 
 
-def parse_type(buffer: bytes) -> Tuple[int, int]:
-    data_byte = struct.unpack('>B', buffer[:1])[0]
+def parse_type(buffer: bytes, offset: int = 0) -> Tuple[int, int]:
+    data_byte = buffer[offset]
     is_known_type = data_byte >> 7 == 1
     length_or_type = data_byte & 0b1111111
     return is_known_type, length_or_type
@@ -1,94 +1,63 @@
+import logging
+from typing import Dict, Any, Tuple, Type
+
 from rsocket.frame import Frame, InvalidFrame, RequestNFrame, KeepAliveFrame, RequestStreamFrame, LeaseFrame, \
     PayloadFrame, ErrorFrame, SetupFrame
 from rsocket.logger import logger
 
+_logger = logger()
+
+_default_frame_fields = (('complete', 'flags_complete'),)
+
+_frame_fields_by_type: Dict[Type[Frame], Tuple[Tuple[str, str], ...]] = {
+    RequestNFrame: (('n', 'request_n'),),
+    LeaseFrame: (('ttl', 'time_to_live'), ('n', 'number_of_requests')),
+    KeepAliveFrame: (),
+    ErrorFrame: (('error_code', 'error_code'), ('data', 'data')),
+    PayloadFrame: (('data', 'data'), ('metadata', 'metadata'), ('next', 'flags_next'),
+                   ('complete', 'flags_complete'), ('follows', 'flags_follows')),
+    SetupFrame: (('data_encoding', 'data_encoding'), ('metadata_encoding', 'metadata_encoding'), ('data', 'data'),
+                 ('metadata', 'metadata'), ('lease', 'flags_lease')),
+    RequestStreamFrame: (('n', 'initial_request_n'),)
+}
+
+
+def _log_format(fields: Tuple[Tuple[str, str], ...]) -> str:
+    return '%s: %s frame (type=%s, stream_id=%d' + ''.join(', %s=%%s' % label for label, _ in fields) + ')'
+
+
+_default_log_format = _log_format(_default_frame_fields)
+_log_format_by_type = {frame_type: _log_format(fields) for frame_type, fields in _frame_fields_by_type.items()}
+
+
+def is_frame_logging_enabled() -> bool:
+    return _logger.isEnabledFor(logging.DEBUG)
+
+
+def frame_fields(frame: Frame) -> Dict[str, Any]:
+    """The frame type, stream id and the fields relevant to the frame type (as logged by log_frame)."""
+
+    fields = {'type': frame.frame_type.name, 'stream_id': frame.stream_id}
+
+    for label, attribute in _frame_fields_by_type.get(type(frame), _default_frame_fields):
+        fields[label] = getattr(frame, attribute)
+
+    return fields
+
 
 def log_frame(frame: Frame, log_identifier: str, direction: str = 'Received'):
+    if not _logger.isEnabledFor(logging.DEBUG):
+        return
+
     if isinstance(frame, InvalidFrame):
-        logger().debug('%s: Received invalid frame', log_identifier)
-
-    elif isinstance(frame, RequestNFrame):
-        logger().debug(
-            '%s: %s frame (type=%s, stream_id=%d, n=%s)',
-            log_identifier,
-            direction,
-            frame.frame_type.name,
-            frame.stream_id,
-            frame.request_n
-        )
-    elif isinstance(frame, LeaseFrame):
-        logger().debug(
-            '%s: %s frame (type=%s, stream_id=%d, ttl=%s, n=%s)',
-            log_identifier,
-            direction,
-            frame.frame_type.name,
-            frame.stream_id,
-            frame.time_to_live,
-            frame.number_of_requests
-        )
-
-    elif isinstance(frame, KeepAliveFrame):
-        logger().debug(
-            '%s: %s frame (type=%s, stream_id=%d)',
-            log_identifier,
-            direction,
-            frame.frame_type.name,
-            frame.stream_id
-        )
-
-    elif isinstance(frame, ErrorFrame):
-        logger().debug(
-            '%s: %s frame (type=%s, stream_id=%d, error_code=%s, data=%s)',
-            log_identifier,
-            direction,
-            frame.frame_type.name,
-            frame.stream_id,
-            frame.error_code,
-            frame.data
-        )
-
-    elif isinstance(frame, PayloadFrame):
-        logger().debug(
-            '%s: %s frame (type=%s, stream_id=%d, data=%s, metadata=%s, next=%s, complete=%s, follows=%s)',
-            log_identifier,
-            direction,
-            frame.frame_type.name,
-            frame.stream_id,
-            frame.data,
-            frame.metadata,
-            frame.flags_next,
-            frame.flags_complete,
-            frame.flags_follows
-        )
-    elif isinstance(frame, SetupFrame):
-        logger().debug(
-            '%s: %s frame (type=%s, stream_id=%d, data_encoding=%s, '
-            'metadata_encoding=%s, data=%s, metadata=%s, lease=%s)',
-            log_identifier,
-            direction,
-            frame.frame_type.name,
-            frame.stream_id,
-            frame.data_encoding,
-            frame.metadata_encoding,
-            frame.data,
-            frame.metadata,
-            frame.flags_lease
-        )
-    elif isinstance(frame, RequestStreamFrame):
-        logger().debug(
-            '%s: %s frame (type=%s, stream_id=%d, n=%d)',
-            log_identifier,
-            direction,
-            frame.frame_type.name,
-            frame.stream_id,
-            frame.initial_request_n
-        )
-    else:
-        logger().debug(
-            '%s: %s frame (type=%s, stream_id=%d, complete=%s)',
-            log_identifier,
-            direction,
-            frame.frame_type.name,
-            frame.stream_id,
-            frame.flags_complete
-        )
+        _logger.debug('%s: Received invalid frame', log_identifier)
+        return
+
+    frame_type = type(frame)
+    _logger.debug(_log_format_by_type.get(frame_type, _default_log_format),
+                  log_identifier,
+                  direction,
+                  frame.frame_type.name,
+                  frame.stream_id,
+                  *(getattr(frame, attribute)
+                    for _, attribute in _frame_fields_by_type.get(frame_type, _default_frame_fields)))
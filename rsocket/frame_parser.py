@@ -1,42 +1,134 @@
-import struct
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Generator, Union, Optional
 
 from rsocket import frame
+from rsocket.frame import Frame, InvalidFrame
+from rsocket.frame_helpers import unpack_24bit
 from rsocket.logger import logger
 
 __all__ = ['FrameParser']
 
-from rsocket.frame import Frame, InvalidFrame
+_MAX_RETAINED_BUFFER_SIZE = 1024 * 1024
 
 
 class FrameParser:
-    def __init__(self):
+    """
+    :param zero_copy: when enabled, the data and metadata of parsed frames are memoryview instances instead of bytes.
+     Each frame is copied once out of the receive buffer into its own immutable bytes object, and the views reference it.
+     A view stays valid for as long as it is referenced, and keeps the whole frame alive while it is.
+     Use memoryview.tobytes() to keep a copy of the content independent of the frame.
+
+    Received data is either appended using parse_frames/receive_data, or written directly into the buffer
+    returned by get_buffer, followed by a call to buffer_updated (see asyncio.BufferedProtocol).
+    """
+
+    __slots__ = (
+        '_buffer',
+        '_offset',
+        '_end',
+        '_zero_copy'
+    )
+
+    def __init__(self, zero_copy: bool = False):
         self._buffer = bytearray()
+        self._offset = 0
+        self._end = 0
+        self._zero_copy = zero_copy
 
     async def receive_data(self, data: bytes, header_length=3) -> AsyncGenerator[Frame, None]:
-        self._buffer.extend(data)
-        total = len(self._buffer)
+        for next_frame in self.parse_frames(data, header_length):
+            yield next_frame
+
+    def parse_frames(self, data: bytes, header_length=3) -> Generator[Union[Frame, InvalidFrame], None, None]:
+        if header_length == 0:
+            yield from self._parse_message(data)
+            return
+
+        self._compact()
+        self._buffer[self._end:self._end + len(data)] = data
+        self._end += len(data)
+
+        yield from self._parse_buffered_frames(header_length)
+
+    def get_buffer(self, size: int) -> memoryview:
+        """
+        Returns a writable view of at least size bytes at the end of the received data. The view must be
+        released before the next call to get_buffer, as the buffer may be resized.
+        """
+
+        if len(self._buffer) - self._end < size:
+            self._compact()
+
+            missing = size - (len(self._buffer) - self._end)
+
+            if missing > 0:
+                self._buffer.extend(bytes(missing))
+
+        return memoryview(self._buffer)[self._end:]
+
+    def buffer_updated(self, byte_count: int) -> Generator[Union[Frame, InvalidFrame], None, None]:
+        self._end += byte_count
+        return self._parse_buffered_frames()
 
-        frame_length_byte_count = header_length
+    def _parse_buffered_frames(self, header_length=3) -> Generator[Union[Frame, InvalidFrame], None, None]:
+        while True:
+            available = self._end - self._offset
 
-        while total >= frame_length_byte_count:
-            if header_length > 0:
-                length = struct.unpack('>I', b'\x00' + self._buffer[:frame_length_byte_count])[0]
-            else:
-                length = len(data)
+            if available < header_length:
+                return
+
+            length = unpack_24bit(self._buffer, self._offset)
 
-            if total < length + frame_length_byte_count:
+            frame_start = self._offset + header_length
+            frame_end = frame_start + length
+
+            if frame_end > self._end:
                 return
 
-            try:
-                new_frame = frame.parse_or_ignore(
-                    self._buffer[frame_length_byte_count:length + frame_length_byte_count])
+            self._offset = frame_end
+
+            new_frame = self._parse_frame(self._frame_buffer(frame_start, frame_end))
+
+            if new_frame is not None:
+                yield new_frame
+
+    def _parse_message(self, data: bytes) -> Generator[Union[Frame, InvalidFrame], None, None]:
+        if len(data) == 0:
+            return
+
+        if self._zero_copy:
+            data = memoryview(data if isinstance(data, bytes) else bytes(data))
+
+        new_frame = self._parse_frame(data)
+
+        if new_frame is not None:
+            yield new_frame
+
+    # noinspection PyMethodMayBeStatic
+    def _parse_frame(self, buffer) -> Optional[Union[Frame, InvalidFrame]]:
+        try:
+            return frame.parse_or_ignore(buffer)
+        except Exception:
+            logger().error('Error parsing frame', exc_info=True)
+            return InvalidFrame()
+
+    def _frame_buffer(self, start: int, end: int):
+        if self._zero_copy:
+            with memoryview(self._buffer) as buffer_view:
+                return memoryview(buffer_view[start:end].tobytes())
+
+        return self._buffer[start:end]
+
+    def _compact(self):
+        """Move the pending (not yet parsed) data to the start of the buffer, discarding the consumed prefix."""
+        if self._offset == 0:
+            return
+
+        pending = self._end - self._offset
 
-                if new_frame is not None:
-                    yield new_frame
-            except Exception:
-                logger().error('Error parsing frame', exc_info=True)
-                yield InvalidFrame()
+        if pending > 0:
+            self._buffer[:pending] = self._buffer[self._offset:self._end]
+        elif len(self._buffer) > _MAX_RETAINED_BUFFER_SIZE:
+            self._buffer = bytearray()
 
-            self._buffer = self._buffer[length + frame_length_byte_count:]
-            total -= length + frame_length_byte_count
+        self._offset = 0
+        self._end = pending
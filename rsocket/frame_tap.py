@@ -0,0 +1,61 @@
+import abc
+import logging
+from typing import Optional
+
+from rsocket.frame import Frame, InvalidFrame
+from rsocket.frame_logger import frame_fields
+from rsocket.logger import logger
+
+__all__ = ['FrameTap', 'LoggingFrameTap']
+
+
+class FrameTap(metaclass=abc.ABCMeta):
+    """
+    Observes every frame sent or received by an RSocket (see RSocketBase.set_frame_tap). Called from the sender and
+    receiver, so it should return quickly and not raise.
+    """
+
+    @abc.abstractmethod
+    def on_frame(self, frame: Frame, direction: str, log_identifier: str):
+        """
+        :param direction: 'Received', 'Sent' or 'Resent' (sent again after resuming a session)
+        :param log_identifier: 'client' or 'server'
+        """
+
+
+class LoggingFrameTap(FrameTap):
+    """
+    Logs one of every sample_every frames. The frame fields are also attached to the log record as a dict, in its
+    rsocket_frame attribute, for structured log handlers.
+    """
+
+    __slots__ = (
+        '_logger',
+        '_level',
+        '_sample_every',
+        '_frame_count'
+    )
+
+    def __init__(self,
+                 level: int = logging.INFO,
+                 sample_every: int = 1,
+                 frame_logger: Optional[logging.Logger] = None):
+        self._logger = frame_logger or logger()
+        self._level = level
+        self._sample_every = sample_every
+        self._frame_count = 0
+
+    def on_frame(self, frame: Frame, direction: str, log_identifier: str):
+        self._frame_count += 1
+
+        if self._frame_count < self._sample_every:
+            return
+
+        self._frame_count = 0
+
+        if isinstance(frame, InvalidFrame) or not self._logger.isEnabledFor(self._level):
+            return
+
+        fields = frame_fields(frame)
+        self._logger.log(self._level, '%s: %s frame %s', log_identifier, direction, fields,
+                         extra={'rsocket_frame': dict(fields, direction=direction, connection=log_identifier)})
@@ -10,6 +10,7 @@ from rsocket.helpers import payload_from_frame
 from rsocket.logger import logger
 from rsocket.payload import Payload
 from rsocket.rsocket import RSocket
+from rsocket.streams.outbound_demand import OutboundDemand
 from rsocket.streams.stream_handler import StreamHandler
 
 
@@ -19,6 +20,11 @@ class StreamSubscriber(DefaultSubscriber):
         self._stream_id = stream_id
         self._socket = socket
         self._requester = requester
+        self._demand: Optional[OutboundDemand] = None
+
+    def on_subscribe(self, subscription: Subscription):
+        self._demand = OutboundDemand(self._socket, subscription)
+        super().on_subscribe(self._demand)
 
     def on_next(self, value, is_complete=False):
         self._socket.send_payload(
@@ -26,6 +32,8 @@ class StreamSubscriber(DefaultSubscriber):
 
         if is_complete:
             self._requester.mark_completed_and_finish(sent=True)
+        elif self._demand is not None:
+            self._demand.item_sent()
 
     def on_complete(self):
         self._socket.send_payload(
@@ -76,6 +84,13 @@ class RequestChannelCommon(StreamHandler, Publisher, Subscription, metaclass=abc
             self.remote_subscriber.on_error(error_frame_to_exception(frame))
             self.mark_completed_and_finish(received=True)
 
+    def stopped_locally(self, frame: ErrorFrame):
+        if self.subscriber is not None and self.subscriber.subscription is not None:
+            self.subscriber.subscription.cancel()
+
+        if self.remote_subscriber is not None:
+            self.remote_subscriber.on_error(error_frame_to_exception(frame))
+
     def _complete_remote_subscriber(self):
         if self.remote_subscriber is not None:
             self.remote_subscriber.on_complete()
@@ -1,6 +1,6 @@
 from asyncio import Future
 
-from rsocket.frame import CancelFrame, Frame
+from rsocket.frame import CancelFrame, Frame, ErrorFrame
 from rsocket.rsocket import RSocket
 from rsocket.streams.stream_handler import StreamHandler
 
@@ -25,6 +25,6 @@ class RequestResponseResponder(StreamHandler):
         self._finish_stream()
 
     def frame_received(self, frame: Frame):
-        if isinstance(frame, CancelFrame):
+        if isinstance(frame, (CancelFrame, ErrorFrame)):
             self.future.cancel()
             self._finish_stream()
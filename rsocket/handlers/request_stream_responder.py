@@ -1,9 +1,13 @@
+from typing import Optional
+
 from reactivestreams.publisher import Publisher
 from reactivestreams.subscriber import DefaultSubscriber
+from reactivestreams.subscription import Subscription
 from rsocket.frame import CancelFrame, RequestNFrame, \
-    RequestStreamFrame, Frame
+    RequestStreamFrame, Frame, ErrorFrame
 from rsocket.payload import Payload
 from rsocket.rsocket import RSocket
+from rsocket.streams.outbound_demand import OutboundDemand
 from rsocket.streams.stream_handler import StreamHandler
 
 
@@ -12,6 +16,11 @@ class StreamSubscriber(DefaultSubscriber):
         super().__init__()
         self.stream_id = stream_id
         self.socket = socket
+        self._demand: Optional[OutboundDemand] = None
+
+    def on_subscribe(self, subscription: Subscription):
+        self._demand = OutboundDemand(self.socket, subscription)
+        super().on_subscribe(self._demand)
 
     def on_next(self, value: Payload, is_complete=False):
         self.socket.send_payload(
@@ -19,6 +28,8 @@ class StreamSubscriber(DefaultSubscriber):
 
         if is_complete:
             self.socket.finish_stream(self.stream_id)
+        elif self._demand is not None:
+            self._demand.item_sent()
 
     def on_complete(self):
         self.socket.send_payload(
@@ -46,8 +57,10 @@ class RequestStreamResponder(StreamHandler):
         if isinstance(frame, RequestStreamFrame):
             self.setup()
             self.subscriber.subscription.request(frame.initial_request_n)
-        elif isinstance(frame, CancelFrame):
-            self.subscriber.subscription.cancel()
+        elif isinstance(frame, (CancelFrame, ErrorFrame)):
+            if self.subscriber is not None:
+                self.subscriber.subscription.cancel()
+
             self._finish_stream()
         elif isinstance(frame, RequestNFrame):
             self.subscriber.subscription.request(frame.request_n)
@@ -3,7 +3,7 @@ from asyncio import Task
 from contextlib import contextmanager
 from typing import Any
 from typing import TypeVar
-from typing import Union, Callable, Optional, Tuple
+from typing import Union, Callable, Optional, Tuple, Iterable, Dict
 
 from reactivestreams.publisher import DefaultPublisher
 from reactivestreams.subscriber import Subscriber
@@ -60,6 +60,35 @@ class WellKnownType:
         return hash((self.id, self.name))
 
 
+class WellKnownTypeTable:
+    """
+    Well known types by id and by name. Names are looked up as bytes or str (and bytes-like types, e.g. memoryview).
+    """
+
+    __slots__ = (
+        '_by_id',
+        '_by_name'
+    )
+
+    def __init__(self, well_known_types: Iterable[WellKnownType]):
+        self._by_id: Dict[int, WellKnownType] = {}
+        self._by_name: Dict[Union[bytes, str], WellKnownType] = {}
+
+        for well_known_type in well_known_types:
+            self._by_id[well_known_type.id] = well_known_type
+            self._by_name[well_known_type.name] = well_known_type
+            self._by_name[well_known_type.name.decode()] = well_known_type
+
+    def get_by_id(self, id_: int) -> Optional[WellKnownType]:
+        return self._by_id.get(id_)
+
+    def get_by_name(self, name: Union[bytes, bytearray, memoryview, str]) -> Optional[WellKnownType]:
+        if isinstance(name, (bytearray, memoryview)):
+            name = bytes(name)
+
+        return self._by_name.get(name)
+
+
 @contextmanager
 def wrap_transport_exception():
     try:
@@ -82,6 +111,9 @@ def noop(*args, **kwargs):
     pass
 
 
+_well_known_type_id_bytes = tuple(bytes((1 << 7 | id_,)) for id_ in range(128))
+
+
 def serialize_well_known_encoding(
         encoding: Union[bytes, WellKnownType],
         encoding_parser: Callable[[bytes], Optional[WellKnownType]]) -> bytes:
@@ -93,20 +125,24 @@ def serialize_well_known_encoding(
     if known_type is None:
         serialized = serialize_128max_value(encoding)
     else:
-        serialized = ((1 << 7) | known_type.id & 0b1111111).to_bytes(1, 'big')
+        serialized = _well_known_type_id_bytes[known_type.id & 0b1111111]
 
     return serialized
 
 
-def parse_well_known_encoding(buffer: bytes, encoding_name_provider: Callable[[WellKnownType], V]) -> Tuple[bytes, int]:
-    is_known_mime_id, mime_length_or_type = parse_type(buffer)
+def parse_well_known_encoding(buffer: bytes,
+                              encoding_name_provider: Callable[[WellKnownType], V],
+                              start: int = 0) -> Tuple[bytes, int]:
+    """Returns the encoding at start, and its serialized length."""
+
+    is_known_mime_id, mime_length_or_type = parse_type(buffer, start)
 
     if is_known_mime_id:
         metadata_encoding = encoding_name_provider(mime_length_or_type).name
         offset = 1
     else:
         real_mime_type_length = mime_length_or_type + 1  # mime length cannot be 0
-        metadata_encoding = bytes(buffer[1:1 + real_mime_type_length])
+        metadata_encoding = bytes(buffer[start + 1:start + 1 + real_mime_type_length])
         offset = 1 + real_mime_type_length
 
     return metadata_encoding, offset
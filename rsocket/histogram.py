@@ -0,0 +1,111 @@
+from typing import Dict, List, Tuple, Any, Optional
+
+__all__ = ['Histogram']
+
+
+class Histogram:
+    """
+    Log-linear histogram of non-negative integers. Values below 2**sub_bucket_bits have a bucket each. Above that,
+    every power of two range is split in 2**sub_bucket_bits equal buckets, so a bucket's width is at most
+    1/2**sub_bucket_bits of its values. Only non-empty buckets are stored.
+
+    Histograms with the same sub_bucket_bits are merged by adding their bucket counts, e.g. to aggregate the
+    histograms of several connections.
+    """
+
+    __slots__ = (
+        '_sub_bucket_bits',
+        '_counts',
+        'count',
+        'sum',
+        'min',
+        'max'
+    )
+
+    def __init__(self, sub_bucket_bits: int = 3):
+        self._sub_bucket_bits = sub_bucket_bits
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.sum = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def _bucket_index(self, value: int) -> int:
+        shift = value.bit_length() - self._sub_bucket_bits - 1
+
+        if shift < 0:
+            return value
+
+        return ((shift + 1) << self._sub_bucket_bits) + (value >> shift) - (1 << self._sub_bucket_bits)
+
+    def _bucket_range(self, index: int) -> Tuple[int, int]:
+        shift = (index >> self._sub_bucket_bits) - 1
+
+        if shift < 0:
+            return index, index + 1
+
+        lower = ((1 << self._sub_bucket_bits) + (index & ((1 << self._sub_bucket_bits) - 1))) << shift
+        return lower, lower + (1 << shift)
+
+    def record(self, value: int):
+        value = max(int(value), 0)
+        index = self._bucket_index(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.sum += value
+
+        if self.min is None or value < self.min:
+            self.min = value
+
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: 'Histogram'):
+        if other._sub_bucket_bits != self._sub_bucket_bits:
+            raise ValueError('Histograms with different bucket sizes can not be merged')
+
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+
+        self.count += other.count
+        self.sum += other.sum
+
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def buckets(self) -> List[Tuple[int, int, int]]:
+        """The non-empty buckets, as (lower bound, exclusive upper bound, count), ordered by value."""
+
+        return [self._bucket_range(index) + (self._counts[index],) for index in sorted(self._counts)]
+
+    def percentile(self, percent: float) -> Optional[int]:
+        """The upper bound of the bucket of the value at the given percentile (capped at the maximum value)."""
+
+        if self.count == 0:
+            return None
+
+        rank = max(percent / 100 * self.count, 1)
+        seen = 0
+
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+
+            if seen >= rank:
+                return min(self._bucket_range(index)[1] - 1, self.max)
+
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'buckets': self.buckets()
+        }
@@ -0,0 +1,168 @@
+from collections import defaultdict
+from typing import Dict, Any, List, Tuple
+
+from rsocket.frame import FrameType
+from rsocket.observer import RSocketObserver
+
+__all__ = ['MetricsCollector']
+
+
+class _Summary:
+    __slots__ = (
+        'count',
+        'sum',
+        'max'
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+
+        if value > self.max:
+            self.max = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'count': self.count, 'sum': self.sum, 'max': self.max}
+
+
+class MetricsCollector(RSocketObserver):
+    """
+    In-process metrics of the observed connections. Pass the same instance to several connections to aggregate them.
+    Export with snapshot() (a dict) or to_prometheus() (Prometheus text exposition format).
+    """
+
+    def __init__(self, prefix: str = 'rsocket'):
+        self._prefix = prefix
+        self._frames_sent: Dict[FrameType, int] = defaultdict(int)
+        self._bytes_sent: Dict[FrameType, int] = defaultdict(int)
+        self._frames_received: Dict[FrameType, int] = defaultdict(int)
+        self._bytes_received: Dict[FrameType, int] = defaultdict(int)
+        self._send_queue_depth = 0
+        self._send_queue_depth_max = 0
+        self._active_streams = 0
+        self._interactions: Dict[Tuple[FrameType, str], _Summary] = defaultdict(_Summary)
+        self._reassembled_frames = _Summary()
+        self._leases_sent = 0
+        self._leases_received = 0
+        self._lease_requests_granted = 0
+        self._lease_requests_received = 0
+        self._requests_rejected_by_lease: Dict[FrameType, int] = defaultdict(int)
+        self._keepalive_rtt = _Summary()
+
+    def frame_sent(self, frame_type: FrameType, size: int):
+        self._frames_sent[frame_type] += 1
+        self._bytes_sent[frame_type] += size
+
+    def frame_received(self, frame_type: FrameType, size: int):
+        self._frames_received[frame_type] += 1
+        self._bytes_received[frame_type] += size
+
+    def frames_dequeued(self, count: int, queue_depth: int):
+        self._send_queue_depth = queue_depth
+
+        if queue_depth > self._send_queue_depth_max:
+            self._send_queue_depth_max = queue_depth
+
+    def stream_started(self):
+        self._active_streams += 1
+
+    def stream_finished(self):
+        self._active_streams -= 1
+
+    def interaction_completed(self, interaction: FrameType, role: str, duration: float):
+        self._interactions[(interaction, role)].observe(duration)
+
+    def fragmented_frame_reassembled(self, frame_type: FrameType, size: int):
+        self._reassembled_frames.observe(size)
+
+    def lease_sent(self, number_of_requests: int, time_to_live: int):
+        self._leases_sent += 1
+        self._lease_requests_granted += number_of_requests
+
+    def lease_received(self, number_of_requests: int, time_to_live: int):
+        self._leases_received += 1
+        self._lease_requests_received += number_of_requests
+
+    def request_rejected_by_lease(self, interaction: FrameType):
+        self._requests_rejected_by_lease[interaction] += 1
+
+    def keepalive_rtt(self, rtt: float):
+        self._keepalive_rtt.observe(rtt)
+
+    def snapshot(self) -> Dict[str, Any]:
+        def by_name(values: Dict[FrameType, int]) -> Dict[str, int]:
+            return {frame_type.name: value for frame_type, value in values.items()}
+
+        return {
+            'frames_sent': by_name(self._frames_sent),
+            'bytes_sent': by_name(self._bytes_sent),
+            'frames_received': by_name(self._frames_received),
+            'bytes_received': by_name(self._bytes_received),
+            'send_queue_depth': self._send_queue_depth,
+            'send_queue_depth_max': self._send_queue_depth_max,
+            'active_streams': self._active_streams,
+            'interactions': [dict(interaction=interaction.name, role=role, **summary.to_dict())
+                             for (interaction, role), summary in self._interactions.items()],
+            'reassembled_frames': self._reassembled_frames.to_dict(),
+            'leases_sent': self._leases_sent,
+            'lease_requests_granted': self._lease_requests_granted,
+            'leases_received': self._leases_received,
+            'lease_requests_received': self._lease_requests_received,
+            'requests_rejected_by_lease': by_name(self._requests_rejected_by_lease),
+            'keepalive_rtt': self._keepalive_rtt.to_dict()
+        }
+
+    def to_prometheus(self) -> str:
+        lines: List[str] = []
+
+        def metric(name: str, metric_type: str, samples: List[Tuple[str, Dict[str, str], float]]):
+            full_name = '%s_%s' % (self._prefix, name)
+            lines.append('# TYPE %s %s' % (full_name, metric_type))
+
+            for suffix, labels, value in samples:
+                label_text = ','.join('%s="%s"' % label for label in labels.items())
+
+                if label_text:
+                    label_text = '{%s}' % label_text
+
+                lines.append('%s%s%s %s' % (full_name, suffix, label_text, _format_value(value)))
+
+        def by_frame_type(values: Dict[FrameType, int], label: str = 'frame_type'):
+            return [('', {label: frame_type.name}, value) for frame_type, value in values.items()]
+
+        def summary(values: _Summary, labels: Dict[str, str]):
+            return [('_count', labels, values.count), ('_sum', labels, values.sum)]
+
+        metric('frames_sent_total', 'counter', by_frame_type(self._frames_sent))
+        metric('sent_bytes_total', 'counter', by_frame_type(self._bytes_sent))
+        metric('frames_received_total', 'counter', by_frame_type(self._frames_received))
+        metric('received_bytes_total', 'counter', by_frame_type(self._bytes_received))
+        metric('send_queue_depth', 'gauge', [('', {}, self._send_queue_depth)])
+        metric('send_queue_depth_max', 'gauge', [('', {}, self._send_queue_depth_max)])
+        metric('active_streams', 'gauge', [('', {}, self._active_streams)])
+        metric('interaction_duration_seconds', 'summary',
+               [sample
+                for (interaction, role), values in self._interactions.items()
+                for sample in summary(values, {'interaction': interaction.name, 'role': role})])
+        metric('reassembled_frame_bytes', 'summary', summary(self._reassembled_frames, {}))
+        metric('leases_sent_total', 'counter', [('', {}, self._leases_sent)])
+        metric('lease_requests_granted_total', 'counter', [('', {}, self._lease_requests_granted)])
+        metric('leases_received_total', 'counter', [('', {}, self._leases_received)])
+        metric('lease_requests_received_total', 'counter', [('', {}, self._lease_requests_received)])
+        metric('requests_rejected_by_lease_total', 'counter',
+               by_frame_type(self._requests_rejected_by_lease, 'interaction'))
+        metric('keepalive_rtt_seconds', 'summary', summary(self._keepalive_rtt, {}))
+
+        return '\n'.join(lines) + '\n'
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+
+    return repr(value)
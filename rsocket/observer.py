@@ -0,0 +1,53 @@
+from rsocket.frame import FrameType
+
+__all__ = ['RSocketObserver', 'REQUESTER', 'RESPONDER']
+
+REQUESTER = 'requester'
+RESPONDER = 'responder'
+
+
+class RSocketObserver:
+    """
+    Receives the events of one or more RSocket connections (pass it as the observer option), e.g. to collect metrics
+    (see rsocket.metrics.MetricsCollector). The methods do nothing here: override the relevant ones. They are called
+    from the sender and receiver tasks, so they should return quickly and not raise.
+
+    Without an observer, none of the events are measured.
+    """
+
+    def frame_sent(self, frame_type: FrameType, size: int):
+        """A frame of size bytes (excluding the frame length prefix) was written to the transport."""
+
+    def frame_received(self, frame_type: FrameType, size: int):
+        """A frame of size bytes (excluding the frame length prefix) was read from the transport."""
+
+    def frames_dequeued(self, count: int, queue_depth: int):
+        """The sender took count frames from the send queue, leaving queue_depth frames."""
+
+    def stream_started(self):
+        """A stream was registered (requested by either side)."""
+
+    def stream_finished(self):
+        """A registered stream finished."""
+
+    def interaction_completed(self, interaction: FrameType, role: str, duration: float):
+        """
+        A request finished, duration seconds after it was sent (REQUESTER) or received (RESPONDER).
+
+        :param interaction: the type of the request frame (fire-and-forget requests are not reported)
+        """
+
+    def fragmented_frame_reassembled(self, frame_type: FrameType, size: int):
+        """A frame received in fragments was reassembled, with data and metadata of size bytes."""
+
+    def lease_sent(self, number_of_requests: int, time_to_live: int):
+        """A LEASE frame was sent, granting the peer number_of_requests requests for time_to_live milliseconds."""
+
+    def lease_received(self, number_of_requests: int, time_to_live: int):
+        """A LEASE frame was received, granting number_of_requests requests for time_to_live milliseconds."""
+
+    def request_rejected_by_lease(self, interaction: FrameType):
+        """A request was not allowed by the current lease, and was queued until the next one."""
+
+    def keepalive_rtt(self, rtt: float):
+        """A KEEPALIVE response was received rtt seconds after sending the KEEPALIVE."""
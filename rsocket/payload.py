@@ -1,14 +1,19 @@
 from typing import Union, Optional
 
-ByteTypes = Union[bytes, bytearray]
+ByteTypes = Union[bytes, bytearray, memoryview]
 
 
 class Payload:
+    """
+    The data and metadata are memoryview instances when received over a transport with zero_copy enabled,
+    use memoryview.tobytes() to get a bytes copy.
+    """
+
     __slots__ = ('data', 'metadata')
 
     @staticmethod
     def _check(obj):
-        assert obj is None or isinstance(obj, (bytes, bytearray))
+        assert obj is None or isinstance(obj, (bytes, bytearray, memoryview))
 
     def __init__(self, data: Optional[ByteTypes] = None, metadata: Optional[ByteTypes] = None):
         self._check(data)
@@ -27,11 +32,11 @@ class Payload:
         return "Payload({}, {})".format(self.data, self.metadata)
 
 
-def ensure_bytes(data: Optional[ByteTypes]) -> Optional[bytes]:
+def ensure_bytes(data: Optional[ByteTypes]) -> Optional[Union[bytes, memoryview]]:
     if data is None:
         return data
 
-    if isinstance(data, bytes):
+    if isinstance(data, (bytes, memoryview)):
         return data
 
     return bytes(data)
@@ -1,17 +1,25 @@
 import asyncio
 from abc import ABCMeta, abstractmethod
+from contextvars import ContextVar
 from datetime import timedelta
 from typing import Tuple, Optional
 
 from reactivestreams.publisher import Publisher
 from reactivestreams.subscriber import Subscriber
 from rsocket.error_codes import ErrorCode
-from rsocket.extensions.composite_metadata import CompositeMetadata
+from rsocket.extensions.composite_metadata import CompositeMetadata, composite_metadata_index
 from rsocket.helpers import create_error_future
 from rsocket.local_typing import Awaitable
 from rsocket.logger import logger
 from rsocket.payload import Payload
 
+handled_stream_id: ContextVar[Optional[int]] = ContextVar('handled_stream_id', default=None)
+
+
+def current_request_stream_id() -> Optional[int]:
+    """The stream id of the request being handled, when called from a request handler method."""
+    return handled_stream_id.get()
+
 
 class RequestHandler(metaclass=ABCMeta):
 
@@ -68,7 +76,7 @@ class RequestHandler(metaclass=ABCMeta):
     # noinspection PyMethodMayBeStatic
     def _parse_composite_metadata(self, metadata: bytes) -> CompositeMetadata:
         composite_metadata = CompositeMetadata()
-        composite_metadata.parse(metadata)
+        composite_metadata.set_index(composite_metadata_index(metadata))
         return composite_metadata
 
 
@@ -0,0 +1,107 @@
+from collections import deque
+from datetime import timedelta
+from typing import Optional, List, Dict, Tuple, Deque, TYPE_CHECKING
+
+from rsocket.frame import Frame, CONNECTION_STREAM_ID
+
+if TYPE_CHECKING:
+    from rsocket.rsocket_server import RSocketServer
+
+__all__ = ['ResumeBuffer', 'ResumableSessions', 'RESUME_BUFFER_SIZE', 'is_resumable_frame']
+
+RESUME_BUFFER_SIZE = 16 * 1024 * 1024
+
+
+def is_resumable_frame(frame: Frame) -> bool:
+    return frame.stream_id != CONNECTION_STREAM_ID
+
+
+class ResumeBuffer:
+    """
+    Frames sent on a resumable session which the peer did not yet acknowledge receiving, by implied position (the
+    total length of the resumable frames sent before them).
+
+    Frames are released as the peer reports its received position (KEEPALIVE, RESUME, RESUME_OK). If the retained
+    frames exceed max_size bytes, the oldest are dropped, and the session can no longer be resumed from before them.
+    """
+
+    __slots__ = (
+        '_frames',
+        '_first_position',
+        '_position',
+        '_size',
+        '_max_size'
+    )
+
+    def __init__(self, max_size: int = RESUME_BUFFER_SIZE):
+        self._frames: Deque[Tuple[Frame, int]] = deque()
+        self._first_position = 0
+        self._position = 0
+        self._size = 0
+        self._max_size = max_size
+
+    def append(self, frame: Frame):
+        length = frame.length or len(frame.serialize())
+        self._frames.append((frame, length))
+        self._position += length
+        self._size += length
+
+        while self._size > self._max_size:
+            self._release_first()
+
+    def release(self, position: int):
+        while self._frames and self._first_position + self._frames[0][1] <= position:
+            self._release_first()
+
+    def _release_first(self):
+        frame, length = self._frames.popleft()
+        self._first_position += length
+        self._size -= length
+
+    def frames_from(self, position: int) -> Optional[List[Frame]]:
+        """Frames sent after the given position, or None if they are not available (anymore)."""
+
+        if position < self._first_position or position > self._position:
+            return None
+
+        self.release(position)
+
+        if self._first_position != position:
+            return None
+
+        return [frame for frame, _ in self._frames]
+
+    def first_position(self) -> int:
+        return self._first_position
+
+    def position(self) -> int:
+        return self._position
+
+    def size(self) -> int:
+        return self._size
+
+
+class ResumableSessions:
+    """
+    Resumable sessions by resume token. Share one instance between the servers created for each accepted connection,
+    so a connection which sends RESUME continues the session established by an earlier connection.
+
+    :param session_timeout: how long the session of a lost connection is kept, waiting to be resumed
+    """
+
+    def __init__(self, session_timeout: timedelta = timedelta(minutes=1)):
+        self.session_timeout = session_timeout
+        self._sessions: Dict[bytes, 'RSocketServer'] = {}
+
+    def add(self, token: bytes, server: 'RSocketServer'):
+        self._sessions[token] = server
+
+    def get(self, token: bytes) -> Optional['RSocketServer']:
+        return self._sessions.get(token)
+
+    def remove(self, token: bytes, server: 'RSocketServer'):
+        if self._sessions.get(token) is server:
+            del self._sessions[token]
+
+    def __len__(self) -> int:
+        return len(self._sessions)
@@ -1,20 +1,85 @@
+from functools import partial
 from inspect import signature, Parameter
-from typing import Callable, Any
+from typing import Callable, Any, Optional, List, Tuple, Dict
 
 from rsocket.extensions.composite_metadata import CompositeMetadata
 from rsocket.frame import FrameType
 from rsocket.payload import Payload
+from rsocket.routing.route_trie import RouteTemplate, RouteTrie, is_route_template, ROUTE_SEGMENT_SEPARATOR
 from rsocket.rsocket import RSocket
 
 decorated_method = Callable[[RSocket, Payload, CompositeMetadata], Any]
 
 
-def decorator_factory(container: dict, route: str):
+def _default_payload_mapper(cls, payload):
+    return payload
+
+
+class _RouteProcessor:
+    """
+    A route handler, with the arguments it accepts (and the payload mapping) resolved once, when the route is
+    registered, instead of inspecting its signature on every request. Route template variables are passed to the
+    handler if it has a parameter of the same name (or accepts any keyword arguments).
+    """
+
+    __slots__ = (
+        'function',
+        'route',
+        '_accepts_payload',
+        '_accepts_composite_metadata',
+        '_map_payload',
+        '_route_variables'
+    )
+
+    def __init__(self,
+                 function: decorated_method,
+                 route: str,
+                 payload_mapper: Callable[[Any, Payload], Any],
+                 route_variables: List[Tuple[str, int]] = ()):
+        parameters = signature(function).parameters
+        accepts_any_keyword = any(parameter.kind == Parameter.VAR_KEYWORD for parameter in parameters.values())
+
+        self.function = function
+        self.route = route
+        self._accepts_payload = 'payload' in parameters
+        self._accepts_composite_metadata = 'composite_metadata' in parameters
+        self._map_payload: Optional[Callable[[Payload], Any]] = None
+        self._route_variables = tuple((name, index) for name, index in route_variables
+                                      if accepts_any_keyword or name in parameters)
+
+        if self._accepts_payload:
+            payload_expected_type = parameters['payload'].annotation
+
+            if payload_expected_type is not Payload and payload_expected_type is not Parameter.empty:
+                self._map_payload = partial(payload_mapper, payload_expected_type)
+
+    def __call__(self,
+                 payload: Payload,
+                 composite_metadata: CompositeMetadata,
+                 route_segments: Optional[List[str]] = None):
+        route_kwargs = {}
+
+        for name, index in self._route_variables:
+            route_kwargs[name] = route_segments[index]
+
+        if self._accepts_payload:
+            if self._map_payload is not None:
+                payload = self._map_payload(payload)
+
+            route_kwargs['payload'] = payload
+
+        if self._accepts_composite_metadata:
+            route_kwargs['composite_metadata'] = composite_metadata
+
+        return self.function(**route_kwargs)
+
+
+def decorator_factory(container: dict, route: str, payload_mapper=_default_payload_mapper):
     def decorator(function: decorated_method):
         if route in container:
             raise KeyError('Duplicate route "%s" already registered', route)
 
-        container[route] = function
+        container[route] = _RouteProcessor(function, route, payload_mapper)
         return function
 
     return decorator
@@ -28,10 +93,11 @@ class RequestRouter:
         '_fnf_routes',
         '_metadata_push',
         '_route_map_by_frame_type',
+        '_template_routes_by_frame_type',
         '_payload_mapper'
     )
 
-    def __init__(self, payload_mapper=lambda cls, _: _):
+    def __init__(self, payload_mapper=_default_payload_mapper):
         self._payload_mapper = payload_mapper
         self._channel_routes = {}
         self._stream_routes = {}
@@ -47,20 +113,42 @@ class RequestRouter:
             FrameType.METADATA_PUSH: self._metadata_push,
         }
 
+        self._template_routes_by_frame_type: Dict[FrameType, RouteTrie[_RouteProcessor]] = {
+            frame_type: RouteTrie() for frame_type in self._route_map_by_frame_type
+        }
+
     def response(self, route: str):
-        return decorator_factory(self._response_routes, route)
+        return self._decorator(FrameType.REQUEST_RESPONSE, route)
 
     def stream(self, route: str):
-        return decorator_factory(self._stream_routes, route)
+        return self._decorator(FrameType.REQUEST_STREAM, route)
 
     def channel(self, route: str):
-        return decorator_factory(self._channel_routes, route)
+        return self._decorator(FrameType.REQUEST_CHANNEL, route)
 
     def fire_and_forget(self, route: str):
-        return decorator_factory(self._fnf_routes, route)
+        return self._decorator(FrameType.REQUEST_FNF, route)
 
     def metadata_push(self, route: str):
-        return decorator_factory(self._metadata_push, route)
+        return self._decorator(FrameType.METADATA_PUSH, route)
+
+    def _decorator(self, frame_type: FrameType, route: str):
+        """
+        Static routes are matched exactly. Routes with variables (``{name}``) or wildcards (``*``, ``**``) are
+        matched segment by segment (see RouteTemplate), only if no static route matches.
+        """
+
+        if not is_route_template(route):
+            return decorator_factory(self._route_map_by_frame_type[frame_type], route, self._payload_mapper)
+
+        template = RouteTemplate(route)
+        template_routes = self._template_routes_by_frame_type[frame_type]
+
+        def decorator(function: decorated_method):
+            template_routes.add(template, _RouteProcessor(function, route, self._payload_mapper, template.variables))
+            return function
+
+        return decorator
 
     async def route(self,
                     frame_type: FrameType,
@@ -68,27 +156,26 @@ class RequestRouter:
                     payload: Payload,
                     composite_metadata: CompositeMetadata):
 
-        if route in self._route_map_by_frame_type[frame_type]:
-            route_processor = self._route_map_by_frame_type[frame_type][route]
-            route_kwargs = await self._collect_route_arguments(route_processor,
-                                                               payload,
-                                                               composite_metadata)
+        route_processor, route_segments = self._find_route_processor(frame_type, route)
 
-            return await route_processor(**route_kwargs)
+        if route_processor is not None:
+            return await route_processor(payload, composite_metadata, route_segments)
 
-    async def _collect_route_arguments(self, route_processor, payload, composite_metadata):
-        route_signature = signature(route_processor)
-        route_kwargs = {}
+    def registered_route(self, frame_type: FrameType, route: str) -> Optional[str]:
+        """The registered route (or route template) which route is routed to, if any."""
 
-        if 'payload' in route_signature.parameters:
-            payload_expected_type = route_signature.parameters['payload']
+        route_processor, _ = self._find_route_processor(frame_type, route)
 
-            if payload_expected_type is not Payload and payload_expected_type is not Parameter:
-                payload = self._payload_mapper(payload_expected_type, payload)
+        if route_processor is not None:
+            return route_processor.route
 
-            route_kwargs['payload'] = payload
+    def _find_route_processor(self,
+                              frame_type: FrameType,
+                              route: str) -> Tuple[Optional[_RouteProcessor], Optional[List[str]]]:
+        route_processor = self._route_map_by_frame_type[frame_type].get(route)
 
-        if 'composite_metadata' in route_signature.parameters:
-            route_kwargs['composite_metadata'] = composite_metadata
+        if route_processor is not None:
+            return route_processor, None
 
-        return route_kwargs
+        route_segments = route.split(ROUTE_SEGMENT_SEPARATOR)
+        return self._template_routes_by_frame_type[frame_type].match(route_segments), route_segments
@@ -0,0 +1,243 @@
+import asyncio
+from collections import deque
+from datetime import timedelta
+from typing import Dict, Tuple, Optional, NamedTuple, Deque, Any
+
+from reactivestreams.publisher import Publisher
+from reactivestreams.subscriber import Subscriber
+from reactivestreams.subscription import Subscription
+from rsocket.frame import FrameType
+from rsocket.histogram import Histogram
+from rsocket.logger import logger
+
+__all__ = ['RouteMetrics', 'RouteStatistics', 'SlowRequest', 'UNKNOWN_ROUTE']
+
+UNKNOWN_ROUTE = '<unknown>'
+
+
+class SlowRequest(NamedTuple):
+    interaction: FrameType
+    route: str
+    stream_id: Optional[int]
+    metadata_size: int
+    duration: float
+
+
+class RouteStatistics:
+    """Histograms of the requests to a route: durations in microseconds and the number of payloads sent."""
+
+    __slots__ = (
+        'time_to_first_payload',
+        'duration',
+        'items'
+    )
+
+    def __init__(self, sub_bucket_bits: int):
+        self.time_to_first_payload = Histogram(sub_bucket_bits)
+        self.duration = Histogram(sub_bucket_bits)
+        self.items = Histogram(sub_bucket_bits)
+
+    def merge(self, other: 'RouteStatistics'):
+        self.time_to_first_payload.merge(other.time_to_first_payload)
+        self.duration.merge(other.duration)
+        self.items.merge(other.items)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'time_to_first_payload': self.time_to_first_payload.to_dict(),
+            'duration': self.duration.to_dict(),
+            'items': self.items.to_dict()
+        }
+
+
+class RouteMetrics:
+    """
+    Latency histograms per interaction type and route, recorded by RoutingRequestHandler (see its route_metrics
+    option). Requests are grouped by the route (or route template) they were routed to. Share an instance between
+    the handlers of several connections, or merge the instances of separate ones.
+
+    Requests lasting at least slow_request_threshold are logged, and the latest max_slow_requests are kept in
+    slow_requests.
+    """
+
+    def __init__(self,
+                 slow_request_threshold: Optional[timedelta] = None,
+                 max_slow_requests: int = 100,
+                 sub_bucket_bits: int = 3):
+        self._slow_request_threshold = (slow_request_threshold.total_seconds()
+                                        if slow_request_threshold is not None else None)
+        self._sub_bucket_bits = sub_bucket_bits
+        self._statistics: Dict[Tuple[FrameType, str], RouteStatistics] = {}
+        self.slow_requests: Deque[SlowRequest] = deque(maxlen=max_slow_requests)
+
+    def statistics(self, interaction: FrameType, route: str) -> RouteStatistics:
+        key = (interaction, route)
+        statistics = self._statistics.get(key)
+
+        if statistics is None:
+            statistics = self._statistics[key] = RouteStatistics(self._sub_bucket_bits)
+
+        return statistics
+
+    def record(self,
+               interaction: FrameType,
+               route: str,
+               duration: float,
+               time_to_first_payload: Optional[float] = None,
+               items: Optional[int] = None,
+               stream_id: Optional[int] = None,
+               metadata_size: int = 0):
+        """
+        :param duration: seconds from receiving the request until it was handled (the last payload was sent)
+        :param time_to_first_payload: seconds from receiving the request until the first payload was sent
+        :param items: the number of payloads sent
+        """
+
+        statistics = self.statistics(interaction, route)
+        statistics.duration.record(duration * 1000000)
+
+        if time_to_first_payload is not None:
+            statistics.time_to_first_payload.record(time_to_first_payload * 1000000)
+
+        if items is not None:
+            statistics.items.record(items)
+
+        if self._slow_request_threshold is not None and duration >= self._slow_request_threshold:
+            slow_request = SlowRequest(interaction, route, stream_id, metadata_size, duration)
+            self.slow_requests.append(slow_request)
+            logger().warning('Slow request: %s', slow_request)
+
+    def merge(self, other: 'RouteMetrics'):
+        for (interaction, route), statistics in other._statistics.items():
+            self.statistics(interaction, route).merge(statistics)
+
+        self.slow_requests.extend(other.slow_requests)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'routes': [dict(interaction=interaction.name, route=route, **statistics.to_dict())
+                       for (interaction, route), statistics in self._statistics.items()],
+            'slow_requests': [slow_request._replace(interaction=slow_request.interaction.name)._asdict()
+                              for slow_request in self.slow_requests]
+        }
+
+
+class RequestMeasurement:
+    __slots__ = (
+        '_metrics',
+        '_interaction',
+        '_route',
+        '_stream_id',
+        '_metadata_size',
+        '_started_at',
+        '_time_to_first_payload',
+        '_items',
+        '_finished'
+    )
+
+    def __init__(self,
+                 metrics: RouteMetrics,
+                 interaction: FrameType,
+                 stream_id: Optional[int],
+                 metadata_size: int):
+        self._metrics = metrics
+        self._interaction = interaction
+        self._route = UNKNOWN_ROUTE
+        self._stream_id = stream_id
+        self._metadata_size = metadata_size
+        self._started_at = asyncio.get_event_loop().time()
+        self._time_to_first_payload: Optional[float] = None
+        self._items = 0
+        self._finished = False
+
+    def set_route(self, route: str):
+        self._route = route
+
+    def payload_sent(self):
+        if self._items == 0:
+            self._time_to_first_payload = asyncio.get_event_loop().time() - self._started_at
+
+        self._items += 1
+
+    def finish(self, count_items: bool = True):
+        if self._finished:
+            return
+
+        self._finished = True
+        self._metrics.record(self._interaction,
+                             self._route,
+                             asyncio.get_event_loop().time() - self._started_at,
+                             self._time_to_first_payload,
+                             self._items if count_items else None,
+                             self._stream_id,
+                             self._metadata_size)
+
+    def future_done(self, future: asyncio.Future):
+        if not future.cancelled() and future.exception() is None:
+            self.payload_sent()
+
+        self.finish()
+
+
+class MeasuredPublisher(Publisher):
+    """Counts the payloads a publisher sends to its subscriber, and finishes the measurement when it stops."""
+
+    __slots__ = (
+        '_publisher',
+        '_measurement'
+    )
+
+    def __init__(self, publisher: Publisher, measurement: RequestMeasurement):
+        self._publisher = publisher
+        self._measurement = measurement
+
+    def subscribe(self, subscriber: Subscriber):
+        self._publisher.subscribe(_MeasuredSubscriber(subscriber, self._measurement))
+
+
+class _MeasuredSubscriber(Subscriber):
+    __slots__ = (
+        '_subscriber',
+        '_measurement'
+    )
+
+    def __init__(self, subscriber: Subscriber, measurement: RequestMeasurement):
+        self._subscriber = subscriber
+        self._measurement = measurement
+
+    def on_subscribe(self, subscription: Subscription):
+        self._subscriber.on_subscribe(_MeasuredSubscription(subscription, self._measurement))
+
+    def on_next(self, value, is_complete=False):
+        self._measurement.payload_sent()
+
+        if is_complete:
+            self._measurement.finish()
+
+        self._subscriber.on_next(value, is_complete)
+
+    def on_error(self, exception: Exception):
+        self._measurement.finish()
+        self._subscriber.on_error(exception)
+
+    def on_complete(self):
+        self._measurement.finish()
+        self._subscriber.on_complete()
+
+
+class _MeasuredSubscription(Subscription):
+    __slots__ = (
+        '_subscription',
+        '_measurement'
+    )
+
+    def __init__(self, subscription: Subscription, measurement: RequestMeasurement):
+        self._subscription = subscription
+        self._measurement = measurement
+
+    def request(self, n: int):
+        self._subscription.request(n)
+
+    def cancel(self):
+        self._measurement.finish()
+        self._subscription.cancel()
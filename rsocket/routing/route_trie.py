@@ -0,0 +1,137 @@
+from typing import Optional, Dict, List, Tuple, Generic, TypeVar
+
+from rsocket.exceptions import RSocketValueError
+
+__all__ = ['RouteTemplate', 'RouteTrie', 'is_route_template', 'ROUTE_SEGMENT_SEPARATOR']
+
+T = TypeVar('T')
+
+ROUTE_SEGMENT_SEPARATOR = '.'
+SEGMENT_WILDCARD = '*'
+TAIL_WILDCARD = '**'
+
+
+def _is_variable_segment(segment: str) -> bool:
+    return len(segment) > 2 and segment.startswith('{') and segment.endswith('}')
+
+
+def is_route_template(route: str) -> bool:
+    return '{' in route or SEGMENT_WILDCARD in route
+
+
+class RouteTemplate:
+    """
+    A route of dot separated segments, where a segment may be:
+
+    - ``{name}``: matches any single segment, captured as the variable name
+    - ``*``: matches any single segment
+    - ``**``: (last segment only) matches the remaining segments, if any
+    """
+
+    __slots__ = (
+        'route',
+        'segments',
+        'variables'
+    )
+
+    def __init__(self, route: str):
+        self.route = route
+        self.segments = route.split(ROUTE_SEGMENT_SEPARATOR)
+        self.variables: List[Tuple[str, int]] = []
+
+        for index, segment in enumerate(self.segments):
+            if segment == TAIL_WILDCARD:
+                if index != len(self.segments) - 1:
+                    raise RSocketValueError('"%s" is only allowed as the last segment of route "%s"' % (
+                        TAIL_WILDCARD, route))
+            elif _is_variable_segment(segment):
+                name = segment[1:-1]
+
+                if not name.isidentifier():
+                    raise RSocketValueError('Invalid variable name "%s" in route "%s"' % (name, route))
+
+                if name in (variable for variable, _ in self.variables):
+                    raise RSocketValueError('Duplicate variable "%s" in route "%s"' % (name, route))
+
+                self.variables.append((name, index))
+            elif segment != SEGMENT_WILDCARD and ('{' in segment or '}' in segment or SEGMENT_WILDCARD in segment):
+                raise RSocketValueError('Invalid segment "%s" in route "%s"' % (segment, route))
+
+
+class _RouteTrieNode(Generic[T]):
+    __slots__ = (
+        'children',
+        'segment_child',
+        'value',
+        'tail_value'
+    )
+
+    def __init__(self):
+        self.children: Dict[str, '_RouteTrieNode[T]'] = {}
+        self.segment_child: Optional['_RouteTrieNode[T]'] = None
+        self.value: Optional[T] = None
+        self.tail_value: Optional[T] = None
+
+
+class RouteTrie(Generic[T]):
+    """
+    Route templates by segment. Matching prefers literal segments over single segment wildcards (variables and ``*``),
+    and those over ``**``, backtracking only if a preferred branch has no match. Routes are matched in time proportional
+    to their depth unless templates overlap.
+    """
+
+    __slots__ = ('_root',)
+
+    def __init__(self):
+        self._root: _RouteTrieNode[T] = _RouteTrieNode()
+
+    def add(self, template: RouteTemplate, value: T):
+        node = self._root
+        segments = template.segments
+        is_tail = segments[-1] == TAIL_WILDCARD
+
+        if is_tail:
+            segments = segments[:-1]
+
+        for segment in segments:
+            if segment == SEGMENT_WILDCARD or _is_variable_segment(segment):
+                if node.segment_child is None:
+                    node.segment_child = _RouteTrieNode()
+
+                node = node.segment_child
+            else:
+                node = node.children.setdefault(segment, _RouteTrieNode())
+
+        if (node.tail_value if is_tail else node.value) is not None:
+            raise KeyError('Duplicate route "%s" already registered', template.route)
+
+        if is_tail:
+            node.tail_value = value
+        else:
+            node.value = value
+
+    def match(self, segments: List[str]) -> Optional[T]:
+        return self._match(self._root, segments, 0)
+
+    def _match(self, node: _RouteTrieNode[T], segments: List[str], index: int) -> Optional[T]:
+        if index == len(segments):
+            if node.value is not None:
+                return node.value
+
+            return node.tail_value
+
+        child = node.children.get(segments[index])
+
+        if child is not None:
+            value = self._match(child, segments, index + 1)
+
+            if value is not None:
+                return value
+
+        if node.segment_child is not None:
+            value = self._match(node.segment_child, segments, index + 1)
+
+            if value is not None:
+                return value
+
+        return node.tail_value
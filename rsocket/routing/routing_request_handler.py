@@ -1,4 +1,4 @@
-from asyncio import Future
+from asyncio import Future, isfuture
 from typing import Callable, Union, Optional, Coroutine, Tuple
 
 from reactivestreams.publisher import Publisher
@@ -13,11 +13,14 @@ from rsocket.helpers import create_error_future
 from rsocket.local_typing import Awaitable
 from rsocket.logger import logger
 from rsocket.payload import Payload
-from rsocket.request_handler import BaseRequestHandler
+from rsocket.request_handler import BaseRequestHandler, current_request_stream_id
 from rsocket.routing.request_router import RequestRouter
+from rsocket.routing.route_metrics import RouteMetrics, RequestMeasurement, MeasuredPublisher
 from rsocket.streams.error_stream import ErrorStream
 from rsocket.streams.null_subscrier import NullSubscriber
 
+_authentication_encoding = WellKnownMimeTypes.MESSAGE_RSOCKET_AUTHENTICATION.value.name
+
 
 class RoutingRequestHandler(BaseRequestHandler):
     __slots__ = (
@@ -25,16 +28,23 @@ class RoutingRequestHandler(BaseRequestHandler):
         'data_encoding',
         'metadata_encoding',
         'authentication_verifier',
+        'route_metrics',
     )
 
     def __init__(self,
                  socket,
                  router: RequestRouter,
                  authentication_verifier: Optional[
-                     Callable[[str, Authentication], Coroutine[None, None, None]]] = None):
+                     Callable[[str, Authentication], Coroutine[None, None, None]]] = None,
+                 route_metrics: Optional[RouteMetrics] = None):
+        """
+        :param route_metrics: when set, records the latency of each request by route (see RouteMetrics). Requests
+         to unknown routes, and requests failing before being routed, are recorded as UNKNOWN_ROUTE.
+        """
         super().__init__(socket)
         self.router = router
         self.authentication_verifier = authentication_verifier
+        self.route_metrics = route_metrics
         self.data_encoding = None
         self.metadata_encoding = None
 
@@ -85,16 +95,50 @@ class RoutingRequestHandler(BaseRequestHandler):
             frame_type: FrameType,
             payload: Payload
     ) -> Union[Future, Publisher, None, Tuple[Optional[Publisher], Optional[Subscriber]]]:
+        if self.route_metrics is not None:
+            return await self._measure_parse_and_route(frame_type, payload)
+
         composite_metadata = self._parse_composite_metadata(payload.metadata)
         route = require_route(composite_metadata)
         await self._verify_authentication(route, composite_metadata)
         return await self.router.route(frame_type, route, payload, composite_metadata)
 
+    async def _measure_parse_and_route(self, frame_type: FrameType, payload: Payload):
+        measurement = RequestMeasurement(self.route_metrics,
+                                         frame_type,
+                                         current_request_stream_id(),
+                                         len(payload.metadata) if payload.metadata else 0)
+
+        try:
+            composite_metadata = self._parse_composite_metadata(payload.metadata)
+            route = require_route(composite_metadata)
+            registered_route = self.router.registered_route(frame_type, route)
+
+            if registered_route is not None:
+                measurement.set_route(registered_route)
+
+            await self._verify_authentication(route, composite_metadata)
+            result = await self.router.route(frame_type, route, payload, composite_metadata)
+        except Exception:
+            measurement.finish()
+            raise
+
+        if frame_type == FrameType.REQUEST_RESPONSE and isfuture(result):
+            result.add_done_callback(measurement.future_done)
+        elif frame_type == FrameType.REQUEST_STREAM and result is not None:
+            result = MeasuredPublisher(result, measurement)
+        elif frame_type == FrameType.REQUEST_CHANNEL and result is not None and result[0] is not None:
+            result = MeasuredPublisher(result[0], measurement), result[1]
+        else:
+            measurement.finish(count_items=False)
+
+        return result
+
     async def _verify_authentication(self, route: str, composite_metadata: CompositeMetadata):
         if self.authentication_verifier is not None:
-            for item in composite_metadata.items:
-                if isinstance(item, AuthenticationContent):
-                    await self.authentication_verifier(route, item.authentication)
-                    return
+            item = composite_metadata.find_item(_authentication_encoding)
+
+            if not isinstance(item, AuthenticationContent):
+                raise Exception('Authentication required but not provided')
 
-            raise Exception('Authentication required but not provided')
+            await self.authentication_verifier(route, item.authentication)
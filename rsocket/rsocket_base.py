@@ -1,13 +1,15 @@
 import abc
 import asyncio
 from asyncio import Task
+from collections import deque
 from datetime import timedelta
-from typing import Union, Optional, Dict, Any, Coroutine, Callable, Type, cast, TypeVar
+from typing import Union, Optional, Dict, Any, Coroutine, Callable, Type, cast, TypeVar, List, Set, Tuple, Deque
 
 from reactivestreams.publisher import Publisher
 from reactivestreams.subscriber import DefaultSubscriber
 from rsocket.error_codes import ErrorCode
-from rsocket.exceptions import RSocketProtocolError, RSocketTransportError
+from rsocket.exceptions import (RSocketProtocolError, RSocketTransportError, RSocketStreamIdInUse,
+                                RSocketFrameFragmentLimitExceeded)
 from rsocket.extensions.mimetypes import WellKnownMimeTypes, ensure_encoding_name
 from rsocket.frame import (KeepAliveFrame,
                            MetadataPushFrame, RequestFireAndForgetFrame,
@@ -15,14 +17,15 @@ from rsocket.frame import (KeepAliveFrame,
                            exception_to_error_frame,
                            LeaseFrame, ErrorFrame, RequestFrame,
                            initiate_request_frame_types, InvalidFrame,
-                           FragmentableFrame)
+                           FragmentableFrame, frame_payload_length, FrameType)
 from rsocket.frame import (RequestChannelFrame, ResumeFrame,
                            is_fragmentable_frame, CONNECTION_STREAM_ID)
 from rsocket.frame import SetupFrame
 from rsocket.frame_builders import to_payload_frame, to_fire_and_forget_frame, to_setup_frame, to_metadata_push_frame, \
     to_keepalive_frame
 from rsocket.frame_fragment_cache import FrameFragmentCache
-from rsocket.frame_logger import log_frame
+from rsocket.frame_logger import log_frame, is_frame_logging_enabled
+from rsocket.frame_tap import FrameTap
 from rsocket.handlers.request_cahnnel_responder import RequestChannelResponder
 from rsocket.handlers.request_channel_requester import RequestChannelRequester
 from rsocket.handlers.request_response_requester import RequestResponseRequester
@@ -33,10 +36,13 @@ from rsocket.helpers import payload_from_frame, async_noop, cancel_if_task_exist
 from rsocket.lease import DefinedLease, NullLease, Lease
 from rsocket.local_typing import Awaitable
 from rsocket.logger import logger
+from rsocket.observer import RSocketObserver, REQUESTER, RESPONDER
 from rsocket.payload import Payload
-from rsocket.request_handler import BaseRequestHandler, RequestHandler
+from rsocket.request_handler import BaseRequestHandler, RequestHandler, handled_stream_id
+from rsocket.resume import ResumeBuffer, RESUME_BUFFER_SIZE, is_resumable_frame
 from rsocket.rsocket import RSocket
 from rsocket.rsocket_internal import RSocketInternal
+from rsocket.send_queue import SendQueue, SEND_QUEUE_HIGH_WATERMARK, SEND_QUEUE_LOW_WATERMARK
 from rsocket.stream_control import StreamControl
 from rsocket.streams.backpressureapi import BackpressureApi
 from rsocket.streams.stream_handler import StreamHandler
@@ -44,6 +50,9 @@ from rsocket.transports.transport import Transport
 
 T = TypeVar('T')
 
+MAX_SEND_BATCH_FRAMES = 512
+MAX_SEND_BATCH_BYTES = 256 * 1024
+
 
 class RSocketBase(RSocket, RSocketInternal):
     class LeaseSubscriber(DefaultSubscriber):
@@ -63,8 +72,38 @@ class RSocketBase(RSocket, RSocketInternal):
                  metadata_encoding: Union[str, bytes, WellKnownMimeTypes] = WellKnownMimeTypes.APPLICATION_JSON,
                  keep_alive_period: timedelta = timedelta(milliseconds=500),
                  max_lifetime_period: timedelta = timedelta(minutes=10),
-                 setup_payload: Optional[Payload] = None
+                 setup_payload: Optional[Payload] = None,
+                 max_send_batch_frames: int = MAX_SEND_BATCH_FRAMES,
+                 max_send_batch_bytes: int = MAX_SEND_BATCH_BYTES,
+                 send_queue_high_watermark: int = SEND_QUEUE_HIGH_WATERMARK,
+                 send_queue_low_watermark: int = SEND_QUEUE_LOW_WATERMARK,
+                 max_concurrent_requests: Optional[int] = None,
+                 max_fragmented_frame_size: Optional[int] = None,
+                 max_fragmented_frames_size: Optional[int] = None,
+                 fragment_size: Optional[int] = None,
+                 resume_buffer_size: int = RESUME_BUFFER_SIZE,
+                 max_concurrent_streams: Optional[int] = None,
+                 observer: Optional[RSocketObserver] = None
                  ):
+        """
+        :param max_concurrent_requests: when set, request frames received from the peer are handled in separate tasks,
+         at most this many at a time, instead of blocking the receiver until the request handler returns. Frames
+         received for a stream whose request is still being handled are delivered once its handler is registered.
+         Requests received beyond the limit are queued, and handled in order as running handlers return, while the
+         receiver keeps delivering REQUEST_N, CANCEL and payload frames of the other streams.
+        :param max_fragmented_frame_size: maximum number of bytes buffered while reassembling a single fragmented
+         frame. A stream exceeding it is terminated, and an ERROR frame (REJECTED) is sent on it.
+        :param max_fragmented_frames_size: maximum number of bytes buffered while reassembling all fragmented frames
+         received on the connection. The stream whose fragment exceeds it is handled as above.
+        :param fragment_size: when set, outbound requests and payloads whose data and metadata exceed this many bytes
+         are sent as fragments, interleaved with the frames of other streams.
+        :param resume_buffer_size: maximum number of bytes of sent frames retained, until the peer acknowledges
+         receiving them, to be sent again when a resumable session is resumed.
+        :param max_concurrent_streams: maximum number of active streams requested by this side (fire-and-forget
+         excluded). Further requests are queued, and sent in order as active streams finish.
+        :param observer: notified of the connection's events (frames, streams, request durations, leases,
+         keepalive round trips), e.g. a rsocket.metrics.MetricsCollector.
+        """
 
         self._handler_factory = handler_factory
         self._request_queue_size = request_queue_size
@@ -72,6 +111,21 @@ class RSocketBase(RSocket, RSocketInternal):
         self._max_lifetime_period = max_lifetime_period
         self._keep_alive_period = keep_alive_period
         self._setup_payload = setup_payload
+        self._max_send_batch_frames = max_send_batch_frames
+        self._max_send_batch_bytes = max_send_batch_bytes
+        self._send_queue_high_watermark = send_queue_high_watermark
+        self._send_queue_low_watermark = send_queue_low_watermark
+        self._max_concurrent_requests = max_concurrent_requests
+        self._max_fragmented_frame_size = max_fragmented_frame_size
+        self._max_fragmented_frames_size = max_fragmented_frames_size
+        self._fragment_size = fragment_size
+        self._resume_buffer_size = resume_buffer_size
+        self._max_concurrent_streams = max_concurrent_streams
+        self._observer = observer
+        self._resume_buffer: Optional[ResumeBuffer] = None
+        self._received_position = 0
+        self._request_tasks: Set[Task] = set()
+        self._frame_tap: Optional[FrameTap] = None
         self._data_encoding = ensure_encoding_name(data_encoding)
         self._metadata_encoding = ensure_encoding_name(metadata_encoding)
         self._lease_publisher = lease_publisher
@@ -81,6 +135,7 @@ class RSocketBase(RSocket, RSocketInternal):
         self._responder_lease = None
         self._requester_lease = None
         self._is_closing = False
+        self._is_handling_frame = False
         self._connecting = True
 
         self._async_frame_handler_by_type: Dict[Type[Frame], Any] = {
@@ -106,8 +161,11 @@ class RSocketBase(RSocket, RSocketInternal):
         ...
 
     def _reset_internals(self):
-        self._frame_fragment_cache = FrameFragmentCache()
-        self._send_queue = asyncio.Queue()
+        self._frame_fragment_cache = FrameFragmentCache(self._max_fragmented_frame_size,
+                                                        self._max_fragmented_frames_size)
+        self._send_queue = SendQueue(self._send_queue_high_watermark,
+                                     self._send_queue_low_watermark,
+                                     self._fragment_size)
         self._request_queue = asyncio.Queue(self._request_queue_size)
 
         if self._honor_lease:
@@ -116,7 +174,18 @@ class RSocketBase(RSocket, RSocketInternal):
             self._requester_lease = NullLease()
 
         self._responder_lease = NullLease()
-        self._stream_control = StreamControl(self._get_first_stream_id())
+        self._stream_control = StreamControl(self._get_first_stream_id(), self._observer)
+        self._interaction_started_by_stream: Dict[int, Tuple[FrameType, str, float]] = {}
+        self._keepalive_sent_at: Optional[float] = None
+        self._frames_by_pending_request: Dict[int, List[Frame]] = {}
+        self._started_streams: Set[int] = set()
+        self._frames_by_queued_stream: Dict[int, List[Frame]] = {}
+        self._resume_buffer = None
+        self._received_position = 0
+
+        self._queued_requests: Deque[RequestFrame] = deque()
+        self._handled_request_count = 0
+
         self._is_closing = False
 
     def stop_all_streams(self, error_code=ErrorCode.CANCELED, data=b''):
@@ -144,6 +213,20 @@ class RSocketBase(RSocket, RSocketInternal):
         self._handler = handler_factory(self)
         return self._handler
 
+    def set_frame_tap(self, frame_tap: Optional[FrameTap]):
+        """Observe the frames sent and received from now on (None to stop)."""
+        self._frame_tap = frame_tap
+
+    def _is_frame_tapped(self) -> bool:
+        return self._frame_tap is not None or is_frame_logging_enabled()
+
+    def _tap_frame(self, frame: Frame, direction: str):
+        log_identifier = self._log_identifier()
+        log_frame(frame, log_identifier, direction)
+
+        if self._frame_tap is not None:
+            self._frame_tap.on_frame(frame, direction, log_identifier)
+
     def _allocate_stream(self) -> int:
         return self._stream_control.allocate_stream()
 
@@ -154,35 +237,103 @@ class RSocketBase(RSocket, RSocketInternal):
     def finish_stream(self, stream_id: int):
         self._stream_control.finish_stream(stream_id)
 
+        if self._observer is not None:
+            self._complete_interaction(stream_id)
+
+        if self._max_concurrent_streams is not None:
+            self._finish_started_stream(stream_id)
+
+    def _finish_started_stream(self, stream_id: int):
+        if self._frames_by_queued_stream.pop(stream_id, None) is not None:
+            return
+
+        self._started_streams.discard(stream_id)
+
+        while self._frames_by_queued_stream and len(self._started_streams) < self._max_concurrent_streams:
+            queued_stream_id = next(iter(self._frames_by_queued_stream))
+            request, *frames = self._frames_by_queued_stream.pop(queued_stream_id)
+            self._started_streams.add(queued_stream_id)
+            self._send_request(request)
+
+            for frame in frames:
+                self.send_frame(frame)
+
+    def _start_interaction(self, frame: RequestFrame, role: str):
+        if not isinstance(frame, RequestFireAndForgetFrame):
+            self._interaction_started_by_stream[frame.stream_id] = (
+                frame.frame_type, role, asyncio.get_event_loop().time())
+
+    def _complete_interaction(self, stream_id: int):
+        started = self._interaction_started_by_stream.pop(stream_id, None)
+
+        if started is not None:
+            interaction, role, started_at = started
+            self._observer.interaction_completed(interaction, role, asyncio.get_event_loop().time() - started_at)
+
     def send_request(self, frame: RequestFrame):
+        if self._observer is not None:
+            self._start_interaction(frame, REQUESTER)
+
+        if self._max_concurrent_streams is not None and not isinstance(frame, RequestFireAndForgetFrame):
+            if len(self._started_streams) >= self._max_concurrent_streams:
+                self._queue_stream_request(frame)
+                return
+
+            self._started_streams.add(frame.stream_id)
+
+        self._send_request(frame)
+
+    def _send_request(self, frame: RequestFrame):
         if self._honor_lease and not self._is_frame_allowed_to_send(frame):
             self._queue_request_frame(frame)
         else:
             self.send_frame(frame)
 
+    def _queue_stream_request(self, frame: RequestFrame):
+        logger().debug('%s: maximum concurrent streams active. queueing', self._log_identifier())
+
+        self._frames_by_queued_stream[frame.stream_id] = [frame]
+
     def _queue_request_frame(self, frame: RequestFrame):
         logger().debug('%s: lease not allowing to send request. queueing', self._log_identifier())
 
+        if self._observer is not None:
+            self._observer.request_rejected_by_lease(frame.frame_type)
+
         self._request_queue.put_nowait(frame)
 
     def send_priority_frame(self, frame: Frame):
-        items = []
-        while not self._send_queue.empty():
-            items.append(self._send_queue.get_nowait())
-
-        self._send_queue.put_nowait(frame)
-        for item in items:
-            self._send_queue.put_nowait(item)
+        self._send_queue.put_first_nowait(frame)
 
     def send_frame(self, frame: Frame):
+        if self._frames_by_queued_stream:
+            queued_frames = self._frames_by_queued_stream.get(frame.stream_id)
+
+            if queued_frames is not None:
+                queued_frames.append(frame)
+                return
+
         self._send_queue.put_nowait(frame)
 
+    def is_send_queue_writable(self) -> bool:
+        return self._send_queue.is_writable()
+
+    def call_when_send_queue_writable(self, callback: Callable[[], None]):
+        self._send_queue.add_writable_callback(callback)
+
+    async def drain(self):
+        """Wait until the outbound frame queue is below its low watermark."""
+        await self._send_queue.wait_writable()
+
     def send_complete(self, stream_id: int):
         self.send_payload(stream_id, Payload(), complete=True, is_next=False)
 
     def send_error(self, stream_id: int, exception: Exception):
         self.send_frame(exception_to_error_frame(stream_id, exception))
 
+        if self._observer is not None:
+            self._complete_interaction(stream_id)
+
     def send_payload(self, stream_id: int, payload: Payload, complete=False, is_next=True):
         self.send_frame(to_payload_frame(stream_id, payload, complete, is_next=is_next))
 
@@ -205,8 +356,16 @@ class RSocketBase(RSocket, RSocketInternal):
     async def handle_keep_alive(self, frame: KeepAliveFrame):
         self._update_last_keepalive()
 
+        if self._resume_buffer is not None:
+            self._resume_buffer.release(frame.last_received_position)
+
+        if self._observer is not None and not frame.flags_respond and self._keepalive_sent_at is not None:
+            self._observer.keepalive_rtt(asyncio.get_event_loop().time() - self._keepalive_sent_at)
+            self._keepalive_sent_at = None
+
         if frame.flags_respond:
             frame.flags_respond = False
+            frame.last_received_position = self._received_position
             self.send_frame(frame)
 
     async def handle_request_response(self, frame: RequestResponseFrame):
@@ -239,7 +398,7 @@ class RSocketBase(RSocket, RSocketInternal):
 
     async def handle_setup(self, frame: SetupFrame):
         if frame.flags_resume:
-            raise RSocketProtocolError(ErrorCode.UNSUPPORTED_SETUP, data='Resume not supported')
+            self._setup_resumable_session(frame.resume_identification_token)
 
         if frame.flags_lease:
             if self._lease_publisher is None:
@@ -257,6 +416,13 @@ class RSocketBase(RSocket, RSocketInternal):
             logger().error('%s: Setup error', self._log_identifier(), exc_info=True)
             raise RSocketProtocolError(ErrorCode.REJECTED_SETUP, data=str(exception)) from exception
 
+    def _setup_resumable_session(self, resume_token: bytes):
+        raise RSocketProtocolError(ErrorCode.UNSUPPORTED_SETUP, data='Resume not supported')
+
+    def _end_resumable_session(self, error_code: ErrorCode, data: bytes):
+        self._resume_buffer = None
+        self.stop_all_streams(error_code, data)
+
     def _subscribe_to_lease_publisher(self):
         if self._lease_publisher is not None:
             self._lease_publisher.subscribe(self.LeaseSubscriber(self))
@@ -264,8 +430,12 @@ class RSocketBase(RSocket, RSocketInternal):
     def send_lease(self, lease: Lease):
         try:
             self._responder_lease = lease
+            frame = self._responder_lease.to_frame()
+
+            if self._observer is not None:
+                self._observer.lease_sent(frame.number_of_requests, frame.time_to_live)
 
-            self.send_frame(self._responder_lease.to_frame())
+            self.send_frame(frame)
         except Exception as exception:
             self.send_error(CONNECTION_STREAM_ID, exception)
 
@@ -302,6 +472,9 @@ class RSocketBase(RSocket, RSocketInternal):
             timedelta(milliseconds=frame.time_to_live)
         )
 
+        if self._observer is not None:
+            self._observer.lease_received(frame.number_of_requests, frame.time_to_live)
+
         while not self._request_queue.empty() and self._requester_lease.is_request_allowed():
             self.send_frame(self._request_queue.get_nowait())
             self._request_queue.task_done()
@@ -320,7 +493,10 @@ class RSocketBase(RSocket, RSocketInternal):
     async def _on_connection_lost(self, exception: Exception):
         logger().warning(str(exception))
         logger().debug(str(exception), exc_info=exception)
-        self.stop_all_streams(ErrorCode.CONNECTION_ERROR, b'Connection error')
+
+        if self._resume_buffer is None:
+            self.stop_all_streams(ErrorCode.CONNECTION_ERROR, b'Connection error')
+
         await self._handler.on_connection_lost(self, exception)
 
     @abc.abstractmethod
@@ -335,6 +511,8 @@ class RSocketBase(RSocket, RSocketInternal):
             if next_frame_generator is None:
                 break
             async for frame in next_frame_generator:
+                self._is_handling_frame = True
+
                 try:
                     await self._handle_next_frame(frame)
                 except RSocketProtocolError as exception:
@@ -345,34 +523,106 @@ class RSocketBase(RSocket, RSocketInternal):
                 except Exception as exception:
                     logger().error('%s: Unknown error', self._log_identifier(), exc_info=True)
                     self.send_error(frame.stream_id, exception)
+                finally:
+                    self._is_handling_frame = False
 
     async def _handle_next_frame(self, frame: Frame):
 
-        log_frame(frame, self._log_identifier())
+        if self._frame_tap is not None or is_frame_logging_enabled():
+            self._tap_frame(frame, 'Received')
 
         if isinstance(frame, InvalidFrame):
             return
 
+        observer = self._observer
+
+        if observer is not None:
+            observer.frame_received(frame.frame_type, frame.length)
+
+        if is_resumable_frame(frame):
+            self._received_position += frame.length
+
         if is_fragmentable_frame(frame):
-            frame = self._frame_fragment_cache.append(cast(FragmentableFrame, frame))
+            is_fragment = observer is not None and (
+                    frame.flags_follows or frame.stream_id in self._frame_fragment_cache.frame_by_stream_id)
+
+            try:
+                frame = self._frame_fragment_cache.append(cast(FragmentableFrame, frame))
+            except RSocketFrameFragmentLimitExceeded as exception:
+                self._stream_control.stop_stream(frame.stream_id, exception.error_code, exception.data.encode())
+                raise
+
             if frame is None:
                 return
 
+            if is_fragment:
+                observer.fragmented_frame_reassembled(frame.frame_type, len(frame.data) + len(frame.metadata))
+
         stream_id = frame.stream_id
 
-        if stream_id == CONNECTION_STREAM_ID or isinstance(frame, initiate_request_frame_types):
+        if observer is not None and isinstance(frame, initiate_request_frame_types):
+            self._start_interaction(frame, RESPONDER)
+
+        if isinstance(frame, initiate_request_frame_types) and self._max_concurrent_requests is not None:
+            self._dispatch_request(frame)
+        elif stream_id == CONNECTION_STREAM_ID or isinstance(frame, initiate_request_frame_types):
+            handled_stream_id.set(stream_id)
             await self._handle_frame_by_type(frame)
         elif self._stream_control.handle_stream(stream_id, frame):
             return
+        elif stream_id in self._frames_by_pending_request:
+            self._frames_by_pending_request[stream_id].append(frame)
         else:
             logger().debug('%s: Dropping frame from unknown stream %d', self._log_identifier(), frame.stream_id)
 
+    def _dispatch_request(self, frame: RequestFrame):
+        if frame.stream_id in self._frames_by_pending_request:
+            raise RSocketStreamIdInUse(frame.stream_id)
+
+        self._frames_by_pending_request[frame.stream_id] = []
+
+        if self._handled_request_count < self._max_concurrent_requests:
+            self._start_request_task(frame)
+        else:
+            self._queued_requests.append(frame)
+
+    def _start_request_task(self, frame: RequestFrame):
+        self._handled_request_count += 1
+        task = asyncio.create_task(self._handle_request(frame))
+        self._request_tasks.add(task)
+        task.add_done_callback(self._request_tasks.discard)
+
+    async def _handle_request(self, frame: RequestFrame):
+        stream_id = frame.stream_id
+        handled_stream_id.set(stream_id)
+
+        try:
+            await self._handle_frame_by_type(frame)
+        except RSocketProtocolError as exception:
+            logger().error('%s: Protocol error %s', self._log_identifier(), str(exception))
+            self.send_error(stream_id, exception)
+        except Exception as exception:
+            logger().error('%s: Unknown error', self._log_identifier(), exc_info=True)
+            self.send_error(stream_id, exception)
+        finally:
+            self._handled_request_count -= 1
+
+            if self._queued_requests and not self._is_closing:
+                self._start_request_task(self._queued_requests.popleft())
+
+            for pending_frame in self._frames_by_pending_request.pop(stream_id, ()):
+                if not self._stream_control.handle_stream(stream_id, pending_frame):
+                    logger().debug('%s: Dropping frame from unknown stream %d', self._log_identifier(), stream_id)
+
     async def _handle_frame_by_type(self, frame: Frame):
         frame_handler = self._async_frame_handler_by_type.get(type(frame), async_noop)
         await frame_handler(frame)
 
     def _send_new_keepalive(self, data: bytes = b''):
-        self.send_frame(to_keepalive_frame(data))
+        if self._observer is not None and self._keepalive_sent_at is None:
+            self._keepalive_sent_at = asyncio.get_event_loop().time()
+
+        self.send_frame(to_keepalive_frame(data, self._received_position))
 
     def _before_sender(self):
         pass
@@ -387,13 +637,23 @@ class RSocketBase(RSocket, RSocketInternal):
 
                 self._before_sender()
                 while self.is_server_alive():
-                    frame = await self._send_queue.get()
-                    await transport.send_frame(frame)
-                    log_frame(frame, self._log_identifier(), 'Sent')
-                    self._send_queue.task_done()
+                    frames = await self._next_frames_to_send()
+
+                    try:
+                        await transport.send_frames(frames)
+                    finally:
+                        self._retain_sent_frames(frames)
+
+                    if self._is_frame_tapped():
+                        for frame in frames:
+                            self._tap_frame(frame, 'Sent')
+
+                    if self._observer is not None:
+                        self._observe_sent_frames(frames)
 
-                    if frame.sent_future is not None:
-                        frame.sent_future.set_result(None)
+                    for frame in frames:
+                        if frame.sent_future is not None:
+                            frame.sent_future.set_result(None)
 
                     if self._send_queue.empty():
                         await transport.on_send_queue_empty()
@@ -410,6 +670,43 @@ class RSocketBase(RSocket, RSocketInternal):
         finally:
             await self._finally_sender()
 
+    def _observe_sent_frames(self, frames: List[Frame]):
+        observer = self._observer
+        observer.frames_dequeued(len(frames), self._send_queue.qsize())
+
+        for frame in frames:
+            observer.frame_sent(frame.frame_type, frame.length)
+
+    def _retain_sent_frames(self, frames: List[Frame]):
+        if self._resume_buffer is not None:
+            for frame in frames:
+                if is_resumable_frame(frame):
+                    self._resume_buffer.append(frame)
+
+    async def _send_replayed_frames(self, transport: Transport, frames: List[Frame]):
+        if frames:
+            await transport.send_frames(frames)
+
+        for frame in frames:
+            self._tap_frame(frame, 'Resent')
+
+            if frame.sent_future is not None and not frame.sent_future.done():
+                frame.sent_future.set_result(None)
+
+    async def _next_frames_to_send(self) -> List[Frame]:
+        frame = await self._send_queue.get()
+        frames = [frame]
+        batch_bytes = frame_payload_length(frame)
+
+        while (not self._send_queue.empty()
+               and len(frames) < self._max_send_batch_frames
+               and batch_bytes < self._max_send_batch_bytes):
+            frame = self._send_queue.get_nowait()
+            frames.append(frame)
+            batch_bytes += frame_payload_length(frame)
+
+        return frames
+
     async def close(self):
         logger().debug('%s: Closing', self._log_identifier())
 
@@ -417,6 +714,9 @@ class RSocketBase(RSocket, RSocketInternal):
         await cancel_if_task_exists(self._sender_task)
         await cancel_if_task_exists(self._receiver_task)
 
+        for task in list(self._request_tasks):
+            await cancel_if_task_exists(task)
+
         await self._close_transport()
 
     async def _close_transport(self):
@@ -1,19 +1,26 @@
 import asyncio
 from asyncio import CancelledError
-from datetime import timedelta, datetime
+from datetime import timedelta
 from typing import Optional, Callable, AsyncGenerator, Any
 from typing import Union
 
 from reactivestreams.publisher import Publisher
-from rsocket.exceptions import RSocketNoAvailableTransport
+from rsocket.error_codes import ErrorCode
+from rsocket.exceptions import RSocketNoAvailableTransport, RSocketProtocolError
 from rsocket.extensions.mimetypes import WellKnownMimeTypes
+from rsocket.frame import SetupFrame, ErrorFrame, ResumeOKFrame, CONNECTION_STREAM_ID, exception_to_error_frame
+from rsocket.frame_builders import to_setup_frame, to_resume_frame
 from rsocket.helpers import create_future, cancel_if_task_exists
 from rsocket.local_typing import Awaitable
 from rsocket.logger import logger
+from rsocket.observer import RSocketObserver
 from rsocket.payload import Payload
 from rsocket.request_handler import BaseRequestHandler
 from rsocket.request_handler import RequestHandler
-from rsocket.rsocket_base import RSocketBase
+from rsocket.resume import ResumeBuffer, RESUME_BUFFER_SIZE
+from rsocket.rsocket_base import RSocketBase, MAX_SEND_BATCH_FRAMES, MAX_SEND_BATCH_BYTES
+from rsocket.send_queue import SEND_QUEUE_HIGH_WATERMARK, SEND_QUEUE_LOW_WATERMARK
+from rsocket.timer_wheel import timer_wheel, TimerHandle
 from rsocket.transports.transport import Transport
 
 
@@ -30,7 +37,26 @@ class RSocketClient(RSocketBase):
                  keep_alive_period: timedelta = timedelta(milliseconds=500),
                  max_lifetime_period: timedelta = timedelta(minutes=10),
                  setup_payload: Optional[Payload] = None,
+                 max_send_batch_frames: int = MAX_SEND_BATCH_FRAMES,
+                 max_send_batch_bytes: int = MAX_SEND_BATCH_BYTES,
+                 send_queue_high_watermark: int = SEND_QUEUE_HIGH_WATERMARK,
+                 send_queue_low_watermark: int = SEND_QUEUE_LOW_WATERMARK,
+                 max_concurrent_requests: Optional[int] = None,
+                 max_fragmented_frame_size: Optional[int] = None,
+                 max_fragmented_frames_size: Optional[int] = None,
+                 fragment_size: Optional[int] = None,
+                 resume_token: Optional[bytes] = None,
+                 resume_buffer_size: int = RESUME_BUFFER_SIZE,
+                 max_concurrent_streams: Optional[int] = None,
+                 observer: Optional[RSocketObserver] = None
                  ):
+        """
+        :param resume_token: when set, the session is resumable: reconnect() resumes it with a new transport (RESUME)
+         instead of starting a new one (SETUP). Streams are kept while the connection is lost, and frames the server
+         did not receive are sent again. If the server rejects resuming, the streams are terminated with a
+         REJECTED_RESUME error, and the next connection starts a new session.
+        """
+
         self._transport_provider = transport_provider.__aiter__()
         self._is_server_alive = True
         self._update_last_keepalive()
@@ -38,7 +64,11 @@ class RSocketClient(RSocketBase):
         self._transport: Optional[Transport] = None
         self._next_transport = asyncio.Future()
         self._reconnect_task = asyncio.create_task(self._reconnect_listener())
-        self._keepalive_task = None
+        self._keepalive_send_timer: Optional[TimerHandle] = None
+        self._next_keepalive_at = 0.0
+        self._keepalive_check_timer: Optional[TimerHandle] = None
+        self._keepalive_timeout_task: Optional[asyncio.Task] = None
+        self._resume_token = resume_token
 
         super().__init__(handler_factory=handler_factory,
                          honor_lease=honor_lease,
@@ -48,7 +78,20 @@ class RSocketClient(RSocketBase):
                          metadata_encoding=metadata_encoding,
                          keep_alive_period=keep_alive_period,
                          max_lifetime_period=max_lifetime_period,
-                         setup_payload=setup_payload)
+                         setup_payload=setup_payload,
+                         max_send_batch_frames=max_send_batch_frames,
+                         max_send_batch_bytes=max_send_batch_bytes,
+                         send_queue_high_watermark=send_queue_high_watermark,
+                         send_queue_low_watermark=send_queue_low_watermark,
+                         max_concurrent_requests=max_concurrent_requests,
+                         max_fragmented_frame_size=max_fragmented_frame_size,
+                         max_fragmented_frames_size=max_fragmented_frames_size,
+                         fragment_size=fragment_size,
+                         resume_buffer_size=resume_buffer_size,
+                         max_concurrent_streams=max_concurrent_streams,
+                         observer=observer)
+
+        self._async_frame_handler_by_type[ResumeOKFrame] = self.handle_resume_ok
 
     def _current_transport(self) -> Awaitable[Transport]:
         return self._next_transport
@@ -59,7 +102,15 @@ class RSocketClient(RSocketBase):
     async def connect(self):
         logger().debug('%s: connecting', self._log_identifier())
         self._is_closing = False
+
+        if self._resume_buffer is not None:
+            return await self._resume()
+
         self._reset_internals()
+
+        if self._resume_token is not None:
+            self._resume_buffer = ResumeBuffer(self._resume_buffer_size)
+
         self._start_tasks()
 
         try:
@@ -71,6 +122,52 @@ class RSocketClient(RSocketBase):
 
         return await super().connect()
 
+    async def _resume(self):
+        logger().debug('%s: resuming session', self._log_identifier())
+
+        try:
+            await self._connect_new_transport()
+            transport = await self._current_transport()
+            self._update_last_keepalive()
+            self._receiver_task = self._start_task_if_not_closing(self._receiver)
+
+            frame = to_resume_frame(self._resume_token,
+                                    self._received_position,
+                                    self._resume_buffer.first_position())
+            await transport.send_frame(frame)
+            self._tap_frame(frame, 'Sent')
+        except Exception as exception:
+            logger().error('%s: Connection error', self._log_identifier(), exc_info=True)
+            await self._on_connection_lost(exception)
+            return
+
+        return self
+
+    async def handle_resume_ok(self, frame: ResumeOKFrame):
+        transport = await self._current_transport()
+        frames = None
+
+        if self._resume_buffer is not None:
+            frames = self._resume_buffer.frames_from(frame.last_received_client_position)
+
+        if frames is None:
+            logger().error('%s: Resume position %d not available', self._log_identifier(),
+                           frame.last_received_client_position)
+            exception = RSocketProtocolError(ErrorCode.CONNECTION_ERROR, data='Resume position not available')
+            self._end_resumable_session(exception.error_code, exception.data.encode())
+            await transport.send_frame(exception_to_error_frame(CONNECTION_STREAM_ID, exception))
+            await transport.close()
+            return
+
+        await self._send_replayed_frames(transport, frames)
+        self._sender_task = self._start_task_if_not_closing(self._sender)
+
+    async def handle_error(self, frame: ErrorFrame):
+        if frame.error_code == ErrorCode.REJECTED_RESUME and self._resume_buffer is not None:
+            self._end_resumable_session(ErrorCode.REJECTED_RESUME, frame.data)
+
+        await super().handle_error(frame)
+
     async def _connect_new_transport(self):
         try:
             new_transport = await self._get_new_transport()
@@ -96,6 +193,7 @@ class RSocketClient(RSocketBase):
     async def _close(self, reconnect=False):
         if not reconnect:
             await cancel_if_task_exists(self._reconnect_task)
+            self._resume_buffer = None
         else:
             logger().debug('%s: Closing before reconnect', self._log_identifier())
 
@@ -108,6 +206,18 @@ class RSocketClient(RSocketBase):
     def _get_first_stream_id(self) -> int:
         return 1
 
+    def _create_setup_frame(self,
+                            data_encoding: bytes,
+                            metadata_encoding: bytes,
+                            payload: Optional[Payload] = None) -> SetupFrame:
+        return to_setup_frame(payload,
+                              data_encoding,
+                              metadata_encoding,
+                              self._keep_alive_period,
+                              self._max_lifetime_period,
+                              self._honor_lease,
+                              self._resume_token)
+
     async def reconnect(self):
         self._connect_request_event.set()
 
@@ -133,46 +243,80 @@ class RSocketClient(RSocketBase):
         finally:
             self.stop_all_streams()
 
-    async def _keepalive_send_task(self):
-        try:
-            while True:
-                await asyncio.sleep(self._keep_alive_period.total_seconds())
-                self._send_new_keepalive()
-        except asyncio.CancelledError:
-            logger().debug('%s: Asyncio task canceled: keepalive_send', self._log_identifier())
-
     def _before_sender(self):
-        self._keepalive_task = self._start_task_if_not_closing(self._keepalive_send_task)
+        self._cancel_keepalive_send()
+        self._next_keepalive_at = asyncio.get_event_loop().time() + self._keep_alive_period.total_seconds()
+        self._schedule_keepalive_send()
 
     async def _finally_sender(self):
-        await cancel_if_task_exists(self._keepalive_task)
+        self._cancel_keepalive_send()
+
+    def _schedule_keepalive_send(self):
+        self._keepalive_send_timer = timer_wheel().call_at(self._next_keepalive_at, self._send_keepalive_when_due)
+
+    def _cancel_keepalive_send(self):
+        if self._keepalive_send_timer is not None:
+            self._keepalive_send_timer.cancel()
+            self._keepalive_send_timer = None
+
+    def _send_keepalive_when_due(self):
+        self._keepalive_send_timer = None
+
+        if self._is_closing:
+            return
+
+        now = asyncio.get_event_loop().time()
+
+        if now >= self._next_keepalive_at:
+            self._send_new_keepalive()
+            self._next_keepalive_at += self._keep_alive_period.total_seconds()
+
+            if self._next_keepalive_at <= now:
+                self._next_keepalive_at = now + self._keep_alive_period.total_seconds()
+
+        self._schedule_keepalive_send()
 
     def _update_last_keepalive(self):
-        self._last_server_keepalive = datetime.now()
+        self._last_server_keepalive = asyncio.get_event_loop().time()
 
     def is_server_alive(self) -> bool:
         return self._is_server_alive
 
-    async def _keepalive_timeout_task(self):
-        try:
-            while True:
-                await asyncio.sleep(self._max_lifetime_period.total_seconds())
-                now = datetime.now()
-                time_since_last_keepalive = now - self._last_server_keepalive
-
-                if time_since_last_keepalive > self._max_lifetime_period:
-                    self._is_server_alive = False
-                    await self._handler.on_keepalive_timeout(
-                        time_since_last_keepalive,
-                        self
-                    )
-        except asyncio.CancelledError:
-            logger().debug('%s: Asyncio task canceled: keepalive_timeout', self._log_identifier())
+    def _start_keepalive_check(self):
+        self._cancel_keepalive_check()
+        self._schedule_keepalive_check()
+
+    def _schedule_keepalive_check(self):
+        self._keepalive_check_timer = timer_wheel().call_later(self._max_lifetime_period.total_seconds(),
+                                                               self._check_keepalive)
+
+    def _cancel_keepalive_check(self):
+        if self._keepalive_check_timer is not None:
+            self._keepalive_check_timer.cancel()
+            self._keepalive_check_timer = None
+
+    def _check_keepalive(self):
+        self._keepalive_check_timer = None
+
+        if self._is_closing:
+            return
+
+        time_since_last_keepalive = asyncio.get_event_loop().time() - self._last_server_keepalive
+
+        if time_since_last_keepalive > self._max_lifetime_period.total_seconds():
+            self._is_server_alive = False
+            self._keepalive_timeout_task = asyncio.create_task(self._handler.on_keepalive_timeout(
+                timedelta(seconds=time_since_last_keepalive),
+                self
+            ))
+
+        self._schedule_keepalive_check()
 
     async def _receiver_listen(self):
-        keepalive_timeout_task = self._start_task_if_not_closing(self._keepalive_timeout_task)
+        self._start_keepalive_check()
 
         try:
             await super()._receiver_listen()
         finally:
-            await cancel_if_task_exists(keepalive_timeout_task)
+            self._cancel_keepalive_check()
+            await cancel_if_task_exists(self._keepalive_timeout_task)
@@ -1,4 +1,5 @@
 import abc
+from typing import Callable
 
 from rsocket.error_codes import ErrorCode
 from rsocket.frame import Frame, RequestFrame
@@ -33,3 +34,11 @@ class RSocketInternal(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def stop_all_streams(self, error_code=ErrorCode.CANCELED, data=b''):
         ...
+
+    @abc.abstractmethod
+    def is_send_queue_writable(self) -> bool:
+        ...
+
+    @abc.abstractmethod
+    def call_when_send_queue_writable(self, callback: Callable[[], None]):
+        ...
@@ -1,13 +1,23 @@
+import asyncio
 from datetime import timedelta
 from typing import Optional, Union, Callable
 
 from reactivestreams.publisher import Publisher
+from rsocket.error_codes import ErrorCode
+from rsocket.exceptions import RSocketProtocolError, RSocketTransportError
 from rsocket.extensions.mimetypes import WellKnownMimeTypes
-from rsocket.helpers import create_future
+from rsocket.frame import ResumeFrame, CONNECTION_STREAM_ID, exception_to_error_frame, SetupFrame
+from rsocket.frame_builders import to_resume_ok_frame
+from rsocket.helpers import create_future, cancel_if_task_exists
 from rsocket.local_typing import Awaitable
+from rsocket.logger import logger
+from rsocket.observer import RSocketObserver
 from rsocket.payload import Payload
 from rsocket.request_handler import RequestHandler, BaseRequestHandler
-from rsocket.rsocket_base import RSocketBase
+from rsocket.resume import ResumableSessions, ResumeBuffer, RESUME_BUFFER_SIZE
+from rsocket.rsocket_base import RSocketBase, MAX_SEND_BATCH_FRAMES, MAX_SEND_BATCH_BYTES
+from rsocket.send_queue import SEND_QUEUE_HIGH_WATERMARK, SEND_QUEUE_LOW_WATERMARK
+from rsocket.timer_wheel import timer_wheel, TimerHandle
 from rsocket.transports.transport import Transport
 
 
@@ -23,7 +33,37 @@ class RSocketServer(RSocketBase):
                  metadata_encoding: Union[str, bytes, WellKnownMimeTypes] = WellKnownMimeTypes.APPLICATION_JSON,
                  keep_alive_period: timedelta = timedelta(milliseconds=500),
                  max_lifetime_period: timedelta = timedelta(minutes=10),
-                 setup_payload: Optional[Payload] = None):
+                 setup_payload: Optional[Payload] = None,
+                 max_send_batch_frames: int = MAX_SEND_BATCH_FRAMES,
+                 max_send_batch_bytes: int = MAX_SEND_BATCH_BYTES,
+                 send_queue_high_watermark: int = SEND_QUEUE_HIGH_WATERMARK,
+                 send_queue_low_watermark: int = SEND_QUEUE_LOW_WATERMARK,
+                 max_concurrent_requests: Optional[int] = None,
+                 max_fragmented_frame_size: Optional[int] = None,
+                 max_fragmented_frames_size: Optional[int] = None,
+                 fragment_size: Optional[int] = None,
+                 resume_sessions: Optional[ResumableSessions] = None,
+                 resume_buffer_size: int = RESUME_BUFFER_SIZE,
+                 max_concurrent_streams: Optional[int] = None,
+                 observer: Optional[RSocketObserver] = None):
+        """
+        :param resume_sessions: enables resumable sessions (SETUP with a resume token). Pass the same instance to all
+         servers, so that a new connection can resume (RESUME) the session of a lost one.
+
+        The connection is closed, and its streams terminated, if no KEEPALIVE is received from the client within the
+        maximum lifetime it declared in SETUP. The check is postponed while the server is busy handling a frame, as
+        the client's keepalives can not be read meanwhile. A resumable session is kept, waiting to be resumed. The
+        request handler's on_keepalive_timeout is called first.
+        """
+
+        self._resume_sessions = resume_sessions
+        self._resume_token: Optional[bytes] = None
+        self._expiry_task: Optional[asyncio.Task] = None
+        self._client_max_lifetime: Optional[float] = None
+        self._last_keepalive = 0.0
+        self._keepalive_check_timer: Optional[TimerHandle] = None
+        self._keepalive_timeout_task: Optional[asyncio.Task] = None
+
         super().__init__(handler_factory,
                          honor_lease,
                          lease_publisher,
@@ -32,7 +72,18 @@ class RSocketServer(RSocketBase):
                          metadata_encoding,
                          keep_alive_period,
                          max_lifetime_period,
-                         setup_payload)
+                         setup_payload,
+                         max_send_batch_frames,
+                         max_send_batch_bytes,
+                         send_queue_high_watermark,
+                         send_queue_low_watermark,
+                         max_concurrent_requests,
+                         max_fragmented_frame_size,
+                         max_fragmented_frames_size,
+                         fragment_size,
+                         resume_buffer_size,
+                         max_concurrent_streams,
+                         observer)
         self._transport = transport
 
     def _current_transport(self) -> Awaitable[Transport]:
@@ -49,4 +100,172 @@ class RSocketServer(RSocketBase):
         return 2
 
     def is_server_alive(self) -> bool:
-        return True
+        return self._transport is not None
+
+    async def handle_setup(self, frame: SetupFrame):
+        self._client_max_lifetime = frame.max_lifetime_milliseconds / 1000
+        self._start_keepalive_check()
+        await super().handle_setup(frame)
+
+    def _update_last_keepalive(self):
+        self._last_keepalive = asyncio.get_event_loop().time()
+
+    def _start_keepalive_check(self):
+        self._update_last_keepalive()
+
+        if self._client_max_lifetime and self._keepalive_check_timer is None:
+            self._schedule_keepalive_check(self._last_keepalive + self._client_max_lifetime)
+
+    def _schedule_keepalive_check(self, deadline: float):
+        self._keepalive_check_timer = timer_wheel().call_at(deadline, self._check_keepalive)
+
+    def _cancel_keepalive_check(self):
+        if self._keepalive_check_timer is not None:
+            self._keepalive_check_timer.cancel()
+            self._keepalive_check_timer = None
+
+    def _check_keepalive(self):
+        self._keepalive_check_timer = None
+
+        if self._is_closing or self._transport is None or self._is_waiting_for_resume():
+            return
+
+        now = asyncio.get_event_loop().time()
+        deadline = self._last_keepalive + self._client_max_lifetime
+
+        if now < deadline:
+            self._schedule_keepalive_check(deadline)
+        elif self._is_handling_frame:
+            self._schedule_keepalive_check(now + self._client_max_lifetime)
+        else:
+            self._keepalive_timeout_task = asyncio.create_task(
+                self._on_keepalive_timeout(timedelta(seconds=now - self._last_keepalive)))
+
+    async def _on_keepalive_timeout(self, time_since_last_keepalive: timedelta):
+        logger().warning('%s: No keepalive received for %s, closing connection', self._log_identifier(),
+                         time_since_last_keepalive)
+
+        try:
+            await self._handler.on_keepalive_timeout(time_since_last_keepalive, self)
+        except Exception:
+            logger().error('%s: Keepalive timeout handler error', self._log_identifier(), exc_info=True)
+
+        if self._resume_buffer is not None:
+            await cancel_if_task_exists(self._receiver_task)
+            await cancel_if_task_exists(self._sender_task)
+            await self._close_transport()
+            self._start_session_expiry()
+        else:
+            self.stop_all_streams(ErrorCode.CONNECTION_ERROR, b'Keepalive timeout')
+            await self.close()
+
+    def _is_waiting_for_resume(self) -> bool:
+        return self._expiry_task is not None and not self._expiry_task.done()
+
+    def _setup_resumable_session(self, resume_token: bytes):
+        if self._resume_sessions is None:
+            super()._setup_resumable_session(resume_token)
+
+        if self._resume_sessions.get(resume_token) is not None:
+            raise RSocketProtocolError(ErrorCode.REJECTED_SETUP, data='Resume token in use')
+
+        self._resume_token = resume_token
+        self._resume_buffer = ResumeBuffer(self._resume_buffer_size)
+        self._resume_sessions.add(resume_token, self)
+
+    def _end_resumable_session(self, error_code: ErrorCode, data: bytes):
+        self._forget_resumable_session()
+        super()._end_resumable_session(error_code, data)
+
+    def _forget_resumable_session(self):
+        if self._resume_token is not None:
+            self._resume_sessions.remove(self._resume_token, self)
+            self._resume_token = None
+
+    async def handle_resume(self, frame: ResumeFrame):
+        if self._resume_sessions is None:
+            return await super().handle_resume(frame)
+
+        session = self._resume_sessions.get(frame.resume_identification_token)
+
+        if session is None:
+            raise RSocketProtocolError(ErrorCode.REJECTED_RESUME, data='Unknown resume token')
+
+        session._check_resume_positions(frame)
+
+        transport, self._transport = self._transport, None
+        await cancel_if_task_exists(self._sender_task)
+        await session._resume_session(transport, frame)
+
+    def _check_resume_positions(self, frame: ResumeFrame):
+        if frame.first_client_position > self._received_position:
+            raise RSocketProtocolError(ErrorCode.REJECTED_RESUME, data='Client frames not available')
+
+        if self._resume_buffer.frames_from(frame.last_server_position) is None:
+            raise RSocketProtocolError(ErrorCode.REJECTED_RESUME, data='Server frames not available')
+
+    async def _resume_session(self, transport: Transport, frame: ResumeFrame):
+        logger().debug('%s: resuming session', self._log_identifier())
+
+        await cancel_if_task_exists(self._receiver_task)
+        await cancel_if_task_exists(self._sender_task)
+        await cancel_if_task_exists(self._expiry_task)
+        await self._close_transport()
+
+        self._transport = transport
+        frames = self._resume_buffer.frames_from(frame.last_server_position)
+
+        if frames is None:
+            exception = RSocketProtocolError(ErrorCode.REJECTED_RESUME, data='Server frames not available')
+            await transport.send_frame(exception_to_error_frame(CONNECTION_STREAM_ID, exception))
+            self._end_resumable_session(ErrorCode.CONNECTION_ERROR, b'Connection error')
+            return
+
+        resume_ok = to_resume_ok_frame(self._received_position)
+        await transport.send_frame(resume_ok)
+        self._tap_frame(resume_ok, 'Sent')
+
+        await self._send_replayed_frames(transport, frames)
+        self._start_tasks()
+        self._start_keepalive_check()
+
+    async def _receiver_listen(self):
+        try:
+            await super()._receiver_listen()
+        finally:
+            self._cancel_keepalive_check()
+            self._start_session_expiry()
+
+    async def _on_connection_lost(self, exception: Exception):
+        if self._resume_buffer is not None:
+            logger().debug('%s: Connection lost, waiting for the session to be resumed', self._log_identifier(),
+                           exc_info=exception)
+            self._start_session_expiry()
+            return
+
+        await super()._on_connection_lost(exception)
+
+    def _start_session_expiry(self):
+        if (self._resume_buffer is not None
+                and not self._is_closing
+                and (self._expiry_task is None or self._expiry_task.done())):
+            self._expiry_task = asyncio.create_task(self._expire_session())
+
+    async def _expire_session(self):
+        try:
+            await asyncio.sleep(self._resume_sessions.session_timeout.total_seconds())
+            logger().debug('%s: Resumable session expired', self._log_identifier())
+            self._expiry_task = None
+            self._end_resumable_session(ErrorCode.CONNECTION_ERROR, b'Connection error')
+            await self._handler.on_connection_lost(self, RSocketTransportError('Resumable session expired'))
+        except asyncio.CancelledError:
+            logger().debug('%s: Asyncio task canceled: expire_session', self._log_identifier())
+
+    async def close(self):
+        self._cancel_keepalive_check()
+        await super().close()
+        await cancel_if_task_exists(self._expiry_task)
+
+        if self._keepalive_timeout_task is not asyncio.current_task():
+            await cancel_if_task_exists(self._keepalive_timeout_task)
+        self._forget_resumable_session()
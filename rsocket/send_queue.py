@@ -0,0 +1,285 @@
+import asyncio
+from collections import deque
+from typing import Set, Callable, List, Optional, Dict
+
+from rsocket.exceptions import RSocketValueError
+from rsocket.frame import (Frame, CONNECTION_STREAM_ID, MetadataPushFrame, RequestNFrame, CancelFrame, PayloadFrame,
+                           initiate_request_frame_types, frame_payload_length, is_fragmentable_frame, HEADER_LENGTH)
+
+__all__ = ['SendQueue', 'SEND_QUEUE_HIGH_WATERMARK', 'SEND_QUEUE_LOW_WATERMARK']
+
+SEND_QUEUE_HIGH_WATERMARK = 1024 * 1024
+SEND_QUEUE_LOW_WATERMARK = 256 * 1024
+
+CONNECTION_LANE = 0
+CONTROL_LANE = 1
+PAYLOAD_LANE = 2
+
+
+class _StreamFragments:
+    """Frames of a stream which are sent in fragments, in order."""
+
+    __slots__ = (
+        'stream_id',
+        'frames',
+        'frame',
+        'metadata',
+        'data',
+        'flags_complete',
+        'flags_follows',
+        'sent_future'
+    )
+
+    def __init__(self, stream_id: int):
+        self.stream_id = stream_id
+        self.frames = deque()
+        self.frame: Optional[Frame] = None
+        self.metadata = None
+        self.data = None
+        self.flags_complete = False
+        self.flags_follows = False
+        self.sent_future = None
+
+
+class SendQueue:
+    """
+    Outbound frame queue with three lanes, each FIFO:
+
+    - connection frames (SETUP, KEEPALIVE, LEASE, ERROR etc. on stream 0)
+    - stream control frames (REQUEST_N, CANCEL)
+    - everything else (requests, payloads, stream errors, metadata push)
+
+    Frames are taken from the highest priority lane which is not empty. A control frame for a stream whose
+    request frame has not been taken from the queue yet stays behind it in the payload lane.
+
+    The queue itself is not bounded, frames are never rejected. Once the size of the queued frames goes above
+    high_watermark the queue is reported as not writable, until it is drained down to low_watermark. Producers are
+    expected to hold back (see wait_writable and add_writable_callback) while the queue is not writable.
+
+    If fragment_size is set, fragmentable frames whose data and metadata exceed it are taken from the payload lane one
+    fragment at a time. The rest of the frame (and any later frame of the same stream) goes back to the end of the
+    lane, so large frames are interleaved with the frames of other streams.
+    """
+
+    __slots__ = (
+        '_lanes',
+        '_pending_request_streams',
+        '_size',
+        '_not_empty',
+        '_high_watermark',
+        '_low_watermark',
+        '_queued_bytes',
+        '_writable',
+        '_writable_callbacks',
+        '_fragment_size',
+        '_fragments_by_stream_id'
+    )
+
+    def __init__(self,
+                 high_watermark: int = SEND_QUEUE_HIGH_WATERMARK,
+                 low_watermark: int = SEND_QUEUE_LOW_WATERMARK,
+                 fragment_size: Optional[int] = None):
+        if low_watermark > high_watermark:
+            raise RSocketValueError('Send queue low watermark must not exceed the high watermark')
+
+        if fragment_size is not None and fragment_size <= 0:
+            raise RSocketValueError('Fragment size must be positive')
+
+        self._lanes = (deque(), deque(), deque())
+        self._pending_request_streams: Set[int] = set()
+        self._size = 0
+        self._not_empty = asyncio.Event()
+        self._high_watermark = high_watermark
+        self._low_watermark = low_watermark
+        self._queued_bytes = 0
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._writable_callbacks: List[Callable[[], None]] = []
+        self._fragment_size = fragment_size
+        self._fragments_by_stream_id: Dict[int, _StreamFragments] = {}
+
+    def put_nowait(self, frame: Frame):
+        self._lanes[self._lane_of(frame)].append(frame)
+        self._on_put(frame)
+
+    def put_first_nowait(self, frame: Frame):
+        self._lanes[CONNECTION_LANE].appendleft(frame)
+        self._on_put(frame)
+
+    def _on_put(self, frame: Frame):
+        self._size += 1
+        self._queued_bytes += frame_payload_length(frame)
+        self._not_empty.set()
+
+        if self._queued_bytes > self._high_watermark and self._writable.is_set():
+            self._writable.clear()
+
+    def _lane_of(self, frame: Frame) -> int:
+        stream_id = frame.stream_id
+
+        if stream_id == CONNECTION_STREAM_ID:
+            if isinstance(frame, MetadataPushFrame):
+                return PAYLOAD_LANE
+
+            return CONNECTION_LANE
+
+        if isinstance(frame, (RequestNFrame, CancelFrame)):
+            if stream_id in self._pending_request_streams:
+                return PAYLOAD_LANE
+
+            return CONTROL_LANE
+
+        if isinstance(frame, initiate_request_frame_types):
+            self._pending_request_streams.add(stream_id)
+
+        return PAYLOAD_LANE
+
+    async def get(self) -> Frame:
+        while self._size == 0:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        return self.get_nowait()
+
+    def get_nowait(self) -> Frame:
+        for lane_index, lane in enumerate(self._lanes):
+            if lane:
+                if lane_index == PAYLOAD_LANE and self._fragment_size is not None:
+                    return self._next_payload_lane_frame(lane)
+
+                frame = lane.popleft()
+                self._on_get(frame, frame_payload_length(frame))
+                return frame
+
+        raise asyncio.QueueEmpty()
+
+    def _on_get(self, frame: Frame, length: int, frame_sent: bool = True):
+        self._queued_bytes -= length
+
+        if frame_sent:
+            self._size -= 1
+
+            if isinstance(frame, initiate_request_frame_types):
+                self._pending_request_streams.discard(frame.stream_id)
+
+        if self._queued_bytes <= self._low_watermark and not self._writable.is_set():
+            self._on_writable()
+
+    def _next_payload_lane_frame(self, lane: deque) -> Frame:
+        while True:
+            entry = lane.popleft()
+
+            if isinstance(entry, _StreamFragments):
+                fragments = entry
+            else:
+                fragments = self._fragments_by_stream_id.get(entry.stream_id)
+
+                if fragments is not None:
+                    fragments.frames.append(entry)
+                    continue
+
+                if not self._should_fragment(entry):
+                    self._on_get(entry, frame_payload_length(entry))
+                    return entry
+
+                fragments = _StreamFragments(entry.stream_id)
+                fragments.frames.append(entry)
+                self._fragments_by_stream_id[entry.stream_id] = fragments
+
+            frame = self._next_fragment(fragments)
+
+            if fragments.frame is not None or fragments.frames:
+                lane.append(fragments)
+            else:
+                del self._fragments_by_stream_id[fragments.stream_id]
+
+            return frame
+
+    def _should_fragment(self, frame: Frame) -> bool:
+        return (is_fragmentable_frame(frame)
+                and frame_payload_length(frame) - HEADER_LENGTH > self._fragment_size)
+
+    def _next_fragment(self, fragments: _StreamFragments) -> Frame:
+        frame = fragments.frame
+
+        if frame is None:
+            frame = fragments.frames.popleft()
+
+            if not self._should_fragment(frame):
+                self._on_get(frame, frame_payload_length(frame))
+                return frame
+
+            fragments.frame = frame
+            fragments.metadata = memoryview(frame.metadata or b'')
+            fragments.data = memoryview(frame.data or b'')
+            fragments.flags_complete = frame.flags_complete
+            fragments.flags_follows = frame.flags_follows
+            fragments.sent_future = frame.sent_future
+            frame.sent_future = None
+            fragment = frame
+
+            if isinstance(frame, PayloadFrame):
+                frame.flags_complete = False
+        else:
+            fragment = PayloadFrame()
+            fragment.stream_id = frame.stream_id
+
+            if isinstance(frame, PayloadFrame):
+                fragment.flags_next = frame.flags_next
+            else:
+                fragment.flags_next = True
+
+        metadata = fragments.metadata[:self._fragment_size]
+        data = fragments.data[:self._fragment_size - len(metadata)]
+        fragments.metadata = fragments.metadata[len(metadata):]
+        fragments.data = fragments.data[len(data):]
+        fragment.metadata = metadata
+        fragment.data = data
+        length = len(metadata) + len(data)
+
+        if fragments.metadata or fragments.data:
+            fragment.flags_follows = True
+            self._on_get(frame, length, frame_sent=False)
+        else:
+            fragment.flags_follows = fragments.flags_follows
+
+            if isinstance(frame, PayloadFrame):
+                fragment.flags_complete = fragments.flags_complete
+
+            fragment.sent_future = fragments.sent_future
+            fragments.frame = fragments.metadata = fragments.data = fragments.sent_future = None
+            self._on_get(frame, length + HEADER_LENGTH)
+
+        return fragment
+
+    def _on_writable(self):
+        self._writable.set()
+
+        callbacks, self._writable_callbacks = self._writable_callbacks, []
+        loop = asyncio.get_event_loop()
+
+        for callback in callbacks:
+            loop.call_soon(callback)
+
+    def is_writable(self) -> bool:
+        return self._writable.is_set()
+
+    async def wait_writable(self):
+        await self._writable.wait()
+
+    def add_writable_callback(self, callback: Callable[[], None]):
+        """Call callback (once) as soon as the queue is writable."""
+
+        if self.is_writable():
+            asyncio.get_event_loop().call_soon(callback)
+        else:
+            self._writable_callbacks.append(callback)
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def qsize(self) -> int:
+        return self._size
+
+    def queued_bytes(self) -> int:
+        return self._queued_bytes
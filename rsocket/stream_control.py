@@ -1,39 +1,55 @@
-from typing import Dict
+from typing import Dict, Optional
 
 from rsocket.error_codes import ErrorCode
 from rsocket.exceptions import RSocketStreamAllocationFailure, RSocketStreamIdInUse
 from rsocket.frame import CONNECTION_STREAM_ID, Frame, ErrorFrame
+from rsocket.observer import RSocketObserver
 from rsocket.streams.stream_handler import StreamHandler
 
 MAX_STREAM_ID = 0x7FFFFFFF
 
 
 class StreamControl:
-    def __init__(self, first_stream_id: int):
+    """
+    Allocates stream ids by incrementing a counter which wraps around at the maximum stream id, skipping ids still in
+    use. The counter passes each id in use at most once per wraparound, so allocation is O(1) amortized unless nearly
+    all the ids are in use. Exhaustion is detected without probing, by counting the locally allocated streams.
+    """
+
+    def __init__(self, first_stream_id: int, observer: Optional[RSocketObserver] = None):
         self._first_stream_id = first_stream_id
+        self._observer = observer
         self._current_stream_id = self._first_stream_id
         self._streams: Dict[int, StreamHandler] = {}
         self._maximum_stream_id = MAX_STREAM_ID
+        self._local_stream_count = 0
 
     def allocate_stream(self) -> int:
-        attempt_counter = 0
+        if self._local_stream_count >= self._local_stream_id_count():
+            raise RSocketStreamAllocationFailure()
 
         while (self._current_stream_id == CONNECTION_STREAM_ID
                or self._current_stream_id in self._streams):
-
-            if attempt_counter > self._maximum_stream_id / 2:
-                raise RSocketStreamAllocationFailure()
-
             self._increment_stream_id()
-            attempt_counter += 1
 
         return self._current_stream_id
 
+    def _local_stream_id_count(self) -> int:
+        return (self._maximum_stream_id + (self._first_stream_id & 1)) // 2
+
+    def _is_local_stream_id(self, stream_id: int) -> bool:
+        return (stream_id & 1) == (self._first_stream_id & 1)
+
     def _increment_stream_id(self):
         self._current_stream_id = (self._current_stream_id + 2) & self._maximum_stream_id
 
     def finish_stream(self, stream_id: int):
-        self._streams.pop(stream_id, None)
+        if self._streams.pop(stream_id, None) is not None:
+            if self._is_local_stream_id(stream_id):
+                self._local_stream_count -= 1
+
+            if self._observer is not None:
+                self._observer.stream_finished()
 
     def register_stream(self, stream_id: int, handler: StreamHandler):
         if stream_id == CONNECTION_STREAM_ID:
@@ -42,6 +58,13 @@ class StreamControl:
         if stream_id > self._maximum_stream_id:
             raise RuntimeError('Stream id larger then maximum allowed')
 
+        if stream_id not in self._streams:
+            if self._is_local_stream_id(stream_id):
+                self._local_stream_count += 1
+
+            if self._observer is not None:
+                self._observer.stream_started()
+
         self._streams[stream_id] = handler
 
     def handle_stream(self, stream_id: int, frame: Frame) -> bool:
@@ -51,15 +74,21 @@ class StreamControl:
 
         return False
 
-    def stop_all_streams(self, error_code=ErrorCode.CANCELED, data=b''):
-        for stream_id, stream in list(self._streams.items()):
+    def stop_stream(self, stream_id: int, error_code=ErrorCode.CANCELED, data=b''):
+        stream = self._streams.get(stream_id)
+
+        if stream is not None:
             frame = ErrorFrame()
             frame.stream_id = stream_id
             frame.error_code = error_code
             frame.data = data
-            stream.frame_received(frame)
+            stream.stopped_locally(frame)
             self.finish_stream(stream_id)
 
+    def stop_all_streams(self, error_code=ErrorCode.CANCELED, data=b''):
+        for stream_id in list(self._streams):
+            self.stop_stream(stream_id, error_code, data)
+
     def assert_stream_id_available(self, stream_id: int):
         if stream_id in self._streams:
             raise RSocketStreamIdInUse(stream_id)
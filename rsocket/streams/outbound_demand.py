@@ -0,0 +1,88 @@
+from reactivestreams.subscription import Subscription
+from rsocket.frame import MAX_REQUEST_N
+
+__all__ = ['OutboundDemand']
+
+MAX_OUTSTANDING_DEMAND = 256
+
+
+class OutboundDemand(Subscription):
+    """
+    Wraps the subscription to a local publisher whose items are sent to the peer. Demand requested by the peer
+    is forwarded in chunks of at most max_outstanding items, and only while the socket's send queue is writable.
+    The rest is held back until enough items were sent and the send queue drained below its low watermark.
+    Demand reaching MAX_REQUEST_N is unbounded, and is never used up.
+    """
+
+    __slots__ = (
+        '_socket',
+        '_subscription',
+        '_max_outstanding',
+        '_requested',
+        '_outstanding',
+        '_is_replenishing',
+        '_is_waiting_writable',
+        '_is_cancelled'
+    )
+
+    def __init__(self, socket, subscription: Subscription, max_outstanding: int = MAX_OUTSTANDING_DEMAND):
+        self._socket = socket
+        self._subscription = subscription
+        self._max_outstanding = max_outstanding
+        self._requested = 0
+        self._outstanding = 0
+        self._is_replenishing = False
+        self._is_waiting_writable = False
+        self._is_cancelled = False
+
+    def request(self, n: int):
+        self._requested = min(self._requested + n, MAX_REQUEST_N)
+        self._replenish()
+
+    def cancel(self):
+        self._is_cancelled = True
+        self._subscription.cancel()
+
+    def item_sent(self):
+        if self._outstanding > 0:
+            self._outstanding -= 1
+
+        self._replenish()
+
+    def _replenish(self):
+        if self._is_replenishing:
+            return
+
+        self._is_replenishing = True
+
+        try:
+            while True:
+                n = self._next_request_n()
+
+                if n == 0:
+                    return
+
+                if self._requested != MAX_REQUEST_N:
+                    self._requested -= n
+
+                self._outstanding += n
+                self._subscription.request(n)
+        finally:
+            self._is_replenishing = False
+
+    def _next_request_n(self) -> int:
+        if self._is_cancelled or self._requested == 0 or self._outstanding > self._max_outstanding // 2:
+            return 0
+
+        if not self._socket.is_send_queue_writable():
+            if not self._is_waiting_writable:
+                self._is_waiting_writable = True
+                self._socket.call_when_send_queue_writable(self._on_writable)
+
+            return 0
+
+        return min(self._requested, self._max_outstanding - self._outstanding)
+
+    def _on_writable(self):
+        self._is_waiting_writable = False
+        self._replenish()
@@ -2,7 +2,7 @@ from abc import abstractmethod, ABCMeta
 from typing import Optional
 
 from rsocket.exceptions import RSocketValueError
-from rsocket.frame import Frame, MAX_REQUEST_N
+from rsocket.frame import Frame, MAX_REQUEST_N, ErrorFrame
 from rsocket.frame_builders import to_cancel_frame, to_request_n_frame
 from rsocket.logger import logger
 from rsocket.streams.backpressureapi import BackpressureApi
@@ -34,6 +34,11 @@ class StreamHandler(BackpressureApi, metaclass=ABCMeta):
     def frame_received(self, frame: Frame):
         ...
 
+    def stopped_locally(self, frame: ErrorFrame):
+        """Called when this side terminates the stream (e.g. on connection loss). Handled as a received ERROR by default."""
+
+        self.frame_received(frame)
+
     def send_cancel(self):
         """Convenience method for use by requester subclasses."""
         logger().debug('Sending cancel')
@@ -0,0 +1,142 @@
+import asyncio
+import math
+from asyncio import AbstractEventLoop
+from typing import Callable, List, Optional
+from weakref import WeakKeyDictionary
+
+from rsocket.logger import logger
+
+__all__ = ['TimerWheel', 'TimerHandle', 'timer_wheel']
+
+DEFAULT_TICK = 0.05
+DEFAULT_SLOT_COUNT = 1024
+
+
+class TimerHandle:
+    """
+    A timer scheduled on a TimerWheel. Cancelling it releases its callback immediately (so that the callback's owner
+    is not kept alive until the deadline), and the wheel drops it when its slot is next visited.
+    """
+
+    __slots__ = (
+        '_wheel',
+        '_tick',
+        '_callback'
+    )
+
+    def __init__(self, wheel: 'TimerWheel', tick: int, callback: Callable[[], None]):
+        self._wheel = wheel
+        self._tick = tick
+        self._callback: Optional[Callable[[], None]] = callback
+
+    def cancel(self):
+        if self._callback is not None:
+            self._callback = None
+            self._wheel._timer_cancelled()
+
+    def cancelled(self) -> bool:
+        """True once the timer was cancelled or called."""
+
+        return self._callback is None
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel: a timer is appended to the slot of the tick its deadline falls in (rounded up), and a single
+    event loop callback per tick calls the timers which are due, in one batch. Timers further away than one rotation
+    of the wheel stay in their slot until their tick. Deadlines are in event loop time (loop.time()).
+
+    The loop callback is only scheduled while there are pending (not cancelled) timers.
+    """
+
+    __slots__ = (
+        '_tick',
+        '_slots',
+        '_current_tick',
+        '_timer_count',
+        '_handle'
+    )
+
+    def __init__(self, tick: float = DEFAULT_TICK, slot_count: int = DEFAULT_SLOT_COUNT):
+        self._tick = tick
+        self._slots: List[List[TimerHandle]] = [[] for _ in range(slot_count)]
+        self._current_tick = 0
+        self._timer_count = 0
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    def call_at(self, deadline: float, callback: Callable[[], None]) -> TimerHandle:
+        if self._timer_count == 0:
+            self._current_tick = int(asyncio.get_event_loop().time() / self._tick)
+
+        tick = max(math.ceil(deadline / self._tick), self._current_tick + 1)
+        timer = TimerHandle(self, tick, callback)
+        self._slots[tick % len(self._slots)].append(timer)
+        self._timer_count += 1
+
+        if self._handle is None:
+            self._schedule_next_tick()
+
+        return timer
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        return self.call_at(asyncio.get_event_loop().time() + delay, callback)
+
+    def __len__(self) -> int:
+        return self._timer_count
+
+    def _timer_cancelled(self):
+        self._timer_count -= 1
+
+        if self._timer_count == 0 and self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _schedule_next_tick(self):
+        self._handle = asyncio.get_event_loop().call_at((self._current_tick + 1) * self._tick, self._advance)
+
+    def _advance(self):
+        self._handle = None
+        now_tick = max(int(asyncio.get_event_loop().time() / self._tick), self._current_tick + 1)
+        slot_count = len(self._slots)
+        due: List[Callable[[], None]] = []
+
+        for tick in range(self._current_tick + 1, min(now_tick, self._current_tick + slot_count) + 1):
+            slot = self._slots[tick % slot_count]
+
+            if slot:
+                remaining = [timer for timer in slot if timer._tick > now_tick and timer._callback is not None]
+
+                if len(remaining) < len(slot):
+                    for timer in slot:
+                        if timer._tick <= now_tick and timer._callback is not None:
+                            due.append(timer._callback)
+                            timer._callback = None
+
+                    self._slots[tick % slot_count] = remaining
+
+        self._current_tick = now_tick
+        self._timer_count -= len(due)
+
+        for callback in due:
+            try:
+                callback()
+            except Exception:
+                logger().error('Timer callback error', exc_info=True)
+
+        if self._timer_count > 0 and self._handle is None:
+            self._schedule_next_tick()
+
+
+_timer_wheel_by_loop: 'WeakKeyDictionary[AbstractEventLoop, TimerWheel]' = WeakKeyDictionary()
+
+
+def timer_wheel() -> TimerWheel:
+    """The timer wheel shared by all the connections of the current event loop."""
+
+    loop = asyncio.get_event_loop()
+    wheel = _timer_wheel_by_loop.get(loop)
+
+    if wheel is None:
+        wheel = _timer_wheel_by_loop[loop] = TimerWheel()
+
+    return wheel
@@ -5,8 +5,8 @@ from rsocket.transports.transport import Transport
 
 
 class AbstractMessagingTransport(Transport, metaclass=abc.ABCMeta):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, zero_copy: bool = False):
+        super().__init__(zero_copy)
         self._incoming_frame_queue = asyncio.Queue()
 
     async def next_frame_generator(self):
@@ -38,8 +38,8 @@ def websocket_handler_factory(on_server_create=None, **kwargs):
 
 class TransportAioHttpClient(AbstractMessagingTransport):
 
-    def __init__(self, url):
-        super().__init__()
+    def __init__(self, url, zero_copy: bool = False):
+        super().__init__(zero_copy)
         self._url = url
         self._session = None
         self._ws_context = None
@@ -79,8 +79,8 @@ class TransportAioHttpClient(AbstractMessagingTransport):
 
 
 class TransportAioHttpWebsocket(AbstractMessagingTransport):
-    def __init__(self, websocket):
-        super().__init__()
+    def __init__(self, websocket, zero_copy: bool = False):
+        super().__init__(zero_copy)
         self._ws = websocket
 
     async def _message_generator(self):
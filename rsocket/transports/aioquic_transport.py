@@ -80,8 +80,8 @@ class RSocketQuicProtocol(QuicConnectionProtocol):
 
 
 class RSocketQuicTransport(AbstractMessagingTransport):
-    def __init__(self, quic_protocol: RSocketQuicProtocol):
-        super().__init__()
+    def __init__(self, quic_protocol: RSocketQuicProtocol, zero_copy: bool = False):
+        super().__init__(zero_copy)
         self._quic_protocol = quic_protocol
         self._incoming_bytes_queue = quic_protocol.frame_queue
         self._listener = asyncio.create_task(self.incoming_data_listener())
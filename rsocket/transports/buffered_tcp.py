@@ -0,0 +1,162 @@
+import asyncio
+from collections import deque
+from typing import Optional, Callable, Any, List
+
+from rsocket.exceptions import RSocketTransportError
+from rsocket.frame import Frame, serialize_frames_segments
+from rsocket.helpers import wrap_transport_exception, create_future
+from rsocket.transports.transport import Transport
+
+MIN_READ_SIZE = 4 * 1024
+MAX_READ_SIZE = 1024 * 1024
+MAX_PENDING_FRAMES = 10000
+
+
+async def open_buffered_tcp_connection(host: str,
+                                       port: int,
+                                       zero_copy: bool = False,
+                                       **kwargs) -> 'TransportBufferedTCP':
+    loop = asyncio.get_running_loop()
+    _, transport = await loop.create_connection(lambda: TransportBufferedTCP(zero_copy), host, port, **kwargs)
+    return transport
+
+
+async def start_buffered_tcp_server(on_connection: Callable[['TransportBufferedTCP'], Any],
+                                    host: str,
+                                    port: int,
+                                    zero_copy: bool = False,
+                                    **kwargs) -> asyncio.AbstractServer:
+    def protocol_factory():
+        transport = TransportBufferedTCP(zero_copy)
+        on_connection(transport)
+        return transport
+
+    loop = asyncio.get_running_loop()
+    return await loop.create_server(protocol_factory, host, port, **kwargs)
+
+
+class TransportBufferedTCP(Transport, asyncio.BufferedProtocol):
+    """
+    TCP transport implemented as an asyncio.BufferedProtocol. Incoming data is read directly into the frame
+    parser's buffer, and frames are parsed as soon as they are received. The read size grows while reads fill the
+    offered buffer, and shrinks back when they do not.
+    """
+
+    def __init__(self,
+                 zero_copy: bool = False,
+                 min_read_size: int = MIN_READ_SIZE,
+                 max_read_size: int = MAX_READ_SIZE,
+                 max_pending_frames: int = MAX_PENDING_FRAMES):
+        super().__init__(zero_copy)
+        self._min_read_size = min_read_size
+        self._max_read_size = max_read_size
+        self._max_pending_frames = max_pending_frames
+        self._read_size = min_read_size
+        self._transport: Optional[asyncio.Transport] = None
+        self._connection_made = asyncio.Event()
+        self._received_frames = deque()
+        self._frames_received = asyncio.Event()
+        self._is_reading_paused = False
+        self._can_write = asyncio.Event()
+        self._can_write.set()
+        self._is_disconnected = False
+        self._disconnect_exception: Optional[Exception] = None
+        self._closed = create_future()
+
+    def connection_made(self, transport: asyncio.Transport):
+        self._transport = transport
+        self._connection_made.set()
+
+    def get_buffer(self, size_hint: int) -> memoryview:
+        return self._frame_parser.get_buffer(self._read_size)
+
+    def buffer_updated(self, byte_count: int):
+        self._adjust_read_size(byte_count)
+        self._received_frames.extend(self._frame_parser.buffer_updated(byte_count))
+
+        if self._received_frames:
+            self._frames_received.set()
+
+            if len(self._received_frames) >= self._max_pending_frames and not self._is_reading_paused:
+                self._is_reading_paused = True
+                self._transport.pause_reading()
+
+    def _adjust_read_size(self, byte_count: int):
+        if byte_count >= self._read_size:
+            self._read_size = min(self._read_size * 2, self._max_read_size)
+        elif byte_count < self._read_size // 4:
+            self._read_size = max(self._read_size // 2, self._min_read_size)
+
+    def eof_received(self) -> bool:
+        self._on_disconnect()
+        return False
+
+    def connection_lost(self, exception: Optional[Exception]):
+        self._on_disconnect(exception)
+        self._can_write.set()
+
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def _on_disconnect(self, exception: Optional[Exception] = None):
+        if not self._is_disconnected:
+            self._is_disconnected = True
+            self._disconnect_exception = exception
+
+        self._frames_received.set()
+
+    def pause_writing(self):
+        self._can_write.clear()
+
+    def resume_writing(self):
+        self._can_write.set()
+
+    async def send_frame(self, frame: Frame):
+        await self.send_frames([frame])
+
+    async def send_frames(self, frames: List[Frame]):
+        if self._transport is None:
+            await self._connection_made.wait()
+
+        if self._is_disconnected:
+            raise RSocketTransportError() from self._disconnect_exception
+
+        with wrap_transport_exception():
+            self._transport.writelines(serialize_frames_segments(frames))
+
+    async def on_send_queue_empty(self):
+        await self._can_write.wait()
+
+        if self._is_disconnected:
+            raise RSocketTransportError() from self._disconnect_exception
+
+    async def next_frame_generator(self):
+        while not self._received_frames:
+            if self._is_disconnected:
+                if self._disconnect_exception is not None:
+                    raise RSocketTransportError() from self._disconnect_exception
+
+                return
+
+            self._frames_received.clear()
+            await self._frames_received.wait()
+
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Frame:
+        if not self._received_frames:
+            if self._is_reading_paused:
+                self._is_reading_paused = False
+                self._transport.resume_reading()
+
+            raise StopAsyncIteration()
+
+        return self._received_frames.popleft()
+
+    async def close(self):
+        if self._transport is not None:
+            self._transport.close()
+            await self._closed
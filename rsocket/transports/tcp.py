@@ -1,19 +1,29 @@
 from asyncio import StreamReader, StreamWriter
+from typing import List
 
-from rsocket.frame import Frame, serialize_with_frame_size_header
+from rsocket.frame import Frame, serialize_segments_with_frame_size_header, serialize_frames_segments
 from rsocket.helpers import wrap_transport_exception
 from rsocket.transports.transport import Transport
 
 
 class TransportTCP(Transport):
-    def __init__(self, reader: StreamReader, writer: StreamWriter):
-        super().__init__()
+    def __init__(self,
+                 reader: StreamReader,
+                 writer: StreamWriter,
+                 zero_copy: bool = False,
+                 read_buffer_size: int = 64 * 1024):
+        super().__init__(zero_copy)
         self._writer = writer
         self._reader = reader
+        self._read_buffer_size = read_buffer_size
 
     async def send_frame(self, frame: Frame):
         with wrap_transport_exception():
-            self._writer.write(serialize_with_frame_size_header(frame))
+            self._writer.writelines(serialize_segments_with_frame_size_header(frame))
+
+    async def send_frames(self, frames: List[Frame]):
+        with wrap_transport_exception():
+            self._writer.writelines(serialize_frames_segments(frames))
 
     async def on_send_queue_empty(self):
         with wrap_transport_exception():
@@ -25,7 +35,7 @@ class TransportTCP(Transport):
 
     async def next_frame_generator(self):
         with wrap_transport_exception():
-            data = await self._reader.read(1024)
+            data = await self._reader.read(self._read_buffer_size)
 
             if not data:
                 self._writer.close()
@@ -1,4 +1,5 @@
 import abc
+from typing import List
 
 from rsocket.frame import Frame
 from rsocket.frame_parser import FrameParser
@@ -6,8 +7,8 @@ from rsocket.frame_parser import FrameParser
 
 class Transport(metaclass=abc.ABCMeta):
 
-    def __init__(self):
-        self._frame_parser = FrameParser()
+    def __init__(self, zero_copy: bool = False):
+        self._frame_parser = FrameParser(zero_copy)
 
     async def connect(self):
         """"Optional if required"""
@@ -16,6 +17,10 @@ class Transport(metaclass=abc.ABCMeta):
     async def send_frame(self, frame: Frame):
         ...
 
+    async def send_frames(self, frames: List[Frame]):
+        for frame in frames:
+            await self.send_frame(frame)
+
     @abc.abstractmethod
     async def next_frame_generator(self):
         ...